@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+"""
+Concurrent submission benchmark.
+
+Runs N workflows at once against a fixed-latency stub model and compares the
+wall-clock time with a single run. With non-blocking agent execution the
+ratio should stay close to 1.0; a blocking call path scales linearly with N.
+
+Usage:
+    python benchmarks/concurrent_submissions.py --concurrency 8 --latency 0.5
+"""
+
+import argparse
+import asyncio
+import time
+
+from backend.agents.schemas import PersonalInfo, ProjectInfo
+from backend.agents.stub import install_stub_llm
+from backend.agents.workflow import run_workflow_async
+
+
+PERSONAL_INFO = PersonalInfo(
+    gender="여성",
+    age=32,
+    mbti="ENFJ",
+    previous_job="마케터",
+    self_employed_experience=True,
+)
+PROJECT_INFO = ProjectInfo(
+    food_sector="카페",
+    region="강남구",
+    capital="30,000,000원",
+)
+
+_run_counter = 0
+
+
+def _unique_inputs() -> tuple[PersonalInfo, ProjectInfo]:
+    """Return inputs no earlier run has used, so caches and coalescing never kick in."""
+    global _run_counter
+    _run_counter += 1
+    return (
+        PERSONAL_INFO.model_copy(update={"age": 20 + _run_counter}),
+        PROJECT_INFO.model_copy(update={"region": f"테스트{_run_counter}구"}),
+    )
+
+
+async def _timed(concurrency: int) -> float:
+    inputs = [_unique_inputs() for _ in range(concurrency)]
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(run_workflow_async(personal, project) for personal, project in inputs)
+    )
+    return time.perf_counter() - start
+
+
+async def main(concurrency: int, latency: float) -> None:
+    install_stub_llm(distribution="fixed", latency=latency)
+    single = await _timed(1)
+    many = await _timed(concurrency)
+    ratio = many / single
+    print(f"1 submission:  {single:.2f}s")
+    print(f"{concurrency} submissions: {many:.2f}s (ratio {ratio:.2f})")
+    # Three sequential stages -> a single run is ~3x the model latency
+    if ratio > 1.5:
+        raise SystemExit("Concurrent submissions did not overlap")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--latency", type=float, default=0.5)
+    args = parser.parse_args()
+    asyncio.run(main(args.concurrency, args.latency))
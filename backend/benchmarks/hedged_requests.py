@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+"""
+Hedged request simulation with a heavy-tailed stub model.
+
+Each roadmap call sleeps for the base latency times a Pareto-distributed
+factor, so most calls are quick and a few straggle badly. The same call
+stream is run three ways:
+
+- off:       no hedging
+- same:      hedge with a second call to the same model
+- alternate: hedge with the flash alternate agent (faster, lighter tail)
+
+and the latency percentiles plus the share of calls that fired a backup are
+reported for each.
+
+Usage:
+    python benchmarks/hedged_requests.py --calls 300 --latency 0.02
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+
+from backend.agents import workflow
+from backend.agents.agents import HEDGE_ALTERNATES, roadmap_architect_agent
+from backend.agents.hedging import Hedger
+from backend.agents.stub import install_stub_llm
+
+
+_call_counter = 0
+
+
+async def _call() -> float:
+    global _call_counter
+    _call_counter += 1
+    start = time.perf_counter()
+    # A unique query per call keeps single-flight from coalescing them
+    await workflow._run_agent_async(roadmap_architect_agent, f'{{"n":{_call_counter}}}')
+    return time.perf_counter() - start
+
+
+async def _run(calls: int, concurrency: int) -> list[float]:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def limited() -> float:
+        async with semaphore:
+            return await _call()
+
+    return await asyncio.gather(*(limited() for _ in range(calls)))
+
+
+def _report(label: str, timings: list[float], hedger: Hedger) -> None:
+    timings_ms = sorted(t * 1000 for t in timings)
+
+    def pct(p: float) -> float:
+        return timings_ms[min(int(len(timings_ms) * p), len(timings_ms) - 1)]
+
+    hedged = hedger.hedged / hedger.calls if hedger.calls else 0.0
+    print(
+        f"{label:<10} p50={statistics.median(timings_ms):7.1f}ms p95={pct(0.95):7.1f}ms "
+        f"p99={pct(0.99):7.1f}ms max={timings_ms[-1]:7.1f}ms "
+        f"hedged={hedged:5.1%} backup_wins={hedger.backup_wins}"
+    )
+
+
+async def main(calls: int, concurrency: int, latency: float, percentile: float) -> None:
+    random.seed(0)
+    install_stub_llm([roadmap_architect_agent], distribution="pareto", latency=latency, shape=1.5)
+    # The flash alternate is modelled as faster with a lighter tail
+    install_stub_llm(
+        [HEDGE_ALTERNATES[roadmap_architect_agent.name]],
+        distribution="pareto",
+        latency=latency / 2,
+        shape=2.5,
+    )
+
+    modes = [("off", frozenset(), False), ("same", None, False), ("alternate", None, True)]
+    for label, agents, use_alternates in modes:
+        hedger = Hedger(
+            agents=frozenset({roadmap_architect_agent.name}) if agents is None else agents,
+            percentile=percentile,
+        )
+        workflow.hedger = hedger
+        workflow.HEDGE_USE_ALTERNATES = use_alternates
+        # Warm-up fills the latency window so the hedge delay is calibrated
+        await _run(max(hedger.min_samples * 2, concurrency), concurrency)
+        hedger.calls = hedger.hedged = hedger.backup_wins = 0
+        _report(label, await _run(calls, concurrency), hedger)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=300)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--percentile", type=float, default=90)
+    args = parser.parse_args()
+    asyncio.run(main(args.calls, args.concurrency, args.latency, args.percentile))
@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+"""
+Local item scoring throughput.
+
+Scores and ranks batches of synthetic item candidates against a fixed
+persona and multi-dong market analysis, and reports the time per batch and
+per candidate. This is the work that replaces the LLM-generated fit scores,
+so it should stay negligible next to a single agent call even for
+candidate pools far larger than the default.
+
+Usage:
+    python benchmarks/item_scoring.py --sizes 6 60 600 6000
+"""
+
+import argparse
+import random
+import time
+
+from backend.agents.schemas import (
+    MarketAnalysisList,
+    PersonaProfile,
+    RecommendedItemCandidate,
+)
+from backend.agents.scoring import rank_items, score_items
+from backend.agents.stub import PERSONA_PROFILE
+
+
+PROJECT_INFO = {"food_sector": "카페", "region": "강남구", "capital": "30000000원 ~ 50000000원"}
+
+DONGS = ["역삼동", "논현동", "신사동", "삼성동", "대치동"]
+RENTS = ["평당 25만원", "평당 18~22만원", "월세 300만원(20평 기준)", "3.3㎡당 12만원", "정보 없음"]
+CONCEPTS = [
+    "직장인 대상 테이크아웃 전문점",
+    "건강식 점심 특화 샐러드 카페",
+    "트렌디한 디저트 카페",
+    "스페셜티 커피 로스터리",
+    "동네 베이커리 카페",
+    "비건 디저트 전문점",
+]
+
+MARKET_ANALYSIS_LIST = MarketAnalysisList(
+    market_analyses=[
+        {
+            "dong": dong,
+            "demographics": "20-30대 직장인 중심",
+            "avg_rent": rent,
+            "foot_traffic": "평일 점심 집중",
+            "emerging_trends": ["건강식", "테이크아웃", "비건"],
+            "market_opportunities": ["점심 특화 메뉴", "디저트 수요"],
+        }
+        for dong, rent in zip(DONGS, RENTS)
+    ]
+)
+
+
+def _candidates(count: int) -> list[RecommendedItemCandidate]:
+    rng = random.Random(count)
+    return [
+        RecommendedItemCandidate(
+            item=f"후보 {idx}",
+            concept=rng.choice(CONCEPTS),
+            reason="상권의 점심 수요와 창업자의 마케팅 강점이 맞음",
+            location_strategy={
+                "recommended_areas": [f"{rng.choice(DONGS)} 역세권"],
+                "location_criteria": ["직장인 유동인구"],
+                "accessibility_notes": "지하철역 도보 5분",
+            },
+        )
+        for idx in range(count)
+    ]
+
+
+def main(sizes: list[int], repeats: int) -> None:
+    persona = PersonaProfile.model_validate(PERSONA_PROFILE)
+    for size in sizes:
+        candidates = _candidates(size)
+        start = time.perf_counter()
+        for _ in range(repeats):
+            top = rank_items(score_items(persona, PROJECT_INFO, MARKET_ANALYSIS_LIST, candidates))
+        elapsed = (time.perf_counter() - start) / repeats
+        print(
+            f"candidates={size:<6} batch={elapsed * 1000:8.2f}ms "
+            f"per candidate={elapsed / size * 1e6:6.1f}us top={top[0].item}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[6, 60, 600, 6000])
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+    main(args.sizes, args.repeats)
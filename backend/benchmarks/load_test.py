@@ -0,0 +1,348 @@
+#!/usr/bin/env python
+"""
+HTTP load test of ``/api/submit`` with a capacity report.
+
+Drives the FastAPI app with the stub model backend (``LLM_BACKEND=stub``),
+either in-process through an ASGI transport or as a uvicorn server on
+localhost with ``--workers`` processes (``--url`` targets a server that is
+already running instead). Virtual users send requests back to back; their
+number follows ``--levels``, each held for ``--stage-seconds``:
+
+- step:   jump to each level at the start of its stage
+- linear: ramp from the previous level to each level over its stage
+
+Payloads are drawn from realistic SubmitRequest distributions (age,
+MBTI, previous job, self-employment, sector, gu, log-uniform capital), and
+``--duplicate-rate`` of them replay an earlier payload like a resubmission.
+Each virtual user sends its own X-Forwarded-For, so the scheduler shares
+quota between them as between real clients.
+
+For each level the report gives throughput, latency p50/p95/p99, error
+rate and, per server process, RSS and CPU use (read from /proc, so Linux
+only). The saturation throughput is the highest level throughput, and the
+knee is the first level that added less than 10% throughput.
+
+Usage:
+    python benchmarks/load_test.py --target local --workers 2 --levels 1 4 16 64 --stage-seconds 20
+"""
+
+import argparse
+import asyncio
+import math
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+
+import httpx
+
+
+# Listed here rather than imported from backend.agents.regions: importing the
+# package builds the agents, which must wait until the stub backend is selected
+SEOUL_GUS = [
+    "강남구", "강동구", "강북구", "강서구", "관악구", "광진구", "구로구", "금천구", "노원구",
+    "도봉구", "동대문구", "동작구", "마포구", "서대문구", "서초구", "성동구", "성북구", "송파구",
+    "양천구", "영등포구", "용산구", "은평구", "종로구", "중구", "중랑구",
+]
+# (age range, weight) of applicants
+AGE_BANDS = [((20, 29), 0.3), ((30, 39), 0.35), ((40, 49), 0.2), ((50, 64), 0.15)]
+MBTI_TYPES = [a + b + c + d for a in "EI" for b in "NS" for c in "TF" for d in "JP"]
+PREVIOUS_JOBS = [
+    "마케터", "개발자", "영업", "기획자", "회계사", "요리사", "바리스타", "디자이너", "공무원", "교사",
+]
+FOOD_SECTORS = {"카페": 0.3, "베이커리": 0.15, "분식": 0.15, "치킨": 0.15, "한식": 0.15, "디저트": 0.1}
+SELF_EMPLOYED_RATE = 0.3
+CAPITAL_RANGE = (20_000_000, 200_000_000)
+CAPITAL_STEP = 5_000_000
+
+# A level that adds less throughput than this over the previous one is the knee
+KNEE_GAIN = 0.1
+
+_CLOCK_TICKS = os.sysconf("SC_CLK_TCK")
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE")
+
+
+def _payload(rng: random.Random) -> dict:
+    """One SubmitRequest body."""
+    (low, high), = rng.choices([band for band, _ in AGE_BANDS], [w for _, w in AGE_BANDS])
+    capital = math.exp(rng.uniform(*map(math.log, CAPITAL_RANGE)))
+    return {
+        "personalInfo": {
+            "name": "부하테스트",
+            "gender": rng.choice("mf"),
+            "age": rng.randint(low, high),
+            "mbti": rng.choice(MBTI_TYPES),
+            "previous_job": rng.choice(PREVIOUS_JOBS),
+            "self_employed_experience": rng.random() < SELF_EMPLOYED_RATE,
+        },
+        "projectInfo": {
+            "foodSector": rng.choices(list(FOOD_SECTORS), list(FOOD_SECTORS.values()))[0],
+            "region": rng.choice(SEOUL_GUS),
+            "capital": round(capital / CAPITAL_STEP) * CAPITAL_STEP,
+        },
+    }
+
+
+class PayloadMix:
+    """Fresh payloads, with ``duplicate_rate`` of them replaying an earlier one."""
+
+    def __init__(self, duplicate_rate: float, seed: int):
+        self.duplicate_rate = duplicate_rate
+        self.rng = random.Random(seed)
+        self.sent: list[dict] = []
+
+    def next(self) -> dict:
+        if self.sent and self.rng.random() < self.duplicate_rate:
+            return self.rng.choice(self.sent)
+        payload = _payload(self.rng)
+        self.sent.append(payload)
+        return payload
+
+
+def _process_stats(pid: int) -> tuple[int, float] | None:
+    """RSS in bytes and user+system CPU seconds of a process, from /proc."""
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            # Fields after the parenthesised command name start at ``state``
+            fields = f.read().rsplit(")", 1)[1].split()
+        with open(f"/proc/{pid}/statm") as f:
+            rss_pages = int(f.read().split()[1])
+    except OSError:
+        return None
+    return rss_pages * _PAGE_SIZE, (int(fields[11]) + int(fields[12])) / _CLOCK_TICKS
+
+
+def _worker_pids(server_pid: int) -> list[int]:
+    """uvicorn worker processes of a server, or the server itself with one worker."""
+    children = []
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as f:
+                ppid = int(f.read().rsplit(")", 1)[1].split()[1])
+            with open(f"/proc/{entry}/cmdline") as f:
+                cmdline = f.read()
+        except OSError:
+            continue
+        if ppid == server_pid and "resource_tracker" not in cmdline:
+            children.append(int(entry))
+    return sorted(children) or [server_pid]
+
+
+@dataclass
+class LevelStats:
+    concurrency: int
+    latencies: list[float] = field(default_factory=list)
+    errors: int = 0
+    # pid -> (RSS bytes at the end of the level, CPU seconds used during it)
+    processes: dict[int, tuple[int, float]] = field(default_factory=dict)
+
+
+def _target_users(elapsed: float, levels: list[int], stage_seconds: float, ramp: str) -> int:
+    stage = min(int(elapsed // stage_seconds), len(levels) - 1)
+    if ramp == "step":
+        return levels[stage]
+    previous = levels[stage - 1] if stage else 0
+    progress = min((elapsed - stage * stage_seconds) / stage_seconds, 1.0)
+    return max(1, round(previous + (levels[stage] - previous) * progress))
+
+
+async def _drive(
+    client: httpx.AsyncClient, args: argparse.Namespace, pids: list[int]
+) -> list[LevelStats]:
+    """Run the load profile and collect per-level results."""
+    levels = [LevelStats(concurrency) for concurrency in args.levels]
+    mix = PayloadMix(args.duplicate_rate, args.seed)
+    duration = len(levels) * args.stage_seconds
+    start = time.perf_counter()
+
+    async def user(index: int) -> None:
+        headers = {"x-forwarded-for": f"10.0.{index // 256}.{index % 256}"}
+        while (elapsed := time.perf_counter() - start) < duration:
+            if index >= _target_users(elapsed, args.levels, args.stage_seconds, args.ramp):
+                await asyncio.sleep(0.05)
+                continue
+            level = levels[int(elapsed // args.stage_seconds)]
+            sent = time.perf_counter()
+            try:
+                response = await client.post("/api/submit", json=mix.next(), headers=headers)
+                ok = response.status_code == 200
+            except httpx.HTTPError:
+                ok = False
+            level.latencies.append(time.perf_counter() - sent)
+            level.errors += not ok
+
+    async def sample_processes() -> None:
+        before = {pid: _process_stats(pid) for pid in pids}
+        for level in levels:
+            await asyncio.sleep(args.stage_seconds)
+            for pid in pids:
+                now = _process_stats(pid)
+                if now and before[pid]:
+                    level.processes[pid] = (now[0], now[1] - before[pid][1])
+                before[pid] = now
+
+    await asyncio.gather(
+        sample_processes(), *(user(index) for index in range(max(args.levels)))
+    )
+    return levels
+
+
+def _report(levels: list[LevelStats], stage_seconds: float) -> None:
+    print(
+        f"{'users':>6} {'requests':>9} {'req/s':>7} {'p50':>9} {'p95':>9} {'p99':>9} "
+        f"{'errors':>7}  per process RSS / CPU"
+    )
+    throughputs = []
+    for level in levels:
+        ordered = sorted(t * 1000 for t in level.latencies)
+        completed = len(ordered) - level.errors
+        throughputs.append(completed / stage_seconds)
+
+        def pct(p: float) -> float:
+            return ordered[min(int(len(ordered) * p), len(ordered) - 1)] if ordered else 0.0
+
+        processes = " ".join(
+            f"[{pid}] {rss / 2**20:.0f}MiB {cpu / stage_seconds:.0%}"
+            for pid, (rss, cpu) in level.processes.items()
+        )
+        error_rate = level.errors / len(ordered) if ordered else 0.0
+        print(
+            f"{level.concurrency:>6} {len(ordered):>9} {throughputs[-1]:>7.2f} "
+            f"{statistics.median(ordered) if ordered else 0.0:>7.0f}ms {pct(0.95):>7.0f}ms "
+            f"{pct(0.99):>7.0f}ms {error_rate:>7.1%}  {processes}"
+        )
+
+    best = max(range(len(levels)), key=throughputs.__getitem__)
+    knee = next(
+        (
+            levels[idx - 1].concurrency
+            for idx in range(1, len(levels))
+            if throughputs[idx] < throughputs[idx - 1] * (1 + KNEE_GAIN)
+        ),
+        None,
+    )
+    print(
+        f"saturation throughput={throughputs[best]:.2f} req/s at {levels[best].concurrency} users; "
+        + (f"knee at {knee} users" if knee else "no knee reached, add higher levels")
+    )
+
+
+def _stub_env(args: argparse.Namespace) -> dict[str, str]:
+    env = {
+        "LLM_BACKEND": "stub",
+        "STUB_LATENCY_DISTRIBUTION": args.distribution,
+        "STUB_LATENCY_SECONDS": str(args.latency),
+        "STUB_LATENCY_SHAPE": str(args.shape),
+        "STUB_ERROR_RATE": str(args.error_rate),
+    }
+    if args.no_cache:
+        env.update(WORKFLOW_CACHE_BACKEND="none", STAGE_CACHE_BACKEND="none")
+    return env
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def _run_inprocess(args: argparse.Namespace) -> list[LevelStats]:
+    # The stub backend is chosen when the agents module is imported
+    os.environ.update(_stub_env(args))
+    from backend.main import app
+
+    transport = httpx.ASGITransport(app=app)
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://loadtest", timeout=None
+        ) as client:
+            return await _drive(client, args, [os.getpid()])
+
+
+async def _wait_healthy(client: httpx.AsyncClient, timeout: float) -> None:
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        try:
+            if (await client.get("/health")).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        await asyncio.sleep(0.2)
+    raise SystemExit("Server did not become healthy")
+
+
+async def _run_local(args: argparse.Namespace) -> list[LevelStats]:
+    port = _free_port()
+    server = subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", "backend.main:app",
+            "--host", "127.0.0.1", "--port", str(port),
+            "--workers", str(args.workers), "--log-level", "warning",
+        ],
+        env={**os.environ, **_stub_env(args)},
+    )
+    limits = httpx.Limits(max_connections=max(args.levels))
+    try:
+        async with httpx.AsyncClient(
+            base_url=f"http://127.0.0.1:{port}", timeout=None, limits=limits
+        ) as client:
+            await _wait_healthy(client, timeout=120)
+            pids = _worker_pids(server.pid)
+            while args.workers > 1 and len(pids) < args.workers:
+                await asyncio.sleep(0.2)
+                pids = _worker_pids(server.pid)
+            return await _drive(client, args, pids)
+    finally:
+        server.terminate()
+        server.wait()
+
+
+async def _run_url(args: argparse.Namespace) -> list[LevelStats]:
+    limits = httpx.Limits(max_connections=max(args.levels))
+    async with httpx.AsyncClient(base_url=args.url, timeout=None, limits=limits) as client:
+        await _wait_healthy(client, timeout=10)
+        return await _drive(client, args, [])
+
+
+async def main(args: argparse.Namespace) -> None:
+    if args.url:
+        levels = await _run_url(args)
+        target = args.url
+    elif args.target == "local":
+        levels = await _run_local(args)
+        target = f"localhost, {args.workers} worker(s)"
+    else:
+        levels = await _run_inprocess(args)
+        target = "in-process"
+    print(
+        f"target={target} ramp={args.ramp} stage={args.stage_seconds}s "
+        f"stub={args.distribution} latency={args.latency}s error_rate={args.error_rate} "
+        f"duplicate_rate={args.duplicate_rate} cache={'off' if args.no_cache else 'on'}"
+    )
+    _report(levels, args.stage_seconds)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--target", choices=["inprocess", "local"], default="inprocess")
+    parser.add_argument("--url", help="Load an already running server instead")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--levels", type=int, nargs="+", default=[1, 2, 4, 8, 16, 32])
+    parser.add_argument("--stage-seconds", type=float, default=10.0)
+    parser.add_argument("--ramp", choices=["step", "linear"], default="step")
+    parser.add_argument("--duplicate-rate", type=float, default=0.1)
+    parser.add_argument(
+        "--distribution", choices=["fixed", "uniform", "lognormal", "pareto"], default="lognormal"
+    )
+    parser.add_argument("--latency", type=float, default=0.5)
+    parser.add_argument("--shape", type=float, default=0.5)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--no-cache", action="store_true")
+    parser.add_argument("--seed", type=int, default=0)
+    asyncio.run(main(parser.parse_args()))
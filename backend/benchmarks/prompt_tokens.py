@@ -0,0 +1,48 @@
+#!/usr/bin/env python
+"""
+Prompt token benchmark per workflow stage.
+
+Runs one workflow against the stub model and reports, per stage, the tokens
+of the whole prompt and of the user query alone (inter-agent payload), as
+counted by litellm's default tokenizer.
+
+Usage:
+    python benchmarks/prompt_tokens.py
+"""
+
+import asyncio
+from statistics import mean
+
+from concurrent_submissions import _unique_inputs
+
+from backend.agents.stub import PROMPT_TOKENS, QUERY_TOKENS, install_stub_llm
+from backend.agents.workflow import run_workflow_async
+
+
+STAGES = {
+    "PersonaProfile": "profiler_agent",
+    "MarketAnalysis": "market_analyst_agent",
+    "RecommendedItemCandidateList": "item_recommender_agent",
+    "RoadmapDraft": "roadmap_architect_agent",
+}
+
+
+async def main() -> None:
+    install_stub_llm(distribution="fixed", latency=0.0, record_tokens=True)
+    await run_workflow_async(*_unique_inputs())
+    total_prompt = total_query = 0
+    for schema, agent_name in STAGES.items():
+        prompt_counts = PROMPT_TOKENS[schema]
+        query_counts = QUERY_TOKENS[schema]
+        total_prompt += sum(prompt_counts)
+        total_query += sum(query_counts)
+        print(
+            f"{agent_name:<26} calls={len(prompt_counts)} "
+            f"prompt_tokens(mean)={mean(prompt_counts):.0f} "
+            f"query_tokens(mean)={mean(query_counts):.0f}"
+        )
+    print(f"{'total':<26} prompt_tokens={total_prompt} query_tokens={total_query}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
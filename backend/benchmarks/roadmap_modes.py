@@ -0,0 +1,138 @@
+#!/usr/bin/env python
+"""
+Per-item, per-section and batched roadmap generation.
+
+Runs the full workflow against the stub model with its latency growing
+with the number of output tokens (like a real decoder), once for each
+``ROADMAP_MODE`` (``per_item``, ``sections``, ``batch``), and reports for
+the roadmap stage:
+
+- wall-clock latency (from recommended items to final report)
+- total input and output tokens of the roadmap calls
+- output retries and runs that ended with a missing roadmap
+
+With ``--failure-rate`` each roadmap call has that chance of returning
+truncated JSON, which shows how a single bad batch response costs more.
+
+Usage:
+    python benchmarks/roadmap_modes.py --runs 10 --tokens-per-second 2000
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from backend.agents import agents, workflow
+from backend.agents.output import output_parser
+from backend.agents.router import model_router
+from backend.agents.schemas import PersonalInfo, ProjectInfo
+from backend.agents.stub import OUTPUT_TOKENS, PROMPT_TOKENS, install_stub_llm
+
+
+# Output schemas of the roadmap calls made in each mode
+MODE_SCHEMAS = {
+    "per_item": ("RoadmapDraft",),
+    "sections": (
+        "SpacePlanning",
+        "OperationPreparation",
+        "FinancialPlanDraft",
+        "AdministrativeTasks",
+        "MenuDevelopment",
+    ),
+    "batch": ("RoadmapDraftList",),
+}
+
+
+PERSONAL_INFO = PersonalInfo(
+    gender="여성",
+    age=32,
+    mbti="ENFJ",
+    previous_job="마케터",
+    self_employed_experience=True,
+)
+
+
+_run_counter = 0
+
+
+async def _run_once() -> tuple[float, bool]:
+    """Run one uncached workflow; return roadmap stage seconds and whether it was complete."""
+    global _run_counter
+    _run_counter += 1
+    project_info = ProjectInfo(
+        food_sector="카페", region=f"테스트{_run_counter}구", capital="30,000,000원"
+    )
+    personal_info = PERSONAL_INFO.model_copy(update={"age": 20 + _run_counter})
+    roadmaps_started = None
+    async for event, payload in workflow.stream_workflow_async(personal_info, project_info):
+        if event == "recommended_items":
+            roadmaps_started = time.perf_counter()
+        elif event == "final_report":
+            complete = not any(issue.stage == "roadmap" for issue in payload.incomplete_stages)
+            return time.perf_counter() - roadmaps_started, complete
+    raise RuntimeError("Workflow finished without a final report")
+
+
+async def _measure(mode: str, runs: int) -> None:
+    workflow.ROADMAP_MODE = mode
+    schemas = MODE_SCHEMAS[mode]
+
+    def total(counts: dict[str, list[int]]) -> int:
+        return sum(sum(counts[schema]) for schema in schemas)
+
+    prompt_before = total(PROMPT_TOKENS)
+    output_before = total(OUTPUT_TOKENS)
+    retries_before = output_parser.retries
+
+    timings = []
+    incomplete = 0
+    for _ in range(runs):
+        seconds, complete = await _run_once()
+        timings.append(seconds)
+        incomplete += not complete
+
+    timings_ms = sorted(t * 1000 for t in timings)
+    print(
+        f"{mode:<9} roadmap stage mean={statistics.mean(timings_ms):7.1f}ms "
+        f"p95={timings_ms[max(int(len(timings_ms) * 0.95) - 1, 0)]:7.1f}ms | "
+        f"input tokens/run={(total(PROMPT_TOKENS) - prompt_before) / runs:7.0f} "
+        f"output tokens/run={(total(OUTPUT_TOKENS) - output_before) / runs:6.0f} | "
+        f"retries={output_parser.retries - retries_before} incomplete runs={incomplete}/{runs}"
+    )
+
+
+async def main(runs: int, latency: float, tokens_per_second: float, failure_rate: float) -> None:
+    install_stub_llm(distribution="fixed", latency=latency, record_tokens=True)
+    roadmap_agents = [
+        variant
+        for agent in (
+            agents.roadmap_architect_agent,
+            agents.roadmap_batch_agent,
+            *agents.ROADMAP_SECTION_AGENTS.values(),
+        )
+        for variant in agents.MODEL_ROUTES[agent.name]
+    ]
+    install_stub_llm(
+        roadmap_agents,
+        distribution="fixed",
+        latency=latency,
+        tokens_per_second=tokens_per_second,
+        truncate_rate=failure_rate,
+        record_tokens=True,
+    )
+    # Compare the modes on the default models only
+    model_router.enabled = False
+
+    for mode in MODE_SCHEMAS:
+        await _measure(mode, runs)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--tokens-per-second", type=float, default=2000)
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    args = parser.parse_args()
+    asyncio.run(main(args.runs, args.latency, args.tokens_per_second, args.failure_rate))
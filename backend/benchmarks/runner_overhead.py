@@ -0,0 +1,138 @@
+#!/usr/bin/env python
+"""
+Per-call overhead micro-benchmark against a local stub LLM server.
+
+Starts an OpenAI-compatible stub server on localhost, points a LiteLlm agent
+at it and times sequential agent calls in two modes:
+
+- baseline: a new Runner per call
+- pooled:   the shared RunnerPool
+
+The stub answers immediately, so the numbers are pure client-side overhead.
+Both modes go through LiteLLM's cached HTTP client, so connection reuse is
+the same in each and only the Runner construction differs.
+
+Usage:
+    python benchmarks/runner_overhead.py --calls 200
+"""
+
+import argparse
+import asyncio
+import json
+import socket
+import statistics
+import threading
+import time
+
+import uvicorn
+from fastapi import FastAPI
+from google.adk.agents import Agent
+from google.adk.models.lite_llm import LiteLlm
+from google.adk.runners import Runner
+from google.genai import types
+
+from backend.agents.pool import runner_pool
+from backend.agents.schemas import PersonaProfile
+from backend.agents.sessions import APP_NAME, USER_ID, session_manager
+from backend.agents.stub import PERSONA_PROFILE
+from backend.agents.workflow import _extract_final_response
+
+
+stub_app = FastAPI()
+
+
+@stub_app.post("/v1/chat/completions")
+async def chat_completions():
+    return {
+        "id": "stub",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": "stub",
+        "choices": [
+            {
+                "index": 0,
+                "message": {
+                    "role": "assistant",
+                    "content": json.dumps(PERSONA_PROFILE, ensure_ascii=False),
+                },
+                "finish_reason": "stop",
+            }
+        ],
+        "usage": {"prompt_tokens": 10, "completion_tokens": 10, "total_tokens": 20},
+    }
+
+
+def _start_stub_server() -> int:
+    """Run the stub server in a background thread and return its port."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    server = uvicorn.Server(
+        uvicorn.Config(stub_app, host="127.0.0.1", port=port, log_level="warning")
+    )
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.01)
+    return port
+
+
+async def _call(runner: Runner) -> None:
+    content = types.Content(role="user", parts=[types.Part(text="{}")])
+    async with session_manager.session() as session_id:
+        events = [
+            event
+            async for event in runner.run_async(
+                user_id=USER_ID, session_id=session_id, new_message=content
+            )
+        ]
+    _extract_final_response(events, PersonaProfile)
+
+
+async def _measure(agent: Agent, calls: int, pooled: bool) -> list[float]:
+    timings = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        if pooled:
+            runner = runner_pool.get(agent)
+        else:
+            runner = Runner(
+                agent=agent, app_name=APP_NAME, session_service=session_manager.session_service
+            )
+        await _call(runner)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def _report(label: str, timings: list[float]) -> None:
+    timings_ms = sorted(t * 1000 for t in timings)
+    p95 = timings_ms[int(len(timings_ms) * 0.95) - 1]
+    print(
+        f"{label:<9} mean={statistics.mean(timings_ms):.2f}ms "
+        f"p50={statistics.median(timings_ms):.2f}ms p95={p95:.2f}ms"
+    )
+
+
+async def main(calls: int) -> None:
+    port = _start_stub_server()
+    agent = Agent(
+        model=LiteLlm(model="openai/stub", api_base=f"http://127.0.0.1:{port}/v1", api_key="stub"),
+        name="stub_agent",
+        instruction="Return a PersonaProfile.",
+        output_schema=PersonaProfile,
+        disallow_transfer_to_parent=True,
+        disallow_transfer_to_peers=True,
+    )
+    # Each mode is warmed up first so connection setup and lazy imports are
+    # not attributed to the first timed call
+    await _measure(agent, 5, pooled=False)
+    _report("baseline", await _measure(agent, calls, pooled=False))
+
+    await _measure(agent, 5, pooled=True)
+    _report("pooled", await _measure(agent, calls, pooled=True))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=200)
+    args = parser.parse_args()
+    asyncio.run(main(args.calls))
@@ -0,0 +1,172 @@
+#!/usr/bin/env python
+"""
+End-to-end workflow benchmark against the offline stub model.
+
+Streams ``--runs`` workflows, at most ``--concurrency`` at a time, with every
+agent answered by ``StubLlm`` under the chosen latency distribution and
+failure rates, and reports:
+
+- per-stage latency p50/p95/p99: persona and market analysis from the
+  submission, item recommendation from the later of the two, the roadmap
+  stage from the recommended items to the last roadmap, and end to end
+- throughput in completed workflows per second
+- event-loop lag: how late a ``--lag-interval`` timer wakes up, i.e. how
+  long orchestration code holds the loop without yielding
+
+Each run gets a different persona and cycles through the Seoul gus, and
+the result caches are off unless ``--cache`` is given, so every run makes
+its own agent calls.
+
+Usage:
+    python benchmarks/workflow_e2e.py --runs 200 --concurrency 16 --distribution lognormal --latency 0.2
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from collections import defaultdict
+
+from backend.agents import workflow
+from backend.agents.regions import SEOUL_DISTRICTS
+from backend.agents.schemas import PersonalInfo, ProjectInfo
+from backend.agents.stub import install_stub_llm
+
+
+STAGES = ("persona_profile", "market_analysis", "recommended_items", "roadmap", "end_to_end")
+
+PERSONAL_INFO = PersonalInfo(
+    gender="여성",
+    age=32,
+    mbti="ENFJ",
+    previous_job="마케터",
+    self_employed_experience=True,
+)
+PROJECT_INFO = ProjectInfo(
+    food_sector="카페",
+    region="강남구",
+    capital="30,000,000원 ~ 50,000,000원",
+)
+REGIONS = list(SEOUL_DISTRICTS)
+
+
+def _inputs(index: int) -> tuple[PersonalInfo, ProjectInfo]:
+    return (
+        PERSONAL_INFO.model_copy(update={"age": 20 + index % 60, "previous_job": f"마케터{index}"}),
+        PROJECT_INFO.model_copy(update={"region": REGIONS[index % len(REGIONS)]}),
+    )
+
+
+async def _run_once(index: int) -> tuple[dict[str, float], bool]:
+    """Stream one workflow; return its stage latencies and whether it was complete."""
+    start = time.perf_counter()
+    seen = {}
+    complete = False
+    async for event, payload in workflow.stream_workflow_async(*_inputs(index)):
+        # Later roadmap events overwrite earlier ones: the stage ends at the last
+        seen[event] = time.perf_counter() - start
+        if event == "final_report":
+            complete = not payload.incomplete_stages
+    stages = {"end_to_end": seen["final_report"]}
+    for event in ("persona_profile", "market_analysis"):
+        if event in seen:
+            stages[event] = seen[event]
+    if "recommended_items" in seen:
+        inputs_ready = max(seen.get("persona_profile", 0.0), seen.get("market_analysis", 0.0))
+        stages["recommended_items"] = seen["recommended_items"] - inputs_ready
+        if "roadmap" in seen:
+            stages["roadmap"] = seen["roadmap"] - seen["recommended_items"]
+    return stages, complete
+
+
+async def _monitor_lag(interval: float, lags: list[float], stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        expected = time.perf_counter() + interval
+        await asyncio.sleep(interval)
+        lags.append(max(time.perf_counter() - expected, 0.0))
+
+
+def _percentiles(values: list[float]) -> str:
+    ordered = sorted(v * 1000 for v in values)
+
+    def pct(p: float) -> float:
+        return ordered[min(int(len(ordered) * p), len(ordered) - 1)]
+
+    return (
+        f"p50={statistics.median(ordered):8.1f}ms p95={pct(0.95):8.1f}ms "
+        f"p99={pct(0.99):8.1f}ms max={ordered[-1]:8.1f}ms"
+    )
+
+
+async def main(args: argparse.Namespace) -> None:
+    random.seed(args.seed)
+    install_stub_llm(
+        distribution=args.distribution,
+        latency=args.latency,
+        shape=args.shape,
+        tokens_per_second=args.tokens_per_second,
+        truncate_rate=args.truncate_rate,
+        error_rate=args.error_rate,
+    )
+    if not args.cache:
+        workflow.workflow_cache = workflow.persona_cache = workflow.market_cache = None
+
+    semaphore = asyncio.Semaphore(args.concurrency)
+    stage_latencies: dict[str, list[float]] = defaultdict(list)
+    outcomes = {"complete": 0, "incomplete": 0, "failed": 0}
+
+    async def limited(index: int) -> None:
+        async with semaphore:
+            try:
+                stages, complete = await _run_once(index)
+            except Exception:
+                outcomes["failed"] += 1
+                return
+        outcomes["complete" if complete else "incomplete"] += 1
+        for stage, seconds in stages.items():
+            stage_latencies[stage].append(seconds)
+
+    lags = []
+    stop = asyncio.Event()
+    monitor = asyncio.create_task(_monitor_lag(args.lag_interval, lags, stop))
+    start = time.perf_counter()
+    await asyncio.gather(*(limited(index) for index in range(args.runs)))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await monitor
+
+    print(
+        f"stub={args.distribution} latency={args.latency}s shape={args.shape} "
+        f"truncate_rate={args.truncate_rate} error_rate={args.error_rate} "
+        f"runs={args.runs} concurrency={args.concurrency} cache={'on' if args.cache else 'off'}"
+    )
+    for stage in STAGES:
+        if stage_latencies[stage]:
+            print(f"{stage:<18} n={len(stage_latencies[stage]):<5} {_percentiles(stage_latencies[stage])}")
+    finished = outcomes["complete"] + outcomes["incomplete"]
+    print(
+        f"throughput={finished / elapsed:.2f} workflows/s over {elapsed:.2f}s | "
+        f"complete={outcomes['complete']} incomplete={outcomes['incomplete']} "
+        f"failed={outcomes['failed']}"
+    )
+    if lags:
+        print(f"{'event loop lag':<18} n={len(lags):<5} {_percentiles(lags)}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument(
+        "--distribution", choices=["fixed", "uniform", "lognormal", "pareto"], default="lognormal"
+    )
+    parser.add_argument("--latency", type=float, default=0.2)
+    parser.add_argument("--shape", type=float, default=0.5)
+    parser.add_argument("--tokens-per-second", type=float, default=0.0)
+    parser.add_argument("--truncate-rate", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--lag-interval", type=float, default=0.01)
+    parser.add_argument("--cache", action="store_true")
+    parser.add_argument("--seed", type=int, default=0)
+    asyncio.run(main(parser.parse_args()))
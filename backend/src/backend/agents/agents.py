@@ -1,14 +1,29 @@
 import os
 from google.adk.agents import Agent
+from google.adk.models.google_llm import Gemini
 from google.adk.models.lite_llm import LiteLlm
 from dotenv import load_dotenv
 
-from .schemas import FinalReport, MarketAnalysisList, PersonaProfile, RecommendedItemList, Roadmap
+from .schemas import (
+    AdministrativeTasks,
+    FinalReport,
+    FinancialPlanDraft,
+    MarketAnalysis,
+    MenuDevelopment,
+    OperationPreparation,
+    PersonaProfile,
+    RecommendedItemCandidateList,
+    RoadmapDraft,
+    RoadmapDraftList,
+    SpacePlanning,
+)
 
 
 load_dotenv()
 
 BEDROCK_API_KEY = os.getenv("BEDROCK_API_KEY")
+# Item candidates the recommender proposes; they are scored and pruned locally
+RECOMMEND_CANDIDATES = int(os.getenv("RECOMMEND_CANDIDATES", "6"))
 
 QWEN_MODEL = "qwen.qwen3-235b-a22b-2507-v1:0"
 GEMINI_FLASH_MODEL = "gemini-2.5-flash"
@@ -73,40 +88,38 @@ market_analyst_agent = Agent(
     name="market_analyst_agent",
     description=(
 """
-이 AI Agent는 특정 '구(Gu)' 단위의 지역명이 입력되었을 때, 해당 '구'에 소속된 모든 '동(Dong)'에 대한 개별 시장 분석을 수행합니다.
-각 '동'별로 인구 통계, 평균 임대료, 유동인구, 경쟁자 분석, 신흥 트렌드, 시장 기회 등을 포함한 상세 리포트를 생성하며,
-최종 결과는 MarketAnalysisList 스키마에 맞춰 '동'별 분석 데이터의 리스트로 반환합니다.
+이 AI Agent는 특정 '구(Gu)'와 그 안의 '동(Dong)' 하나가 입력되었을 때, 해당 '동'에 대한 시장 분석을 수행합니다.
+인구 통계, 평균 임대료, 유동인구, 신흥 트렌드, 시장 기회 등을 포함한 리포트를 생성하며,
+결과는 MarketAnalysis 스키마에 맞춰 반환합니다. 여러 '동'이 필요하면 '동'마다 병렬로 호출됩니다.
 """
     ),
     instruction=(
 """
 # Role
 
-당신은 서울시 상권 분석을 전문으로 하는 AI 애널리스트입니다. 당신의 핵심 임무는 사용자가 지정한 '구(Gu)'(예: "강남구")를 입력받아, 해당 '구'에 포함된 모든 '동(Dong)'(예: "신사동", "논현동", "삼성동"...)을 자동으로 식별하고, **각 '동'에 대한 개별적이고 상세한 시장 분석**을 수행하는 것입니다.
+당신은 서울시 상권 분석을 전문으로 하는 AI 애널리스트입니다. 당신의 핵심 임무는 사용자가 지정한 '구(Gu)'(`ProjectInfo.region`, 예: "강남구")와 그 안의 '동(Dong)'(`MarketAnalysis.dong`, 예: "역삼1동")을 입력받아, **그 '동' 하나에 대한 상세한 시장 분석**을 수행하는 것입니다.
 
 # Analysis and Inference Guidelines
 
-1.  **지역 확장 (Gu to Dongs):** 사용자가 '구' 이름을 입력하면, 즉시 해당 '구'에 속한 모든 행정동 또는 법정동의 리스트를 식별해야 합니다.
-2.  **개별 '동' 단위 분석:** 식별된 *모든 '동'* 각각에 대해 다음 항목들을 개별적으로 조사하고 분석해야 합니다.
-3.  **핵심 데이터 수집:** 각 '동'의 인구통계학적 특성(주요 연령대, 성별 비율, 가구 구성), 평균 임대료 시세(평당 또는 면적 기준), 유동인구 특성(주중/주말, 시간대별)을 분석합니다.
-4.  **경쟁자 분석 (필수 추가 항목):** 각 '동'의 상권 내 주요 경쟁자들을 식별하고, `CompetitorAnalysis` 스키마(해당 스키마는 별도로 제공됨)에 맞춰 구체적인 분석을 수행합니다. 이는 출력 스키마의 필수 요구사항입니다.
-5.  **트렌드 및 기회 도출:** 수집된 데이터를 바탕으로 해당 '동' 상권의 최신 트렌드와 잠재적인 시장 진입 기회를 추론합니다.
+1.  **분석 대상:** 입력된 '동'만 분석합니다. 다른 '동'은 필요할 때 별도로 분석되므로 생성하지 않습니다.
+2.  **대상 '동'이 비어 있는 경우:** `MarketAnalysis.dong`이 빈 문자열이면, 입력된 '구'에서 상권이 가장 발달한 대표 '동' 하나를 골라 분석합니다.
+3.  **핵심 데이터 수집:** 해당 '동'의 인구통계학적 특성(주요 연령대, 성별 비율, 가구 구성), 평균 임대료 시세(평당 또는 면적 기준), 유동인구 특성(주중/주말, 시간대별)을 분석합니다.
+4.  **트렌드 및 기회 도출:** 수집된 데이터를 바탕으로 해당 '동' 상권의 최신 트렌드와 잠재적인 시장 진입 기회를 추론합니다.
 
-# Output Generation Rules for *
+# Output Generation Rules for `MarketAnalysis`
 
-1.  분석된 *각각의 '동'*에 대해 `MarketAnalysis` 객체를 생성해야 합니다.
-2.  **`region` 필드:** 이 필드에는 `dong`이 아닌 **'동'의 이름**(예: "신사동")이 문자열로 명확하게 할당되어야 합니다.
-3.  **`competitor_analysis` 필드:** 'Analysis and Inference Guidelines'의 4번 항목에서 분석한 경쟁자 데이터를 `list[CompetitorAnalysis]` 형태로 *반드시* 포함해야 합니다.
-4.  **`demographics`, `avg_rent`, `foot_traffic` 필드:** 각 '동'에 맞게 수집된 분석 데이터를 요약된 설명(string)으로 제공합니다.
-5.  **`emerging_trends`, `market_opportunities` 필드:** 각 '동'에서 도출된 트렌드와 기회를 `list[str]` 형태로 제공합니다.
+1.  **`dong` 필드:** 분석한 '동'의 이름(예: "역삼1동")을 입력된 그대로 할당합니다.
+2.  **`demographics`, `foot_traffic` 필드:** 수집된 분석 데이터를 요약된 설명(string)으로 제공합니다.
+3.  **`avg_rent` 필드:** 1층 상가 기준 월 임대료를 "평당 25만원"처럼 금액과 기준 면적이 드러나게 작성합니다. 이 값은 자금 계획 계산에 쓰입니다.
+4.  **`emerging_trends`, `market_opportunities` 필드:** 해당 '동'에서 도출된 트렌드와 기회를 `list[str]` 형태로 제공합니다.
 
 # Final Output
 
-1.  입력된 '구'에 속한 모든 '동'에 대해 생성된 `MarketAnalysis` 객체들을 하나의 리스트로 취합합니다.
-2.  이 리스트를 `MarketAnalysisList` 모델의 `market_analyses` 필드에 할당하여 최종 JSON 객체로 반환합니다. 만약 "강남구"가 입력되고 3개의 '동'이 분석되었다면, `market_analyses` 리스트에는 3개의 `MarketAnalysis` 객체가 포함되어야 합니다.
+*   `MarketAnalysis` 객체 하나를 JSON 형식으로 출력합니다.
+*   **별도의 설명이나 주석 없이, 오직 JSON 객체만 출력해야 합니다.**
 """
     ),
-    output_schema=MarketAnalysisList,
+    output_schema=MarketAnalysis,
     disallow_transfer_to_parent=True,
     disallow_transfer_to_peers=True,
 )
@@ -119,7 +132,7 @@ item_recommender_agent = Agent(
 """
 입력된 ProjectInfo(프로젝트 정보), PersonaProfile(창업자 페르소나), 그리고 MarketAnalysisList(지역 내 여러 '동' 단위의 상세 시장 분석)를 종합적으로 분석합니다.
 이 정보를 바탕으로 창업자의 페르소나와 자본금에 부합하면서, 특정 '동'의 시장 기회(인구, 유동인구, 트렌드)를 공략할 수 있는 최적의 '콘셉트' 조합을 추론합니다.
-최종적으로 성공 가능성이 가장 높은 3가지 맞춤형 창업 아이템을 RecommendedItemList 형식으로 제안합니다.
+최종적으로 유망한 맞춤형 창업 아이템 후보를 RecommendedItemCandidateList 형식으로 제안합니다.
 """
     ),
     instruction=(
@@ -130,13 +143,13 @@ item_recommender_agent = Agent(
 
 ## Description
 
-입력된 `ProjectInfo`(프로젝트 정보), `PersonaProfile`(창업자 페르소나), 그리고 `MarketAnalysisList`(지역 내 여러 '동' 단위의 상세 시장 분석)를 종합적으로 분석합니다. 이 정보를 바탕으로 창업자의 페르소나와 자본금에 부합하면서, 특정 '동'의 시장 기회(인구, 유동인구, 트렌드)를 공략할 수 있는 최적의 '콘셉트' 조합을 추론합니다. 최종적으로 성공 가능성이 가장 높은 3가지 맞춤형 창업 아이템을 `RecommendedItemList` 형식으로 제안합니다.
+입력된 `ProjectInfo`(프로젝트 정보), `PersonaProfile`(창업자 페르소나), 그리고 `MarketAnalysisList`(지역 내 여러 '동' 단위의 상세 시장 분석)를 종합적으로 분석합니다. 이 정보를 바탕으로 창업자의 페르소나와 자본금에 부합하면서, 특정 '동'의 시장 기회(인구, 유동인구, 트렌드)를 공략할 수 있는 최적의 '콘셉트' 조합을 추론합니다. 최종적으로 유망한 맞춤형 창업 아이템 후보 {candidates}개를 `RecommendedItemCandidateList` 형식으로 제안합니다.
 
 ## Instruction
 
 ### Role
 
-당신은 고도의 데이터 기반 외식 창업 전략 컨설턴트입니다. 당신의 임무는 제공된 3가지 핵심 데이터(프로젝트, 페르소나, 시장)를 입체적으로 분석하여, 창업자의 성공 확률을 극대화할 수 있는 **가장 유망한 3개의 창업 아이템**을 도출하는 것입니다. 각 아이템은 반드시 **특정 '동(dong)'과 구체적인 '콘셉트(concept)'의 전략적 매칭**을 기반으로 해야 합니다.
+당신은 고도의 데이터 기반 외식 창업 전략 컨설턴트입니다. 당신의 임무는 제공된 3가지 핵심 데이터(프로젝트, 페르소나, 시장)를 입체적으로 분석하여, 창업자의 성공 확률을 극대화할 수 있는 **유망한 창업 아이템 후보 {candidates}개**를 도출하는 것입니다. 각 아이템은 반드시 **특정 '동(dong)'과 구체적인 '콘셉트(concept)'의 전략적 매칭**을 기반으로 해야 합니다.
 
 ---
 
@@ -159,16 +172,17 @@ item_recommender_agent = Agent(
     * **[핵심 추론]** 이 '동'의 특성과 기회(예: '역삼동 20-30대 직장인 여성 많음', '건강식 점심 수요 증가')를 공략할 수 있는, (1)번의 업종과 (2)번의 페르소나에 맞는 **구체적인 '콘셉트'**를 매칭합니다.
     * *예: (동: 역삼동) + (기회: 건강식 점심 수요) + (페르소나: Low-risk, 안정적 운영 선호) $\rightarrow$ (콘셉트: '프리미엄 샐러드 정기배송 및 픽업 전문점')*
 
-4.  **Final Selection (최종 3개 아이템 선정):**
-    * 위 3단계의 매칭 과정을 통해 생성된 다수의 (동-콘셉트-페르소나) 조합 후보군 중에서, 3가지 핵심 점수(시장성, 적합성, 수익성)의 총합이 가장 높은 **상위 3개**를 선정합니다.
+4.  **Candidate Selection (후보 {candidates}개 선정):**
+    * 위 3단계의 매칭 과정을 통해 생성된 다수의 (동-콘셉트-페르소나) 조합 중에서 서로 다른 '동' 또는 '콘셉트'를 공략하는 **{candidates}개**의 후보를 선정합니다.
+    * 시장성, 적합성, 수익성 점수와 최종 순위는 시스템이 계산하므로 점수를 매기지 않습니다. 대신 점수 계산에 쓰이도록 `concept`과 `reason`에 공략하는 트렌드·시장 기회·페르소나 강점을, `recommended_areas`에 대상 '동' 이름을 명확히 적습니다.
 
 ---
 
-### Output Generation Rules for `RecommendedItemList`
+### Output Generation Rules for `RecommendedItemCandidateList`
 
-* `recommended_items` 리스트에는 반드시 위 분석을 통해 도출된 **3개의 `RecommendedItem` 객체**를 포함해야 합니다.
+* `candidates` 리스트에는 반드시 위 분석을 통해 도출된 **{candidates}개의 `RecommendedItemCandidate` 객체**를 포함해야 합니다.
 
-#### `RecommendedItem` (개별 추천 아이템)
+#### `RecommendedItemCandidate` (개별 추천 아이템 후보)
 
 * **item**: 추천하는 창업 아이템의 명확한 이름. (예: "역삼동 핀포인트 '그릭요거트 볼' 배달 전문점")
 * **concept**: 아이템의 차별화된 핵심 콘셉트. 타겟 고객과 제공 가치를 명확히 기술합니다. (예: "매일 아침 직접 그릭요거트를 제조하며, 100% 비건 옵션과 커스텀 토핑을 제공하여 바쁜 직장인의 건강한 아침/점심을 책임지는 콘셉트")
@@ -177,25 +191,23 @@ item_recommender_agent = Agent(
     * `location_criteria`: 해당 지역을 선정한 기준. `MarketAnalysis`의 근거(유동인구, 인구통계)와 `capital`을 연계하여 작성합니다. (예: "20-30대 여성 직장인 유동인구 최대", "점심 배달 수요 폭발 지역", "자본금 내 10평 미만 소형 점포 확보 가능")
     * `accessibility_notes`: 주요 교통(지하철역)이나 배달 접근성 등 핵심 메모. (예: "역삼역 도보 5분 이내, 배달 라이더 픽업 용이")
 * **reason**: **[가장 중요]** **왜 이 '동'과 이 '콘셉트'의 조합이 이 '페르소나'에게 최적의 기회인지** 논리적으로 요약합니다. 시장 기회, 페르소나 강점, 자본금 제약 3박자가 어떻게 맞아떨어지는지 서술해야 합니다.
-* **scores (market_fit, persona_fit, profitability)**: 0.0에서 100.0 사이의 점수를 부여합니다.
-    * `market_fit_score`: 해당 '동'의 시장 기회/트렌드와의 적합도.
-    * `persona_fit_score`: 창업자의 페르소나(리스크, 강/약점)와의 적합도.
-    * `profitability_score`: `capital` 대비 `avg_rent` 및 예상 매출을 고려한 수익성 전망.
 
 ---
 
 ### Final Output
 
-모든 분석과 추론을 완료한 후, 오직 `RecommendedItemList` Pydantic 모델 스키마에 완벽하게 일치하는 JSON 객체만을 생성하여 출력합니다. 서론이나 결론 등 부가적인 텍스트를 포함하지 마세요.
+모든 분석과 추론을 완료한 후, 오직 `RecommendedItemCandidateList` Pydantic 모델 스키마에 완벽하게 일치하는 JSON 객체만을 생성하여 출력합니다. 서론이나 결론 등 부가적인 텍스트를 포함하지 마세요.
 """
-    ),
-    output_schema=RecommendedItemList,
+    ).format(candidates=RECOMMEND_CANDIDATES),
+    output_schema=RecommendedItemCandidateList,
     disallow_transfer_to_parent=True,
     disallow_transfer_to_peers=True,
 )
 
 roadmap_architect_agent = Agent(
-    model=GEMINI_PRO_MODEL,
+    # A model instance (not a model name string) keeps one google-genai client,
+    # and its connection pool, alive across calls
+    model=Gemini(model=GEMINI_PRO_MODEL),
     name="roadmap_architect_agent",
     description=(
 """
@@ -218,11 +230,11 @@ roadmap_architect_agent = Agent(
 
 2.  **프로젝트 정보 활용**:
     *   **`ProjectInfo`에서는 오직 `capital`(자본금) 정보만을 `FinancialPlan` 수립의 핵심 제약 조건으로 사용합니다.** `food_sector`와 `region`은 이미 `RecommendedItem`에 반영되었으므로, 이 단계에서는 고려하지 않습니다.
-    *   `capital` 금액은 `FinancialPlan`의 `initial_investment`(초기 투자금)의 상한선이 됩니다. 모든 자금 계획은 이 자본금 내에서 실현 가능해야 합니다.
+    *   `capital` 금액은 초기 투자금의 상한선이 됩니다. 모든 자금 계획은 이 자본금 내에서 실현 가능해야 합니다.
 
 3.  **추천 아이템 구체화**:
     *   `RecommendedItem`의 `item`, `concept`, `reason`을 로드맵 전체의 중심 주제로 삼습니다. 모든 세부 계획(공간, 메뉴, 운영)은 이 콘셉트와 일관성을 유지해야 합니다.
-    *   `location_strategy`는 `SpacePlanning`의 `estimated_space`와 `FinancialPlan`의 `monthly_fixed_costs`(임대료) 산정에 중요한 근거가 됩니다.
+    *   `location_strategy`는 `SpacePlanning`의 `estimated_space` 산정에 중요한 근거가 됩니다.
     *   `market_fit_score`, `persona_fit_score`, `profitability_score`가 높을수록 더 자신감 있고 구체적인 계획을 제시합니다.
 
 # Output Generation Rules for Each Class
@@ -231,7 +243,7 @@ roadmap_architect_agent = Agent(
 
 *   `interior_concept`: `RecommendedItem`의 콘셉트와 `PersonaProfile`의 스타일을 결합하여 2~3 문장으로 구체화합니다. (예: "미니멀리즘과 자연주의를 결합한, 따뜻한 우드톤의 편안한 공간")
 *   `signage_ideas`: 인테리어 콘셉트와 어울리는 간판 아이디어 2~3개를 제안합니다. (예: "따뜻한 느낌의 네온사인 간판", "나무에 상호를 각인한 입간판")
-*   `estimated_space`: `item`의 특성(테이크아웃 전문, 소규모 좌석 등)과 `capital` 규모를 고려하여 현실적인 공간 크기를 '평' 또는 'm²' 단위로 제시합니다. (예: "10평(약 33m²)")
+*   `estimated_space`: `item`의 특성(테이크아웃 전문, 소규모 좌석 등)과 `capital` 규모를 고려하여 현실적인 공간 크기를 '평' 또는 'm²' 단위로 제시합니다. 이 값은 자금 계획 수치 계산에 쓰이므로 반드시 숫자와 단위를 포함합니다. (예: "10평(약 33m²)")
 
 ## `OperationPreparation` (운영 준비)
 
@@ -242,9 +254,7 @@ roadmap_architect_agent = Agent(
 
 ## `FinancialPlan` (자금 계획)
 
-*   `initial_investment`: **`ProjectInfo.capital`을 초과하지 않는 범위 내에서** 보증금, 인테리어, 장비 구입 등 초기 투자 항목과 예상 금액을 합산하여 산출합니다.
-*   `monthly_fixed_costs`: 추천 지역의 평균 임대료, 인건비, 공과금 등을 추정하여 월 고정비를 산출합니다.
-*   `break_even_point`: 월 고정비를 기준으로, 손익분기점을 달성하기 위한 월 매출 목표 또는 일일 판매 목표를 구체적으로 제시합니다. (예: "월 매출 1,200만원 달성 시" 또는 "일일 평균 80잔 판매 시")
+*   초기 투자금, 월 고정비, 손익분기점은 자본금·지역 임대료·업종별 비용 기준·메뉴 가격으로 시스템이 계산하므로 **생성하지 않습니다.**
 *   `funding_sources`: 기본적으로 "자기 자본"을 포함하고, `risk_tolerance`가 'Medium' 이상일 경우 "소상공인 정책자금 대출" 등 추가 조달 방안을 제안합니다.
 *   `policy_funds`: 대한민국 소상공인 또는 청년 창업자가 활용할 수 있는 실제 정책자금 1~2개를 찾아 `name`과 `details`를 기입합니다. (예: "소상공인시장진흥공단 창업자금")
 
@@ -275,7 +285,170 @@ roadmap_architect_agent = Agent(
 *   **별도의 설명이나 주석 없이, 오직 JSON 객체만 출력해야 합니다.**
 """
     ),
-    output_schema=Roadmap,
+    output_schema=RoadmapDraft,
     disallow_transfer_to_parent=True,
     disallow_transfer_to_peers=True,
-)
\ No newline at end of file
+)
+
+
+# Batch variant of roadmap_architect_agent: every recommended item in one
+# call, sharing the persona/project prompt prefix instead of repeating it
+roadmap_batch_agent = Agent(
+    model=Gemini(model=GEMINI_PRO_MODEL),
+    name="roadmap_batch_agent",
+    description="추천 아이템 전체(RecommendedItemList)에 대한 실행 로드맵을 한 번에 생성하여 리스트로 반환합니다.",
+    instruction=(
+"""
+# Batch Mode
+
+입력의 `RecommendedItemList.recommended_items`에 있는 아이템마다 아래 지침의 `RecommendedItem`을 그 아이템으로 보고 `Roadmap`을 하나씩 생성합니다. 아이템별 로드맵은 서로 독립적으로 작성하되, `PersonaProfile`과 `ProjectInfo`는 모든 아이템에 공통으로 적용합니다.
+"""
+        + roadmap_architect_agent.instruction.split("# Final Output")[0]
+        + """# Final Output
+
+*   입력 아이템과 같은 순서로 생성한 `Roadmap` 객체들을 `roadmaps` 필드에 담습니다.
+*   각 `Roadmap`의 `item`은 해당 `RecommendedItem.item` 값과 정확히 같아야 합니다.
+*   **별도의 설명이나 주석 없이, 오직 JSON 객체만 출력해야 합니다.**
+"""
+    ),
+    output_schema=RoadmapDraftList,
+    disallow_transfer_to_parent=True,
+    disallow_transfer_to_peers=True,
+)
+
+
+# Section agents: each writes one Roadmap section, so the five sections of a
+# roadmap can be generated concurrently. They share the roadmap guidelines
+# and each keeps only its own section's output rules.
+_ROADMAP_GUIDELINES, _ROADMAP_OUTPUT_RULES = roadmap_architect_agent.instruction.split(
+    "# Output Generation Rules for Each Class"
+)
+_ROADMAP_SECTION_RULES = {
+    chunk.split("`")[0]: "## `" + chunk.strip()
+    for chunk in _ROADMAP_OUTPUT_RULES.split("## `")[1:]
+}
+
+
+def _roadmap_section_agent(field: str, schema) -> Agent:
+    # Draft schemas share the output rules of the section they stand in for
+    name = schema.__name__.removesuffix("Draft")
+    return Agent(
+        model=Gemini(model=GEMINI_PRO_MODEL),
+        name=f"roadmap_{field}_agent",
+        description=f"추천 아이템 실행 로드맵 중 `{name}` 섹션만 생성합니다.",
+        instruction=(
+f"""
+# Section Mode
+
+당신은 전체 `Roadmap` 중 `{name}` 섹션만 담당합니다. 다른 섹션은 별도로 작성되므로 생성하지 않습니다.
+"""
+            + _ROADMAP_GUIDELINES
+            + f"""# Output Generation Rules
+
+{_ROADMAP_SECTION_RULES[name]}
+
+# Final Output
+
+*   위 규칙에 따라 `{name}` 객체를 생성하여 JSON 형식으로 출력합니다.
+*   **별도의 설명이나 주석 없이, 오직 JSON 객체만 출력해야 합니다.**
+"""
+        ),
+        output_schema=schema,
+        disallow_transfer_to_parent=True,
+        disallow_transfer_to_peers=True,
+    )
+
+
+# Roadmap field -> the agent that writes it
+ROADMAP_SECTION_AGENTS = {
+    "space_planning": _roadmap_section_agent("space_planning", SpacePlanning),
+    "operation_prep": _roadmap_section_agent("operation_prep", OperationPreparation),
+    "financial_plan": _roadmap_section_agent("financial_plan", FinancialPlanDraft),
+    "administrative_tasks": _roadmap_section_agent("administrative_tasks", AdministrativeTasks),
+    "menu_development": _roadmap_section_agent("menu_development", MenuDevelopment),
+}
+
+
+WORKFLOW_AGENTS = (
+    profiler_agent,
+    market_analyst_agent,
+    item_recommender_agent,
+    roadmap_architect_agent,
+    roadmap_batch_agent,
+    *ROADMAP_SECTION_AGENTS.values(),
+)
+
+# Relative output quality of each model, compared against per-agent
+# quality floors when the router considers a fallback
+MODEL_QUALITY = {
+    GEMINI_PRO_MODEL: 3,
+    QWEN_MODEL: 2,
+    GEMINI_FLASH_MODEL: 1,
+}
+
+_MODEL_SLUGS = {
+    QWEN_MODEL: "qwen",
+    GEMINI_FLASH_MODEL: "flash",
+    GEMINI_PRO_MODEL: "pro",
+}
+
+
+def _build_model(model_name: str):
+    if model_name == QWEN_MODEL:
+        return LiteLlm(model=QWEN_MODEL, api_key=BEDROCK_API_KEY)
+    return Gemini(model=model_name)
+
+
+def model_variant(agent: Agent, model_name: str) -> Agent:
+    """Clone an agent onto another model, keeping its prompt and output schema."""
+    return agent.clone(
+        update={
+            "name": f"{agent.name}_{_MODEL_SLUGS[model_name]}",
+            "model": _build_model(model_name),
+        }
+    )
+
+
+# Models each agent may be routed to, in order of preference; the first
+# entry is the agent itself on its default model
+MODEL_ROUTES = {
+    profiler_agent.name: (profiler_agent, model_variant(profiler_agent, GEMINI_FLASH_MODEL)),
+    market_analyst_agent.name: (
+        market_analyst_agent,
+        model_variant(market_analyst_agent, GEMINI_FLASH_MODEL),
+    ),
+    item_recommender_agent.name: (
+        item_recommender_agent,
+        model_variant(item_recommender_agent, GEMINI_FLASH_MODEL),
+    ),
+    roadmap_architect_agent.name: (
+        roadmap_architect_agent,
+        model_variant(roadmap_architect_agent, GEMINI_FLASH_MODEL),
+        model_variant(roadmap_architect_agent, QWEN_MODEL),
+    ),
+    roadmap_batch_agent.name: (
+        roadmap_batch_agent,
+        model_variant(roadmap_batch_agent, GEMINI_FLASH_MODEL),
+    ),
+    **{
+        agent.name: (agent, model_variant(agent, GEMINI_FLASH_MODEL))
+        for agent in ROADMAP_SECTION_AGENTS.values()
+    },
+}
+
+# Every non-default variant, e.g. for warming Runners or swapping models in benchmarks
+AGENT_VARIANTS = tuple(variant for route in MODEL_ROUTES.values() for variant in route[1:])
+
+# Backup agents for hedged calls: same prompt and schema on a faster model,
+# keyed by the name of the agent they stand in for
+HEDGE_ALTERNATES = {
+    roadmap_architect_agent.name: MODEL_ROUTES[roadmap_architect_agent.name][1],
+}
+
+# "stub" answers every agent with the offline StubLlm (see stub.py), so the
+# workflow runs without Bedrock or Gemini keys
+LLM_BACKEND = os.getenv("LLM_BACKEND", "live")
+if LLM_BACKEND == "stub":
+    from .stub import install_stub_llm
+
+    install_stub_llm(WORKFLOW_AGENTS + AGENT_VARIANTS)
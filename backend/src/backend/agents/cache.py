@@ -0,0 +1,232 @@
+"""LRU + TTL key-value caches with in-memory and SQLite backends."""
+
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+
+WORKFLOW_CACHE_BACKEND = os.getenv("WORKFLOW_CACHE_BACKEND", "memory")
+WORKFLOW_CACHE_PATH = os.getenv("WORKFLOW_CACHE_PATH", "workflow_cache.sqlite3")
+WORKFLOW_CACHE_MAXSIZE = int(os.getenv("WORKFLOW_CACHE_MAXSIZE", "1024"))
+WORKFLOW_CACHE_TTL_SECONDS = int(os.getenv("WORKFLOW_CACHE_TTL_SECONDS", "86400"))
+
+STAGE_CACHE_BACKEND = os.getenv("STAGE_CACHE_BACKEND", "memory")
+STAGE_CACHE_MAXSIZE = int(os.getenv("STAGE_CACHE_MAXSIZE", "1024"))
+MARKET_CACHE_TTL_SECONDS = int(os.getenv("MARKET_CACHE_TTL_SECONDS", "604800"))
+PERSONA_CACHE_TTL_SECONDS = int(os.getenv("PERSONA_CACHE_TTL_SECONDS", "86400"))
+
+
+class Cache(ABC):
+    """
+    String-valued cache with LRU eviction, per-entry TTL and hit/miss counters.
+
+    Subclasses implement the storage; ``get``/``set`` handle the counters.
+    Coroutines use ``aget``/``aset``, which backends doing disk I/O run off
+    the event loop.
+    """
+
+    def __init__(self, maxsize: int, ttl_seconds: float):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> str | None:
+        """Return the cached value, or None if it is missing or expired."""
+        value = self._get(key, time.time())
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def set(self, key: str, value: str) -> None:
+        """Store a value, evicting the least recently used entry when full."""
+        self._set(key, value, time.time() + self.ttl_seconds)
+
+    async def aget(self, key: str) -> str | None:
+        """``get`` for use from a coroutine."""
+        return self.get(key)
+
+    async def aset(self, key: str, value: str) -> None:
+        """``set`` for use from a coroutine."""
+        self.set(key, value)
+
+    def stats(self) -> dict:
+        """Return hit/miss counters and the current size."""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "size": len(self),
+            "maxsize": self.maxsize,
+        }
+
+    @abstractmethod
+    def _get(self, key: str, now: float) -> str | None: ...
+
+    @abstractmethod
+    def _set(self, key: str, value: str, expires_at: float) -> None: ...
+
+    @abstractmethod
+    def clear(self) -> None: ...
+
+    @abstractmethod
+    def __len__(self) -> int: ...
+
+
+class MemoryCache(Cache):
+    """Process-local cache backed by an OrderedDict."""
+
+    def __init__(self, maxsize: int, ttl_seconds: float):
+        super().__init__(maxsize, ttl_seconds)
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+
+    def _get(self, key: str, now: float) -> str | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < now:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def _set(self, key: str, value: str, expires_at: float) -> None:
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteCache(Cache):
+    """
+    On-disk cache that survives restarts and can be shared across workers.
+
+    ``aget``/``aset`` run on a dedicated thread, in call order, so lookups
+    and commits never stall the event loop.
+    """
+
+    def __init__(self, path: str, maxsize: int, ttl_seconds: float, table: str = "cache"):
+        super().__init__(maxsize, ttl_seconds)
+        self.table = table
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"{table}-sqlite")
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {table} ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+            "expires_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            f"CREATE INDEX IF NOT EXISTS {table}_accessed_at ON {table} (accessed_at)"
+        )
+
+    async def aget(self, key: str) -> str | None:
+        return await asyncio.get_running_loop().run_in_executor(self._executor, self.get, key)
+
+    async def aset(self, key: str, value: str) -> None:
+        await asyncio.get_running_loop().run_in_executor(self._executor, self.set, key, value)
+
+    def _get(self, key: str, now: float) -> str | None:
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT value, expires_at FROM {self.table} WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            value, expires_at = row
+            if expires_at < now:
+                self._conn.execute(f"DELETE FROM {self.table} WHERE key = ?", (key,))
+                return None
+            self._conn.execute(
+                f"UPDATE {self.table} SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+            return value
+
+    def _set(self, key: str, value: str, expires_at: float) -> None:
+        with self._lock:
+            self._conn.execute(
+                f"INSERT OR REPLACE INTO {self.table} VALUES (?, ?, ?, ?)",
+                (key, value, expires_at, time.time()),
+            )
+            self._conn.execute(
+                f"DELETE FROM {self.table} WHERE key IN ("
+                f"SELECT key FROM {self.table} ORDER BY accessed_at DESC "
+                "LIMIT -1 OFFSET ?)",
+                (self.maxsize,),
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute(f"DELETE FROM {self.table}")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()[0]
+
+
+def create_cache(
+    backend: str,
+    maxsize: int,
+    ttl_seconds: float,
+    path: str = WORKFLOW_CACHE_PATH,
+    table: str = "cache",
+) -> Cache | None:
+    """
+    Build a cache for the given backend name.
+
+    Args:
+        backend: "memory", "sqlite" or "none"
+        maxsize: Maximum number of entries before LRU eviction
+        ttl_seconds: Entry lifetime
+        path: SQLite database file (sqlite backend only)
+        table: SQLite table name, so several caches can share one file
+
+    Returns:
+        The cache, or None when caching is disabled
+    """
+    if backend == "none":
+        return None
+    if backend == "memory":
+        return MemoryCache(maxsize, ttl_seconds)
+    if backend == "sqlite":
+        return SQLiteCache(path, maxsize, ttl_seconds, table=table)
+    raise ValueError(f"Unknown cache backend: {backend}")
+
+
+workflow_cache = create_cache(
+    WORKFLOW_CACHE_BACKEND,
+    WORKFLOW_CACHE_MAXSIZE,
+    WORKFLOW_CACHE_TTL_SECONDS,
+    table="workflow_cache",
+)
+
+# Stage-level caches: market analyses per canonical region, persona profiles
+# per normalized personal info
+market_cache = create_cache(
+    STAGE_CACHE_BACKEND,
+    STAGE_CACHE_MAXSIZE,
+    MARKET_CACHE_TTL_SECONDS,
+    table="market_cache",
+)
+persona_cache = create_cache(
+    STAGE_CACHE_BACKEND,
+    STAGE_CACHE_MAXSIZE,
+    PERSONA_CACHE_TTL_SECONDS,
+    table="persona_cache",
+)
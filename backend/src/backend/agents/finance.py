@@ -0,0 +1,374 @@
+"""
+Deterministic financial figures for roadmaps.
+
+``initial_investment``, ``monthly_fixed_costs`` and ``break_even_point`` are
+computed here from the capital, the market rents, a cost profile of the
+item's sector and the roadmap's menu prices, so they are consistent with the
+inputs and cost no output tokens. The roadmap agents only write the
+narrative part of the financial plan.
+"""
+
+import math
+import os
+import re
+from dataclasses import dataclass
+
+from .schemas import (
+    FinancialPlan,
+    MarketAnalysisList,
+    PersonaProfile,
+    RecommendedItem,
+    RecommendedItemCandidate,
+    Roadmap,
+    RoadmapDraft,
+)
+
+
+FINANCE_MONTHLY_WAGE = int(os.getenv("FINANCE_MONTHLY_WAGE", "2100000"))
+FINANCE_OPERATING_DAYS = int(os.getenv("FINANCE_OPERATING_DAYS", "26"))
+FINANCE_DEPOSIT_MONTHS = int(os.getenv("FINANCE_DEPOSIT_MONTHS", "10"))
+# Monthly rent per pyeong used when no market rent can be parsed
+FINANCE_DEFAULT_RENT_PER_PYEONG = int(os.getenv("FINANCE_DEFAULT_RENT_PER_PYEONG", "150000"))
+
+PYEONG_M2 = 3.3058
+# Smallest store the capital limit may shrink the space to
+MIN_AREA_PYEONG = 5.0
+
+_UNITS = {"억": 10**8, "천만": 10**7, "백만": 10**6, "십만": 10**5, "만": 10**4, "천": 10**3}
+_AMOUNT = re.compile(r"(\d[\d,]*(?:\.\d+)?)\s*(억|천만|백만|십만|만|천)?")
+# "18~22만원": the lower bound of a range shares the upper bound's unit
+_SHARED_UNIT_RANGE = re.compile(r"(\d[\d,]*(?:\.\d+)?)(\s*~\s*\d[\d,]*(?:\.\d+)?\s*(억|천만|백만|십만|만|천))")
+_PYEONG = re.compile(r"(\d+(?:\.\d+)?)\s*평(?!당)")
+_SQUARE_METERS = re.compile(r"(\d+(?:\.\d+)?)\s*(?:m²|㎡|m2|제곱미터)(?!당)")
+# 3.3m² is one pyeong, so "3.3㎡당" quotes a rent per pyeong
+_PER_PYEONG = re.compile(r"평당|3\.3\s*(?:m²|㎡|m2)\s*당")
+_PER_SQUARE_METER = re.compile(r"(?:m²|㎡|m2|제곱미터)\s*당")
+
+
+@dataclass(frozen=True)
+class SectorProfile:
+    """Typical store size and cost structure of one food sector."""
+
+    name: str
+    keywords: tuple[str, ...]
+    area_pyeong: float
+    interior_per_pyeong: int
+    equipment: int
+    # Signage, permits, opening stock and launch marketing
+    opening_costs: int
+    staff: int
+    # Utilities, communications, insurance and other monthly overhead
+    overhead: int
+    # Cost of goods as a share of revenue
+    cost_ratio: float
+    avg_price: int
+
+
+SECTOR_PROFILES = (
+    SectorProfile(
+        name="베이커리",
+        keywords=("베이커리", "빵", "제과", "케이크"),
+        area_pyeong=15,
+        interior_per_pyeong=2_000_000,
+        equipment=40_000_000,
+        opening_costs=8_000_000,
+        staff=2,
+        overhead=1_500_000,
+        cost_ratio=0.40,
+        avg_price=5_000,
+    ),
+    SectorProfile(
+        name="카페·디저트",
+        keywords=("카페", "커피", "디저트", "음료", "주스"),
+        area_pyeong=15,
+        interior_per_pyeong=2_000_000,
+        equipment=20_000_000,
+        opening_costs=7_000_000,
+        staff=2,
+        overhead=1_200_000,
+        cost_ratio=0.35,
+        avg_price=6_000,
+    ),
+    SectorProfile(
+        name="분식·간편식",
+        keywords=("분식", "떡볶이", "김밥", "버거", "샌드위치", "도시락", "토스트", "닭강정", "샐러드"),
+        area_pyeong=10,
+        interior_per_pyeong=1_500_000,
+        equipment=15_000_000,
+        opening_costs=6_000_000,
+        staff=1,
+        overhead=1_000_000,
+        cost_ratio=0.35,
+        avg_price=8_000,
+    ),
+    SectorProfile(
+        name="치킨·주점",
+        keywords=("치킨", "호프", "주점", "포차", "이자카야", "펍", "와인"),
+        area_pyeong=20,
+        interior_per_pyeong=1_800_000,
+        equipment=20_000_000,
+        opening_costs=8_000_000,
+        staff=2,
+        overhead=1_800_000,
+        cost_ratio=0.40,
+        avg_price=20_000,
+    ),
+)
+
+# General restaurant profile for sectors no keyword matches
+DEFAULT_SECTOR_PROFILE = SectorProfile(
+    name="일반음식점",
+    keywords=(),
+    area_pyeong=25,
+    interior_per_pyeong=2_000_000,
+    equipment=30_000_000,
+    opening_costs=10_000_000,
+    staff=3,
+    overhead=2_000_000,
+    cost_ratio=0.38,
+    avg_price=12_000,
+)
+
+
+def parse_won(text: str) -> list[int]:
+    """
+    Extract won amounts from Korean text.
+
+    Handles digits with separators and Korean units, including compound
+    amounts and ranges: "30,000,000원", "3천만원", "2.5억", "1억 5천만원" and
+    "18~22만원" are all understood.
+    """
+    text = _SHARED_UNIT_RANGE.sub(r"\1\3\2", text)
+    amounts: list[int] = []
+    last_unit = None
+    last_end = -1
+    for match in _AMOUNT.finditer(text):
+        value = float(match.group(1).replace(",", ""))
+        unit = match.group(2)
+        amount = int(value * _UNITS.get(unit, 1))
+        # "1억 5천만원": a smaller unit right after a larger one continues it
+        if (
+            amounts
+            and last_unit is not None
+            and unit is not None
+            and _UNITS[unit] < _UNITS[last_unit]
+            and not text[last_end : match.start()].strip()
+        ):
+            amounts[-1] += amount
+        else:
+            amounts.append(amount)
+        last_unit = unit
+        last_end = match.end()
+    return amounts
+
+
+def parse_area_pyeong(text: str) -> float | None:
+    """Read a store size in pyeong from text such as "10평(약 33m²)" or "33㎡"."""
+    match = _PYEONG.search(text)
+    if match:
+        return float(match.group(1))
+    match = _SQUARE_METERS.search(text)
+    if match:
+        return float(match.group(1)) / PYEONG_M2
+    return None
+
+
+def parse_rent_per_pyeong(text: str) -> float | None:
+    """
+    Read a monthly rent per pyeong from a market ``avg_rent`` description.
+
+    Understands per-pyeong ("평당 25만원"), per-m² ("㎡당 8만원") and total
+    rents with an area ("월세 300만원(20평 기준)"). Deposits are ignored.
+    """
+    # Keep only the part after "월세" when a deposit is quoted first
+    if "월세" in text:
+        text = text[text.index("월세") :]
+    # Drop area figures so "20평" is not read as an amount
+    without_areas = _PYEONG.sub("", _SQUARE_METERS.sub("", text))
+    amounts = [amount for amount in parse_won(without_areas) if amount >= 1000]
+    if not amounts:
+        return None
+    if _PER_PYEONG.search(text):
+        return float(amounts[0])
+    if _PER_SQUARE_METER.search(text):
+        return amounts[0] * PYEONG_M2
+    area = parse_area_pyeong(text)
+    if area:
+        return amounts[0] / area
+    return None
+
+
+def sector_profile(*texts: str) -> SectorProfile:
+    """Return the profile of the first text that mentions a sector keyword."""
+    for text in texts:
+        for profile in SECTOR_PROFILES:
+            if any(keyword in text for keyword in profile.keywords):
+                return profile
+    return DEFAULT_SECTOR_PROFILE
+
+
+def capital_limit(capital: str, risk_tolerance: str | None) -> int | None:
+    """
+    Initial investment ceiling for a capital range.
+
+    A "Low" risk tolerance plans with the bottom of the range, "High" with
+    the top and anything else with the midpoint.
+    """
+    amounts = parse_won(capital)
+    if not amounts:
+        return None
+    if risk_tolerance == "Low":
+        return min(amounts)
+    if risk_tolerance == "High":
+        return max(amounts)
+    return (min(amounts) + max(amounts)) // 2
+
+
+def area_rents(market_analysis_list: MarketAnalysisList | None) -> dict[str, float]:
+    """Parsed rent per pyeong for every dong that has one."""
+    if market_analysis_list is None:
+        return {}
+    rents = {}
+    for analysis in market_analysis_list.market_analyses:
+        rent = parse_rent_per_pyeong(analysis.avg_rent)
+        if rent is not None:
+            rents[analysis.dong] = rent
+    return rents
+
+
+def item_rent(item: RecommendedItem | RecommendedItemCandidate, rents: dict[str, float]) -> float:
+    """Average rent of the item's recommended dongs, else of all analysed dongs."""
+    matched = [
+        rent
+        for dong, rent in rents.items()
+        if any(dong in area or area in dong for area in item.location_strategy.recommended_areas)
+    ]
+    candidates = matched or list(rents.values())
+    if not candidates:
+        return float(FINANCE_DEFAULT_RENT_PER_PYEONG)
+    return sum(candidates) / len(candidates)
+
+
+def startup_costs(profile: SectorProfile, rent_per_pyeong: float, area: float) -> tuple[int, int]:
+    """Initial investment and monthly fixed costs of a store of ``area`` pyeong."""
+    investment = (
+        round(area * (rent_per_pyeong * FINANCE_DEPOSIT_MONTHS + profile.interior_per_pyeong))
+        + profile.equipment
+        + profile.opening_costs
+    )
+    monthly_fixed_costs = (
+        round(area * rent_per_pyeong) + profile.staff * FINANCE_MONTHLY_WAGE + profile.overhead
+    )
+    return investment, monthly_fixed_costs
+
+
+def _format_manwon(amount: int) -> str:
+    """Format won as "1,234만원" or "1억 2,340만원"."""
+    manwon = round(amount / 10**4)
+    eok, rest = divmod(manwon, 10**4)
+    if eok and rest:
+        return f"{eok}억 {rest:,}만원"
+    if eok:
+        return f"{eok}억원"
+    return f"{rest:,}만원"
+
+
+def financial_plans(
+    project_info: dict,
+    persona_profile: PersonaProfile | None,
+    market_analysis_list: MarketAnalysisList | None,
+    items: list[RecommendedItem],
+    drafts: list[RoadmapDraft],
+) -> list[FinancialPlan]:
+    """
+    Compute the financial plans of a batch of roadmaps.
+
+    The inputs are turned into one column per quantity (area, rent, menu
+    price, ...) and the figures are derived column-wise for all items at once:
+
+    - the store area is the draft's ``estimated_space`` (else the sector
+      default), shrunk so deposit, interior, equipment and opening costs fit
+      the capital limit, but never below ``MIN_AREA_PYEONG``
+    - monthly fixed costs are rent, staff wages and overhead
+    - the break-even revenue covers the fixed costs at the sector's cost
+      ratio, and is also given as daily sales at the average menu price
+
+    If the sector's fixed costs alone exceed the capital, the investment is
+    reported as is rather than clipped.
+    """
+    risk_tolerance = persona_profile.risk_tolerance if persona_profile else None
+    limit = capital_limit(project_info.get("capital", ""), risk_tolerance)
+    rents = area_rents(market_analysis_list)
+
+    profiles = [
+        sector_profile(f"{item.item} {item.concept}", project_info.get("food_sector", ""))
+        for item in items
+    ]
+    rent_per_pyeong = [item_rent(item, rents) for item in items]
+    areas = [
+        parse_area_pyeong(draft.space_planning.estimated_space) or profile.area_pyeong
+        for draft, profile in zip(drafts, profiles)
+    ]
+    prices = [
+        [menu.price for menu in draft.menu_development.signature_menu if menu.price > 0]
+        for draft in drafts
+    ]
+    avg_prices = [
+        sum(menu_prices) / len(menu_prices) if menu_prices else profile.avg_price
+        for menu_prices, profile in zip(prices, profiles)
+    ]
+
+    # Capital spent per pyeong (deposit + interior) and independent of area
+    per_pyeong = [
+        rent * FINANCE_DEPOSIT_MONTHS + profile.interior_per_pyeong
+        for rent, profile in zip(rent_per_pyeong, profiles)
+    ]
+    fixed = [profile.equipment + profile.opening_costs for profile in profiles]
+    if limit is not None:
+        areas = [
+            max(min(area, (limit - base) / cost), MIN_AREA_PYEONG)
+            for area, base, cost in zip(areas, fixed, per_pyeong)
+        ]
+    costs = [
+        startup_costs(profile, rent, area)
+        for profile, rent, area in zip(profiles, rent_per_pyeong, areas)
+    ]
+    revenues = [
+        round(monthly_cost / (1 - profile.cost_ratio))
+        for (_, monthly_cost), profile in zip(costs, profiles)
+    ]
+    daily_sales = [
+        math.ceil(revenue / FINANCE_OPERATING_DAYS / price)
+        for revenue, price in zip(revenues, avg_prices)
+    ]
+
+    return [
+        FinancialPlan(
+            initial_investment=investment,
+            monthly_fixed_costs=monthly_cost,
+            break_even_point=(
+                f"월 매출 {_format_manwon(revenue)} 달성 시 "
+                f"(일 평균 {sales:,}건 판매, 평균 단가 {round(price):,}원, "
+                f"{area:.0f}평·{profile.name} 원가율 {profile.cost_ratio:.0%} 기준)"
+            ),
+            **draft.financial_plan.model_dump(),
+        )
+        for (investment, monthly_cost), revenue, sales, price, area, profile, draft in zip(
+            costs, revenues, daily_sales, avg_prices, areas, profiles, drafts
+        )
+    ]
+
+
+def complete_roadmaps(
+    project_info: dict,
+    persona_profile: PersonaProfile | None,
+    market_analysis_list: MarketAnalysisList | None,
+    items: list[RecommendedItem],
+    drafts: list[RoadmapDraft],
+) -> list[Roadmap]:
+    """Turn roadmap drafts into roadmaps with computed financial plans."""
+    plans = financial_plans(project_info, persona_profile, market_analysis_list, items, drafts)
+    return [
+        Roadmap(**draft.model_dump(exclude={"financial_plan"}), financial_plan=plan)
+        for draft, plan in zip(drafts, plans)
+    ]
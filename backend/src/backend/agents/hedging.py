@@ -0,0 +1,144 @@
+"""Hedged agent calls: fire a backup when the first attempt runs into the tail."""
+
+import asyncio
+import logging
+import math
+import os
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable
+
+from .metrics import hedge_backup_wins, hedge_backups, hedge_calls, hedge_cancelled
+
+logger = logging.getLogger(__name__)
+
+# Comma-separated agent names to hedge; empty disables hedging
+HEDGE_AGENTS = frozenset(filter(None, os.getenv("HEDGE_AGENTS", "").split(",")))
+HEDGE_PERCENTILE = float(os.getenv("HEDGE_PERCENTILE", "95"))
+HEDGE_MIN_SAMPLES = int(os.getenv("HEDGE_MIN_SAMPLES", "20"))
+HEDGE_INITIAL_DELAY_SECONDS = float(os.getenv("HEDGE_INITIAL_DELAY_SECONDS", "60"))
+HEDGE_WINDOW = int(os.getenv("HEDGE_WINDOW", "200"))
+HEDGE_USE_ALTERNATES = os.getenv("HEDGE_USE_ALTERNATES", "true").lower() == "true"
+
+
+class Hedger:
+    """
+    Runs an agent call and, if it is still pending after the agent's hedge
+    delay, races a backup call against it; the first success wins and the
+    loser is cancelled.
+
+    The delay is the configured percentile of the agent's recent latencies,
+    so only calls that are already slower than usual pay for a second
+    attempt. Until enough samples exist a fixed initial delay is used.
+    """
+
+    def __init__(
+        self,
+        agents: frozenset[str] = HEDGE_AGENTS,
+        percentile: float = HEDGE_PERCENTILE,
+        min_samples: int = HEDGE_MIN_SAMPLES,
+        initial_delay: float = HEDGE_INITIAL_DELAY_SECONDS,
+        window: int = HEDGE_WINDOW,
+    ):
+        self.agents = agents
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.initial_delay = initial_delay
+        self.window = window
+        self._latencies: dict[str, deque[float]] = {}
+        self.calls = 0
+        self.hedged = 0
+        self.backup_wins = 0
+        self.cancelled = 0
+
+    def delay(self, agent_name: str) -> float:
+        """Seconds to wait on the first attempt before firing the backup."""
+        samples = self._latencies.get(agent_name)
+        if not samples or len(samples) < self.min_samples:
+            return self.initial_delay
+        ordered = sorted(samples)
+        rank = math.ceil(self.percentile / 100 * len(ordered)) - 1
+        return ordered[min(max(rank, 0), len(ordered) - 1)]
+
+    def _record(self, agent_name: str, seconds: float) -> None:
+        samples = self._latencies.get(agent_name)
+        if samples is None:
+            samples = deque(maxlen=self.window)
+            self._latencies[agent_name] = samples
+        samples.append(seconds)
+
+    async def run(
+        self,
+        agent_name: str,
+        primary: Callable[[], Awaitable[Any]],
+        backup: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """
+        Await ``primary()``, hedging it with ``backup()`` if it is slow.
+
+        Raises:
+            Exception: The primary's error if every attempt failed
+        """
+        if agent_name not in self.agents:
+            return await primary()
+
+        self.calls += 1
+        hedge_calls.inc(agent=agent_name)
+        start = time.perf_counter()
+
+        def on_primary_done(task: asyncio.Task) -> None:
+            # Only completed calls are samples: a cancelled one (hedge loser,
+            # stage deadline, abandoned coalesced call) stopped at an arbitrary
+            # point and would drag the percentile down
+            if not task.cancelled() and task.exception() is None:
+                self._record(agent_name, time.perf_counter() - start)
+
+        primary_task = asyncio.create_task(primary())
+        primary_task.add_done_callback(on_primary_done)
+        backup_task = None
+        try:
+            delay = self.delay(agent_name)
+            done, _ = await asyncio.wait({primary_task}, timeout=delay)
+            if done:
+                return primary_task.result()
+
+            self.hedged += 1
+            hedge_backups.inc(agent=agent_name)
+            logger.info(f"Hedging {agent_name} after {delay:.1f}s")
+            backup_task = asyncio.create_task(backup())
+            pending = {primary_task, backup_task}
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is backup_task:
+                            self.backup_wins += 1
+                            hedge_backup_wins.inc(agent=agent_name)
+                        if pending:
+                            self.cancelled += 1
+                            hedge_cancelled.inc(
+                                agent=agent_name,
+                                attempt="primary" if task is backup_task else "backup",
+                            )
+                        return task.result()
+            if backup_task.exception() is not None:
+                logger.warning(f"Hedged backup for {agent_name} failed: {backup_task.exception()}")
+            return primary_task.result()
+        finally:
+            for task in (primary_task, backup_task):
+                if task is not None:
+                    task.cancel()
+
+    def stats(self) -> dict:
+        """Hedge counters and the current hedge delay per agent."""
+        return {
+            "agents": sorted(self.agents),
+            "calls": self.calls,
+            "hedged": self.hedged,
+            "backup_wins": self.backup_wins,
+            "cancelled": self.cancelled,
+            "delay_seconds": {name: self.delay(name) for name in sorted(self.agents)},
+        }
+
+
+hedger = Hedger()
@@ -0,0 +1,100 @@
+"""Versioned on-disk store of precomputed market analyses per gu."""
+
+import json
+import logging
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+
+from .normalize import normalize_region
+from .schemas import MarketAnalysis, MarketAnalysisList
+
+
+logger = logging.getLogger(__name__)
+
+MARKET_STORE_DIR = os.getenv("MARKET_STORE_DIR", "data/market_store")
+
+_FILE_PREFIX = "market_analyses_"
+
+
+class MarketStore:
+    """
+    Read-only view of the latest precomputed ``MarketAnalysisList`` per gu.
+
+    Each snapshot is one JSON file named ``market_analyses_<version>.json``;
+    versions are UTC timestamps, so the lexicographically last file is the
+    newest.
+    """
+
+    def __init__(self):
+        self.version: str | None = None
+        self._analyses: dict[str, MarketAnalysisList] = {}
+
+    def load_latest(self, directory: str | Path = MARKET_STORE_DIR) -> bool:
+        """
+        Load the newest snapshot in ``directory``.
+
+        Returns:
+            True if a snapshot was loaded, False if none exists
+        """
+        snapshots = sorted(Path(directory).glob(f"{_FILE_PREFIX}*.json"))
+        if not snapshots:
+            logger.info(f"No market store snapshot found in {directory}")
+            return False
+
+        with open(snapshots[-1], "r", encoding="utf-8") as f:
+            snapshot = json.load(f)
+        self._analyses = {
+            normalize_region(region): MarketAnalysisList.model_validate(analyses)
+            for region, analyses in snapshot["regions"].items()
+        }
+        self.version = snapshot["version"]
+        logger.info(f"Loaded market store {self.version} with {len(self._analyses)} regions")
+        return True
+
+    def get(self, region: str) -> MarketAnalysisList | None:
+        """Return the stored ``MarketAnalysisList`` for a region, if any."""
+        return self._analyses.get(normalize_region(region))
+
+    def get_dong(self, region: str, dong: str) -> MarketAnalysis | None:
+        """Return the stored ``MarketAnalysis`` of one dong in a region, if any."""
+        analyses = self.get(region)
+        if analyses is None:
+            return None
+        return next((a for a in analyses.market_analyses if a.dong == dong), None)
+
+    def __len__(self) -> int:
+        return len(self._analyses)
+
+
+def save_snapshot(
+    analyses: dict[str, dict], directory: str | Path = MARKET_STORE_DIR, model: str = ""
+) -> Path:
+    """
+    Write a new versioned snapshot.
+
+    Args:
+        analyses: ``MarketAnalysisList`` dicts keyed by gu
+        directory: Store directory, created if missing
+        model: Model name recorded for provenance
+
+    Returns:
+        Path of the written snapshot
+    """
+    now = datetime.now(timezone.utc)
+    version = now.strftime("%Y%m%dT%H%M%SZ")
+    path = Path(directory)
+    path.mkdir(parents=True, exist_ok=True)
+    snapshot_path = path / f"{_FILE_PREFIX}{version}.json"
+    snapshot = {
+        "version": version,
+        "created_at": now.isoformat(),
+        "model": model,
+        "regions": analyses,
+    }
+    with open(snapshot_path, "w", encoding="utf-8") as f:
+        json.dump(snapshot, f, ensure_ascii=False, indent=2)
+    return snapshot_path
+
+
+market_store = MarketStore()
@@ -0,0 +1,268 @@
+"""
+In-process metrics in the Prometheus text exposition format.
+
+Counters, gauges and histograms are kept in memory per label set and
+rendered on scrape by ``GET /metrics``. Values that already live elsewhere
+(scheduler queues, cache counters) are registered as collectors and read
+at scrape time instead of being mirrored.
+"""
+
+import math
+from typing import Callable, Iterable
+
+
+# Agent call latency in seconds, from a cache-warm flash call to a slow pro roadmap
+LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30, 60, 120, 300, 600)
+TOKEN_BUCKETS = (100, 250, 500, 1000, 2000, 4000, 8000, 16000, 32000)
+
+Labels = tuple[tuple[str, str], ...]
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+def _format_labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    escaped = (
+        (name, value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"'))
+        for name, value in labels
+    )
+    return "{" + ",".join(f'{name}="{value}"' for name, value in escaped) + "}"
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, help: str, labels: tuple[str, ...] = ()):
+        self.name = name
+        self.help = help
+        self.labels = labels
+
+    def _key(self, labels: dict[str, str]) -> Labels:
+        if set(labels) != set(self.labels):
+            raise ValueError(f"{self.name} expects labels {self.labels}, got {tuple(labels)}")
+        return tuple((name, str(labels[name])) for name in self.labels)
+
+    def samples(self) -> Iterable[tuple[str, Labels, float]]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """Monotonic count per label set."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labels: tuple[str, ...] = ()):
+        super().__init__(name, help, labels)
+        self._values: dict[Labels, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+    def samples(self) -> Iterable[tuple[str, Labels, float]]:
+        for key, value in self._values.items():
+            yield self.name, key, value
+
+
+class Gauge(_Metric):
+    """Current value per label set."""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, help: str, labels: tuple[str, ...] = ()):
+        super().__init__(name, help, labels)
+        self._values: dict[Labels, float] = {}
+
+    def set(self, value: float, **labels: str) -> None:
+        self._values[self._key(labels)] = value
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+    def samples(self) -> Iterable[tuple[str, Labels, float]]:
+        for key, value in self._values.items():
+            yield self.name, key, value
+
+
+class Histogram(_Metric):
+    """Bucketed observations, with their sum and count, per label set."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labels: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = LATENCY_BUCKETS,
+    ):
+        super().__init__(name, help, labels)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+        # label set -> (per-bucket counts, sum)
+        self._series: dict[Labels, tuple[list[int], list[float]]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        counts, total = self._series.setdefault(key, ([0] * len(self.buckets), [0.0]))
+        for idx, bound in enumerate(self.buckets):
+            if value <= bound:
+                counts[idx] += 1
+                break
+        total[0] += value
+
+    def samples(self) -> Iterable[tuple[str, Labels, float]]:
+        for key, (counts, total) in self._series.items():
+            cumulative = 0
+            for bound, count in zip(self.buckets, counts):
+                cumulative += count
+                yield f"{self.name}_bucket", key + (("le", _format_value(bound)),), cumulative
+            yield f"{self.name}_sum", key, total[0]
+            yield f"{self.name}_count", key, cumulative
+
+
+class _Collector(_Metric):
+    """Samples read from ``collect()`` at scrape time, as ``(labels, value)`` pairs."""
+
+    def __init__(
+        self,
+        name: str,
+        kind: str,
+        help: str,
+        collect: Callable[[], Iterable[tuple[dict[str, str], float]]],
+    ):
+        super().__init__(name, help)
+        self.kind = kind
+        self.collect = collect
+
+    def samples(self) -> Iterable[tuple[str, Labels, float]]:
+        for labels, value in self.collect():
+            yield self.name, tuple((name, str(label)) for name, label in labels.items()), value
+
+
+class MetricsRegistry:
+    """Named metrics rendered together in the Prometheus text format."""
+
+    def __init__(self):
+        self._metrics: dict[str, _Metric] = {}
+
+    def _register(self, metric: _Metric) -> _Metric:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, help: str, labels: tuple[str, ...] = ()) -> Counter:
+        return self._register(Counter(name, help, labels))
+
+    def gauge(self, name: str, help: str, labels: tuple[str, ...] = ()) -> Gauge:
+        return self._register(Gauge(name, help, labels))
+
+    def histogram(
+        self,
+        name: str,
+        help: str,
+        labels: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = LATENCY_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram(name, help, labels, buckets))
+
+    def collector(
+        self,
+        name: str,
+        kind: str,
+        help: str,
+        collect: Callable[[], Iterable[tuple[dict[str, str], float]]],
+    ) -> None:
+        """Register values read from elsewhere on every scrape."""
+        self._register(_Collector(name, kind, help, collect))
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics.values():
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(
+                f"{name}{_format_labels(labels)} {_format_value(value)}"
+                for name, labels, value in metric.samples()
+            )
+        return "\n".join(lines) + "\n"
+
+
+metrics = MetricsRegistry()
+
+# Agent invocations, one per model call (retries and hedge backups included)
+agent_call_seconds = metrics.histogram(
+    "agent_call_duration_seconds",
+    "Latency of agent model calls, by outcome",
+    labels=("agent", "model", "outcome"),
+)
+agent_input_tokens = metrics.histogram(
+    "agent_input_tokens",
+    "Prompt tokens per agent model call",
+    labels=("agent", "model"),
+    buckets=TOKEN_BUCKETS,
+)
+agent_output_tokens = metrics.histogram(
+    "agent_output_tokens",
+    "Output tokens per agent model call, thinking tokens included",
+    labels=("agent", "model"),
+    buckets=TOKEN_BUCKETS,
+)
+agent_retries = metrics.counter(
+    "agent_output_retries_total",
+    "Agent calls re-invoked after unusable output",
+    labels=("agent",),
+)
+agent_errors = metrics.counter(
+    "agent_errors_total",
+    "Failed agent model calls, by exception type",
+    labels=("agent", "model", "error"),
+)
+
+# Model routing: one decision per routed agent call, one switch per change of route
+router_decisions = metrics.counter(
+    "router_decisions_total",
+    "Routing decisions, by agent and chosen route",
+    labels=("agent", "route", "model"),
+)
+router_switches = metrics.counter(
+    "router_switches_total",
+    "Changes of an agent's route",
+    labels=("agent", "from_route", "to_route"),
+)
+
+# Hedged calls, for agents listed in HEDGE_AGENTS
+hedge_calls = metrics.counter("hedge_calls_total", "Calls of hedged agents", labels=("agent",))
+hedge_backups = metrics.counter(
+    "hedge_backups_total", "Backup calls fired for slow primaries", labels=("agent",)
+)
+hedge_backup_wins = metrics.counter(
+    "hedge_backup_wins_total", "Hedged calls answered by the backup", labels=("agent",)
+)
+hedge_cancelled = metrics.counter(
+    "hedge_cancelled_total",
+    "Losing attempts cancelled once the other answered, by attempt (primary, backup)",
+    labels=("agent", "attempt"),
+)
+
+# Workflows
+workflows_in_flight = metrics.gauge("workflows_in_flight", "Workflows currently running")
+workflow_seconds = metrics.histogram(
+    "workflow_duration_seconds",
+    "End-to-end workflow latency, by outcome (complete, partial, failed, cancelled)",
+    labels=("outcome",),
+)
+stage_seconds = metrics.histogram(
+    "workflow_stage_duration_seconds",
+    "Latency of each workflow stage, by status (ok, timeout, failed)",
+    labels=("stage", "status"),
+)
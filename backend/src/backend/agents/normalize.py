@@ -0,0 +1,69 @@
+"""Input normalization and canonical hashing for cache and dedup keys."""
+
+import hashlib
+import json
+import re
+
+from .schemas import PersonalInfo, ProjectInfo
+
+
+_SEOUL_PREFIX = re.compile(r"^(서울특별시|서울시|서울)\s*")
+_WHITESPACE = re.compile(r"\s+")
+_AMOUNT = re.compile(r"\d[\d,]*")
+
+
+def normalize_region(region: str) -> str:
+    """
+    Reduce a region string to its gu name.
+
+    "서울특별시 강남구", "서울시 강남구", "서울 강남구" and "강남구" all map to "강남구".
+    """
+    region = _WHITESPACE.sub(" ", region.strip())
+    stripped = _SEOUL_PREFIX.sub("", region)
+    return _WHITESPACE.sub("", stripped or region)
+
+
+def normalize_capital(capital: str) -> str:
+    """
+    Reduce a capital string to its amounts.
+
+    "30,000,000원 ~ 50,000,000원" and "30000000원~50000000원" both map to
+    "30000000~50000000". The amounts are kept exact because the item scores
+    and the financial plans are computed from them. Strings without digits
+    are returned whitespace-normalized so they still compare equal to
+    themselves.
+    """
+    amounts = [match.replace(",", "") for match in _AMOUNT.findall(capital)]
+    if not amounts:
+        return _WHITESPACE.sub("", capital)
+    return "~".join(amounts)
+
+
+def normalize_personal_info(personal_info: dict | PersonalInfo) -> dict:
+    """Return the personal info fields in canonical form."""
+    if isinstance(personal_info, PersonalInfo):
+        personal_info = personal_info.model_dump()
+    return {
+        "gender": personal_info["gender"].strip().lower(),
+        "age": int(personal_info["age"]),
+        "mbti": personal_info["mbti"].strip().upper(),
+        "previous_job": _WHITESPACE.sub(" ", personal_info["previous_job"].strip()),
+        "self_employed_experience": bool(personal_info["self_employed_experience"]),
+    }
+
+
+def normalize_project_info(project_info: dict | ProjectInfo) -> dict:
+    """Return the project info fields in canonical form."""
+    if isinstance(project_info, ProjectInfo):
+        project_info = project_info.model_dump()
+    return {
+        "food_sector": _WHITESPACE.sub(" ", project_info["food_sector"].strip()),
+        "region": normalize_region(project_info["region"]),
+        "capital": normalize_capital(project_info["capital"]),
+    }
+
+
+def canonical_hash(*parts) -> str:
+    """Return a stable SHA-256 hex digest of JSON-serializable parts."""
+    payload = json.dumps(parts, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
@@ -0,0 +1,125 @@
+"""Single-pass parsing of agent output with local repair of common JSON defects."""
+
+import logging
+import re
+from typing import TypeVar
+
+from pydantic import BaseModel, ValidationError
+
+
+logger = logging.getLogger(__name__)
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+_CODE_FENCE = re.compile(r"```(?:json|JSON)?\s*(.*?)\s*```", re.DOTALL)
+
+
+class AgentOutputError(ValueError):
+    """Raised when agent output is not valid for its schema, even after repair."""
+
+
+def _strip_trailing_commas(text: str) -> str:
+    """Drop commas directly before ``}`` or ``]``, leaving string contents alone."""
+    out = []
+    in_string = False
+    escaped = False
+    pending_comma = None
+    for ch in text:
+        if in_string:
+            out.append(ch)
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_string = False
+            continue
+        if pending_comma is not None:
+            if ch.isspace():
+                pending_comma.append(ch)
+                continue
+            if ch not in "}]":
+                out.extend(pending_comma)
+            else:
+                # Keep the whitespace, drop the comma
+                out.extend(pending_comma[1:])
+            pending_comma = None
+        if ch == ",":
+            pending_comma = [ch]
+        else:
+            out.append(ch)
+            if ch == '"':
+                in_string = True
+    if pending_comma is not None:
+        out.extend(pending_comma)
+    return "".join(out)
+
+
+def repair_json(text: str) -> str:
+    """
+    Fix the JSON defects LLMs commonly produce.
+
+    Unwraps Markdown code fences, drops prose before the first ``{``/``[``
+    and after the last ``}``/``]``, and removes trailing commas.
+    """
+    fenced = _CODE_FENCE.search(text)
+    if fenced:
+        text = fenced.group(1)
+    starts = [i for i in (text.find("{"), text.find("[")) if i != -1]
+    end = max(text.rfind("}"), text.rfind("]"))
+    if starts and end > min(starts):
+        text = text[min(starts) : end + 1]
+    return _strip_trailing_commas(text)
+
+
+class OutputParser:
+    """
+    Validates agent output straight into its schema and counts repairs.
+
+    ``retries`` is bumped by callers that re-invoke an agent after a failure.
+    """
+
+    def __init__(self):
+        self.parsed = 0
+        self.repaired = 0
+        self.failed = 0
+        self.retries = 0
+
+    def parse(self, text: str, schema: type[ModelT]) -> ModelT:
+        """
+        Validate ``text`` as ``schema`` in one pass, repairing it locally if needed.
+
+        Raises:
+            AgentOutputError: If the text is invalid even after repair
+        """
+        try:
+            result = schema.model_validate_json(text)
+            self.parsed += 1
+            return result
+        except ValidationError as first_error:
+            error = first_error
+        repaired = repair_json(text)
+        if repaired != text:
+            try:
+                result = schema.model_validate_json(repaired)
+                self.repaired += 1
+                logger.info(f"Repaired malformed {schema.__name__} output")
+                return result
+            except ValidationError as repair_error:
+                error = repair_error
+        self.failed += 1
+        raise AgentOutputError(
+            f"Invalid {schema.__name__} output ({error.error_count()} errors): {error.errors()[0]['msg']}"
+        )
+
+    def stats(self) -> dict:
+        """Outputs that parsed directly, needed repair or failed, and retries."""
+        return {
+            "parsed": self.parsed,
+            "repaired": self.repaired,
+            "failed": self.failed,
+            "retries": self.retries,
+        }
+
+
+output_parser = OutputParser()
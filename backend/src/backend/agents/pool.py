@@ -0,0 +1,37 @@
+"""Process-wide Runner pool for agent calls."""
+
+from google.adk.runners import Runner
+from google.adk.sessions import BaseSessionService
+
+from .sessions import APP_NAME, session_manager
+
+
+class RunnerPool:
+    """
+    One Runner per agent, built on first use and shared by all calls.
+
+    A Runner keeps no per-invocation state (that lives in the session and the
+    invocation context), so a single instance safely serves concurrent calls.
+    """
+
+    def __init__(self, session_service: BaseSessionService):
+        self.session_service = session_service
+        self._runners: dict[str, Runner] = {}
+
+    def get(self, agent) -> Runner:
+        """Return the shared Runner for an agent."""
+        runner = self._runners.get(agent.name)
+        if runner is None or runner.agent is not agent:
+            runner = Runner(
+                agent=agent, app_name=APP_NAME, session_service=self.session_service
+            )
+            self._runners[agent.name] = runner
+        return runner
+
+    def warm(self, agents) -> None:
+        """Build the Runners up front, e.g. at app startup."""
+        for agent in agents:
+            self.get(agent)
+
+
+runner_pool = RunnerPool(session_manager.session_service)
@@ -0,0 +1,89 @@
+"""
+Batch job that precomputes market analyses for every dong of every Seoul gu.
+
+Usage:
+    python -m backend.agents.precompute --concurrency 4
+    python -m backend.agents.precompute --regions 강남구 마포구 --output data/market_store
+"""
+
+import argparse
+import asyncio
+import logging
+
+from .agents import QWEN_MODEL
+from .market_store import MARKET_STORE_DIR, save_snapshot
+from .normalize import normalize_region
+from .regions import SEOUL_DISTRICTS
+from .scheduler import Priority, call_client_id, call_priority
+from .workflow import _run_market_analysis_async
+
+
+logger = logging.getLogger(__name__)
+
+
+async def precompute_market_analyses(
+    regions: list[str], concurrency: int
+) -> tuple[dict[str, dict], list[str]]:
+    """
+    Run market_analyst_agent for every dong of each region.
+
+    Args:
+        regions: Canonical gu names
+        concurrency: Maximum number of simultaneous agent calls, across all regions
+
+    Returns:
+        Tuple of (MarketAnalysisList dicts keyed by gu, gu names where every dong failed)
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    # Warmup work yields to interactive submissions in the LLM scheduler
+    call_priority.set(Priority.BATCH)
+    call_client_id.set("precompute")
+
+    async def analyze(region: str) -> dict:
+        dongs = SEOUL_DISTRICTS.get(region) or [""]
+        logger.info(f"Analyzing {len(dongs)} dongs of {region}...")
+        result = await _run_market_analysis_async(region, dongs, semaphore)
+        return result.model_dump()
+
+    results = await asyncio.gather(
+        *(analyze(region) for region in regions), return_exceptions=True
+    )
+
+    analyses: dict[str, dict] = {}
+    failed: list[str] = []
+    for region, result in zip(regions, results):
+        if isinstance(result, Exception):
+            logger.error(f"Market analysis for {region} failed: {result}")
+            failed.append(region)
+        else:
+            analyses[region] = result
+    return analyses, failed
+
+
+def main() -> None:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Precompute market analyses per gu")
+    parser.add_argument(
+        "--regions",
+        nargs="+",
+        default=list(SEOUL_DISTRICTS),
+        help="Gu names to analyze (default: all 25 Seoul gu)",
+    )
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--output", default=MARKET_STORE_DIR)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    regions = [normalize_region(region) for region in args.regions]
+    analyses, failed = asyncio.run(precompute_market_analyses(regions, args.concurrency))
+    if not analyses:
+        raise SystemExit("All market analyses failed; no snapshot written")
+
+    snapshot_path = save_snapshot(analyses, args.output, model=QWEN_MODEL)
+    logger.info(f"Wrote {len(analyses)} regions to {snapshot_path}")
+    if failed:
+        logger.warning(f"Failed regions (served live at request time): {', '.join(failed)}")
+
+
+if __name__ == "__main__":
+    main()
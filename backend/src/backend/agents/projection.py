@@ -0,0 +1,98 @@
+"""Per-agent input projection and compact serialization of agent queries."""
+
+import json
+
+
+# Fields of each input schema that an agent's instruction actually uses.
+# Everything else is dropped before the query is serialized.
+AGENT_INPUTS: dict[str, dict[str, tuple[str, ...]]] = {
+    "profiler_agent": {
+        "PersonalInfo": ("age", "mbti", "previous_job", "self_employed_experience"),
+    },
+    "market_analyst_agent": {
+        "ProjectInfo": ("region",),
+        "MarketAnalysis": ("dong",),
+    },
+    "item_recommender_agent": {
+        "PersonaProfile": (
+            "risk_tolerance",
+            "strengths",
+            "weaknesses",
+            "suitable_business_types",
+        ),
+        "ProjectInfo": ("food_sector", "capital"),
+        "MarketAnalysisList": ("market_analyses",),
+    },
+    "roadmap_architect_agent": {
+        "PersonaProfile": (
+            "persona_summary",
+            "recommended_style",
+            "risk_tolerance",
+            "strengths",
+            "weaknesses",
+        ),
+        "ProjectInfo": ("capital",),
+        "RecommendedItem": (
+            "item",
+            "concept",
+            "reason",
+            "location_strategy",
+            "market_fit_score",
+            "persona_fit_score",
+            "profitability_score",
+        ),
+    },
+    "roadmap_batch_agent": {
+        "PersonaProfile": (
+            "persona_summary",
+            "recommended_style",
+            "risk_tolerance",
+            "strengths",
+            "weaknesses",
+        ),
+        "ProjectInfo": ("capital",),
+        "RecommendedItemList": ("recommended_items",),
+    },
+}
+
+# Roadmap section agents follow the same guidelines as the full roadmap agent
+for _section in (
+    "space_planning",
+    "operation_prep",
+    "financial_plan",
+    "administrative_tasks",
+    "menu_development",
+):
+    AGENT_INPUTS[f"roadmap_{_section}_agent"] = AGENT_INPUTS["roadmap_architect_agent"]
+
+
+def project_inputs(agent_name: str, **inputs: dict) -> dict:
+    """
+    Keep only the declared fields of each input for the given agent.
+
+    Args:
+        agent_name: Name of an agent listed in ``AGENT_INPUTS``
+        **inputs: Input dicts keyed by schema name (e.g. ``PersonaProfile=...``)
+
+    Returns:
+        Dict keyed by schema name with the projected inputs
+
+    Raises:
+        ValueError: If the inputs do not match the agent's declaration
+    """
+    declared = AGENT_INPUTS[agent_name]
+    if set(inputs) != set(declared):
+        raise ValueError(
+            f"{agent_name} expects inputs {sorted(declared)}, got {sorted(inputs)}"
+        )
+    return {
+        schema: {field: inputs[schema][field] for field in fields}
+        for schema, fields in declared.items()
+    }
+
+
+def build_query(agent_name: str, **inputs: dict) -> str:
+    """Project the inputs for an agent and serialize them as minified JSON."""
+    return json.dumps(
+        project_inputs(agent_name, **inputs), ensure_ascii=False, separators=(",", ":")
+    )
@@ -0,0 +1,190 @@
+"""Latency- and error-aware choice of model for each agent call."""
+
+import json
+import logging
+import math
+import os
+import time
+from collections import Counter, deque
+
+from google.adk.agents import Agent
+
+from .agents import MODEL_QUALITY, MODEL_ROUTES
+from .metrics import router_decisions, router_switches
+
+
+logger = logging.getLogger(__name__)
+
+ROUTER_ENABLED = os.getenv("ROUTER_ENABLED", "true").lower() == "true"
+ROUTER_WINDOW_SECONDS = float(os.getenv("ROUTER_WINDOW_SECONDS", "300"))
+ROUTER_MIN_SAMPLES = int(os.getenv("ROUTER_MIN_SAMPLES", "10"))
+ROUTER_MAX_ERROR_RATE = float(os.getenv("ROUTER_MAX_ERROR_RATE", "0.2"))
+# Rolling p95 latency above which an agent's model is considered too slow
+ROUTER_P95_BUDGETS: dict[str, float] = json.loads(
+    os.getenv(
+        "ROUTER_P95_BUDGETS",
+        '{"profiler_agent": 60, "market_analyst_agent": 120, '
+        '"item_recommender_agent": 120, "roadmap_architect_agent": 180, '
+        '"roadmap_batch_agent": 300}',
+    )
+)
+# Lowest MODEL_QUALITY an agent may fall back to, e.g. {"roadmap_architect_agent": 2}
+ROUTER_QUALITY_FLOORS: dict[str, int] = json.loads(os.getenv("ROUTER_QUALITY_FLOORS", "{}"))
+
+
+class _Window:
+    """Recent (timestamp, seconds, ok) samples for one agent variant."""
+
+    def __init__(self, window_seconds: float):
+        self.window_seconds = window_seconds
+        self.samples: deque[tuple[float, float, bool]] = deque()
+
+    def add(self, seconds: float, ok: bool) -> None:
+        self.samples.append((time.monotonic(), seconds, ok))
+        self._prune()
+
+    def _prune(self) -> None:
+        cutoff = time.monotonic() - self.window_seconds
+        while self.samples and self.samples[0][0] < cutoff:
+            self.samples.popleft()
+
+    def summary(self) -> dict:
+        self._prune()
+        latencies = sorted(seconds for _, seconds, _ in self.samples)
+        if not latencies:
+            return {"samples": 0, "p50_seconds": None, "p95_seconds": None, "error_rate": 0.0}
+        errors = sum(1 for _, _, ok in self.samples if not ok)
+        return {
+            "samples": len(latencies),
+            "p50_seconds": latencies[(len(latencies) - 1) // 2],
+            "p95_seconds": latencies[max(math.ceil(0.95 * len(latencies)) - 1, 0)],
+            "error_rate": errors / len(latencies),
+        }
+
+
+class ModelRouter:
+    """
+    Picks which model variant of an agent serves each call.
+
+    An agent's routes are tried in preference order and the first healthy one
+    wins: a route is unhealthy once it has enough recent samples and either
+    its rolling p95 exceeds the agent's budget or its error rate is too high.
+    Routes below the agent's quality floor are never chosen (the default
+    route always stays eligible). If nothing is healthy, the route with the
+    lowest p95 is used. Samples age out of the window, so a route that was
+    abandoned becomes eligible again and is re-measured.
+    """
+
+    def __init__(
+        self,
+        routes: dict[str, tuple[Agent, ...]] = MODEL_ROUTES,
+        quality: dict[str, int] = MODEL_QUALITY,
+        p95_budgets: dict[str, float] = ROUTER_P95_BUDGETS,
+        quality_floors: dict[str, int] = ROUTER_QUALITY_FLOORS,
+        enabled: bool = ROUTER_ENABLED,
+        window_seconds: float = ROUTER_WINDOW_SECONDS,
+        min_samples: int = ROUTER_MIN_SAMPLES,
+        max_error_rate: float = ROUTER_MAX_ERROR_RATE,
+    ):
+        self.routes = routes
+        self.quality = quality
+        self.p95_budgets = p95_budgets
+        self.quality_floors = quality_floors
+        self.enabled = enabled
+        self.window_seconds = window_seconds
+        self.min_samples = min_samples
+        self.max_error_rate = max_error_rate
+        # Stats are kept per variant, so fallbacks are measured separately
+        self._variant_names = {variant.name for variants in routes.values() for variant in variants}
+        self._windows: dict[str, _Window] = {}
+        # Base agent name -> variant name of the latest choice
+        self._last_choice: dict[str, str] = {}
+        self.decisions: Counter[str] = Counter()
+        self.switches: Counter[str] = Counter()
+
+    def _window(self, variant_name: str) -> _Window:
+        window = self._windows.get(variant_name)
+        if window is None:
+            window = _Window(self.window_seconds)
+            self._windows[variant_name] = window
+        return window
+
+    def _unhealthy_reason(self, agent_name: str, variant: Agent) -> str | None:
+        summary = self._window(variant.name).summary()
+        if summary["samples"] < self.min_samples:
+            return None
+        budget = self.p95_budgets.get(agent_name)
+        if budget is not None and summary["p95_seconds"] > budget:
+            return f"p95 {summary['p95_seconds']:.1f}s > {budget:g}s"
+        if summary["error_rate"] > self.max_error_rate:
+            return f"error rate {summary['error_rate']:.0%}"
+        return None
+
+    def choose(self, agent: Agent) -> Agent:
+        """Return the variant of ``agent`` that should serve the next call."""
+        routes = self.routes.get(agent.name)
+        if not self.enabled or not routes:
+            return agent
+
+        floor = self.quality_floors.get(agent.name, 0)
+        eligible = [routes[0]] + [
+            variant
+            for variant in routes[1:]
+            if self.quality.get(variant.canonical_model.model, 0) >= floor
+        ]
+        reasons = []
+        for variant in eligible:
+            reason = self._unhealthy_reason(agent.name, variant)
+            if reason is None:
+                choice = variant
+                break
+            reasons.append(f"{variant.canonical_model.model}: {reason}")
+        else:
+            choice = min(eligible, key=lambda v: self._window(v.name).summary()["p95_seconds"])
+            reasons.append("no healthy route")
+
+        self.decisions[choice.name] += 1
+        router_decisions.inc(
+            agent=agent.name, route=choice.name, model=choice.canonical_model.model
+        )
+        previous = self._last_choice.get(agent.name, routes[0].name)
+        if previous != choice.name:
+            self.switches[agent.name] += 1
+            router_switches.inc(agent=agent.name, from_route=previous, to_route=choice.name)
+            logger.info(
+                f"Routing {agent.name} to {choice.name} on {choice.canonical_model.model} "
+                f"({'; '.join(reasons) or 'recovered'})"
+            )
+        self._last_choice[agent.name] = choice.name
+        return choice
+
+    def record(self, agent: Agent, seconds: float, ok: bool) -> None:
+        """Feed the outcome of a finished call on any routed variant."""
+        if agent.name in self._variant_names:
+            self._window(agent.name).add(seconds, ok)
+
+    def stats(self) -> dict:
+        """Rolling latency/error stats and decision counts per agent and route."""
+        return {
+            "enabled": self.enabled,
+            "agents": {
+                name: {
+                    "current": self._last_choice.get(name, routes[0].name),
+                    "switches": self.switches[name],
+                    "p95_budget_seconds": self.p95_budgets.get(name),
+                    "quality_floor": self.quality_floors.get(name, 0),
+                    "routes": {
+                        variant.name: {
+                            "model": variant.canonical_model.model,
+                            **self._window(variant.name).summary(),
+                            "decisions": self.decisions[variant.name],
+                        }
+                        for variant in routes
+                    },
+                }
+                for name, routes in self.routes.items()
+            },
+        }
+
+
+model_router = ModelRouter()
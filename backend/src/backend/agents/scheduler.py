@@ -0,0 +1,212 @@
+"""Global LLM call scheduler with per-model quotas, priorities and client fairness."""
+
+import asyncio
+import heapq
+import itertools
+import json
+import os
+import time
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import AsyncIterator
+
+
+LLM_DEFAULT_MAX_CONCURRENCY = int(os.getenv("LLM_DEFAULT_MAX_CONCURRENCY", "16"))
+LLM_DEFAULT_TOKENS_PER_MINUTE = int(os.getenv("LLM_DEFAULT_TOKENS_PER_MINUTE", "0"))
+# Per-model overrides, e.g. {"gemini-2.5-pro": {"max_concurrency": 4, "tokens_per_minute": 500000}}
+LLM_MODEL_LIMITS = json.loads(os.getenv("LLM_MODEL_LIMITS", "{}"))
+LLM_OUTPUT_TOKEN_ESTIMATE = int(os.getenv("LLM_OUTPUT_TOKEN_ESTIMATE", "2000"))
+
+
+class Priority(IntEnum):
+    """Scheduling class; lower values are served first."""
+
+    INTERACTIVE = 0
+    BATCH = 1
+
+
+# Set by entry points (API handlers, batch jobs) and inherited by every task
+# they spawn, so agent calls deep in the workflow know who they run for
+call_priority: ContextVar[Priority] = ContextVar("call_priority", default=Priority.INTERACTIVE)
+call_client_id: ContextVar[str] = ContextVar("call_client_id", default="anonymous")
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token estimate for quota accounting before the real usage is known."""
+    return len(text) // 2 + LLM_OUTPUT_TOKEN_ESTIMATE
+
+
+@dataclass
+class ModelLimits:
+    """Quota for one model; ``tokens_per_minute=0`` disables the token bucket."""
+
+    max_concurrency: int = LLM_DEFAULT_MAX_CONCURRENCY
+    tokens_per_minute: int = LLM_DEFAULT_TOKENS_PER_MINUTE
+
+
+@dataclass(order=True)
+class _Waiter:
+    priority: int
+    client_served: int
+    seq: int
+    tokens: int = field(compare=False)
+    client_id: str = field(compare=False)
+    enqueued_at: float = field(compare=False)
+    future: asyncio.Future = field(compare=False)
+
+
+@dataclass
+class _Grant:
+    estimated_tokens: int
+    actual_tokens: int | None = None
+
+
+class _ModelQueue:
+    """Waiters, concurrency slots and token bucket for a single model."""
+
+    def __init__(self, limits: ModelLimits):
+        self.limits = limits
+        self.in_flight = 0
+        self.tokens = float(limits.tokens_per_minute)
+        self.refilled_at = time.monotonic()
+        self.waiters: list[_Waiter] = []
+        self.served: dict[str, int] = {}
+        self.timer: asyncio.TimerHandle | None = None
+
+    def refill(self) -> None:
+        tpm = self.limits.tokens_per_minute
+        if not tpm:
+            return
+        now = time.monotonic()
+        self.tokens = min(tpm, self.tokens + (now - self.refilled_at) * tpm / 60)
+        self.refilled_at = now
+
+    def seconds_until(self, tokens: int) -> float:
+        """Time until the bucket holds ``tokens`` (capped at a full bucket)."""
+        tpm = self.limits.tokens_per_minute
+        needed = min(tokens, tpm) - self.tokens
+        return max(needed, 0) * 60 / tpm
+
+
+class LlmScheduler:
+    """
+    Admission control for every model call in the workflow.
+
+    Each model has a concurrency cap and an optional tokens-per-minute
+    bucket. Waiters are served by priority class first, then by how few
+    calls their client has had so far (so one busy client cannot starve the
+    others), then in arrival order.
+    """
+
+    def __init__(self, model_limits: dict[str, dict] = LLM_MODEL_LIMITS):
+        self._limits = {model: ModelLimits(**limits) for model, limits in model_limits.items()}
+        self._queues: dict[str, _ModelQueue] = {}
+        self._seq = itertools.count()
+        self.wait_count = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def _queue(self, model: str) -> _ModelQueue:
+        queue = self._queues.get(model)
+        if queue is None:
+            queue = _ModelQueue(self._limits.get(model, ModelLimits()))
+            self._queues[model] = queue
+        return queue
+
+    @asynccontextmanager
+    async def slot(self, model: str, estimated_tokens: int) -> AsyncIterator[_Grant]:
+        """
+        Wait for a call slot on ``model`` and hold it for the ``async with`` body.
+
+        The yielded grant can be told the real token usage once known, so the
+        bucket is charged for what the call actually consumed.
+        """
+        queue = self._queue(model)
+        client_id = call_client_id.get()
+        waiter = _Waiter(
+            priority=int(call_priority.get()),
+            client_served=queue.served.get(client_id, 0),
+            seq=next(self._seq),
+            tokens=estimated_tokens,
+            client_id=client_id,
+            enqueued_at=time.monotonic(),
+            future=asyncio.get_running_loop().create_future(),
+        )
+        heapq.heappush(queue.waiters, waiter)
+        self._dispatch(queue)
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # Granted just before the cancellation landed; give it back
+                self._release(queue, waiter.tokens, waiter.tokens)
+            else:
+                queue.waiters.remove(waiter)
+                heapq.heapify(queue.waiters)
+            raise
+
+        grant = _Grant(waiter.tokens)
+        try:
+            yield grant
+        finally:
+            self._release(queue, waiter.tokens, grant.actual_tokens)
+
+    def _dispatch(self, queue: _ModelQueue) -> None:
+        """Grant slots to waiters at the head of the queue while quota allows."""
+        queue.refill()
+        while queue.waiters and queue.in_flight < queue.limits.max_concurrency:
+            head = queue.waiters[0]
+            if queue.limits.tokens_per_minute and queue.tokens < min(
+                head.tokens, queue.limits.tokens_per_minute
+            ):
+                if queue.timer is None:
+                    queue.timer = asyncio.get_running_loop().call_later(
+                        queue.seconds_until(head.tokens), self._on_timer, queue
+                    )
+                return
+            heapq.heappop(queue.waiters)
+            queue.in_flight += 1
+            queue.tokens -= head.tokens
+            queue.served[head.client_id] = queue.served.get(head.client_id, 0) + 1
+            waited = time.monotonic() - head.enqueued_at
+            self.wait_count += 1
+            self.wait_seconds_total += waited
+            self.wait_seconds_max = max(self.wait_seconds_max, waited)
+            head.future.set_result(None)
+
+    def _on_timer(self, queue: _ModelQueue) -> None:
+        queue.timer = None
+        self._dispatch(queue)
+
+    def _release(self, queue: _ModelQueue, estimated: int, actual: int | None) -> None:
+        queue.in_flight -= 1
+        if actual is not None:
+            # Settle the estimate against real usage; the bucket may go negative
+            queue.tokens -= actual - estimated
+        if not queue.in_flight and not queue.waiters:
+            # Forget per-client counts once idle so they do not grow forever
+            queue.served.clear()
+        self._dispatch(queue)
+
+    def stats(self) -> dict:
+        """Queue depth, in-flight calls and wait times per model."""
+        return {
+            "wait_count": self.wait_count,
+            "wait_seconds_mean": self.wait_seconds_total / self.wait_count if self.wait_count else 0.0,
+            "wait_seconds_max": self.wait_seconds_max,
+            "models": {
+                model: {
+                    "queue_depth": len(queue.waiters),
+                    "in_flight": queue.in_flight,
+                    "max_concurrency": queue.limits.max_concurrency,
+                    "tokens_per_minute": queue.limits.tokens_per_minute,
+                    "tokens_available": int(queue.tokens) if queue.limits.tokens_per_minute else None,
+                }
+                for model, queue in self._queues.items()
+            },
+        }
+
+
+llm_scheduler = LlmScheduler()
@@ -61,6 +61,21 @@ class LocationStrategy(BaseModel):
     accessibility_notes: str = Field(description="접근성 메모")
 
 
+class RecommendedItemCandidate(BaseModel):
+    """LLM이 제안하는 추천 아이템 후보 (점수는 scoring 모듈이 계산)."""
+
+    item: str = Field(description="아이템명")
+    concept: str = Field(description="콘셉트")
+    reason: str = Field(description="선정 이유")
+    location_strategy: LocationStrategy = Field(description="입지 전략")
+
+
+class RecommendedItemCandidateList(BaseModel):
+    """추천 아이템 후보 리스트."""
+
+    candidates: list[RecommendedItemCandidate] = Field(default_factory=list, description="추천 아이템 후보 리스트")
+
+
 class RecommendedItem(BaseModel):
     """추천 창업 아이템."""
 
@@ -114,6 +129,15 @@ class FinancialPlan(BaseModel):
     )
 
 
+class FinancialPlanDraft(BaseModel):
+    """자금 계획 중 LLM이 작성하는 항목 (수치 항목은 finance 모듈이 계산)."""
+
+    funding_sources: list[str] = Field(description="자금 조달 방안")
+    policy_funds: list[PolicyFund] = Field(
+        default_factory=list, description="정책자금 목록"
+    )
+
+
 class AdministrativeTasks(BaseModel):
     """행정 및 인허가."""
 
@@ -151,12 +175,45 @@ class Roadmap(BaseModel):
     menu_development: MenuDevelopment = Field(description="메뉴 개발")
 
 
+class RoadmapDraft(BaseModel):
+    """LLM이 생성하는 로드맵 (자금 계획 수치 제외)."""
+
+    item: str = Field(description="아이템명")
+    space_planning: SpacePlanning = Field(description="공간 기획")
+    operation_prep: OperationPreparation = Field(description="운영 준비")
+    financial_plan: FinancialPlanDraft = Field(description="자금 계획 (서술 항목)")
+    administrative_tasks: AdministrativeTasks = Field(description="행정 및 인허가")
+    menu_development: MenuDevelopment = Field(description="메뉴 개발")
+
+
+class RoadmapDraftList(BaseModel):
+    """로드맵 초안 리스트 (일괄 생성용)."""
+
+    roadmaps: list[RoadmapDraft] = Field(default_factory=list, description="아이템별 로드맵 리스트")
+
+
+class StageIssue(BaseModel):
+    """완료되지 못한 워크플로우 단계."""
+
+    stage: Literal["persona_profile", "market_analysis", "recommended_items", "roadmap"] = Field(
+        description="단계 이름"
+    )
+    status: Literal["timeout", "failed", "skipped"] = Field(
+        description="timeout: 마감 시간 초과, failed: 오류, skipped: 선행 단계 미완료로 건너뜀"
+    )
+    item: str | None = Field(default=None, description="로드맵 단계의 대상 아이템명")
+    detail: str = Field(default="", description="상세 사유")
+
+
 class FinalReport(BaseModel):
     """최종 보고서."""
 
     executive_summary: str = Field(description="요약")
-    persona_profile: PersonaProfile = Field(description="창업자 페르소나")
-    market_analysis: MarketAnalysis = Field(description="시장 분석")
-    recommended_items: list[RecommendedItem] = Field(description="추천 아이템 TOP 3")
-    roadmaps: list[Roadmap] = Field(description="상세 로드맵")
+    persona_profile: PersonaProfile | None = Field(default=None, description="창업자 페르소나 (미완료 시 null)")
+    market_analysis: MarketAnalysis | None = Field(default=None, description="시장 분석 (미완료 시 null)")
+    recommended_items: list[RecommendedItem] = Field(default_factory=list, description="추천 아이템 TOP 3")
+    roadmaps: list[Roadmap] = Field(default_factory=list, description="상세 로드맵 (완료된 것만)")
+    incomplete_stages: list[StageIssue] = Field(
+        default_factory=list, description="완료되지 못한 단계 (비어 있으면 전체 완료)"
+    )
 
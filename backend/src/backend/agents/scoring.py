@@ -0,0 +1,209 @@
+"""
+Local fit scores for recommended item candidates.
+
+The item recommender only proposes candidates; ``market_fit_score``,
+``persona_fit_score`` and ``profitability_score`` are computed here in one
+batch over all candidates, so they are stable between runs and the
+candidates can be ranked and pruned before any roadmap is generated.
+"""
+
+import os
+import re
+
+from .finance import (
+    area_rents,
+    capital_limit,
+    item_rent,
+    sector_profile,
+    startup_costs,
+)
+from .schemas import (
+    MarketAnalysis,
+    MarketAnalysisList,
+    PersonaProfile,
+    RecommendedItem,
+    RecommendedItemCandidate,
+)
+
+
+# Candidates kept after ranking, i.e. the items that get roadmaps
+RECOMMEND_TOP_K = int(os.getenv("RECOMMEND_TOP_K", "3"))
+
+# Feature weights of each score; every feature is in [0, 1]
+MARKET_FIT_WEIGHTS = {"trends": 0.4, "opportunities": 0.35, "traffic": 0.25}
+PERSONA_FIT_WEIGHTS = {"business_types": 0.35, "strengths": 0.3, "risk": 0.35}
+PROFITABILITY_WEIGHTS = {"affordability": 0.5, "rent_level": 0.3, "rent_share": 0.2}
+
+_WORD = re.compile(r"[0-9A-Za-z가-힣]+")
+
+
+def _bigrams(text: str) -> set[str]:
+    """Character bigrams of every word (whole words when shorter), for fuzzy Korean matching."""
+    grams = set()
+    for word in _WORD.findall(text.lower()):
+        if len(word) < 2:
+            grams.add(word)
+            continue
+        grams.update(word[i : i + 2] for i in range(len(word) - 1))
+    return grams
+
+
+def _phrase_grams(phrases: list[str]) -> list[set[str]]:
+    """Bigrams of each phrase, skipping phrases without any."""
+    return [grams for grams in map(_bigrams, phrases) if grams]
+
+
+def _coverage(phrase_grams: list[set[str]], text_grams: set[str]) -> float:
+    """Mean share of each phrase's bigrams found in the text; 0 with no phrases."""
+    if not phrase_grams:
+        return 0.0
+    return sum(len(grams & text_grams) / len(grams) for grams in phrase_grams) / len(phrase_grams)
+
+
+def _target_analysis(
+    candidate: RecommendedItemCandidate, analyses: list[MarketAnalysis]
+) -> MarketAnalysis | None:
+    """The analysed dong the candidate targets, else the first analysed dong."""
+    targets = " ".join([candidate.item, *candidate.location_strategy.recommended_areas])
+    for analysis in analyses:
+        if analysis.dong in targets:
+            return analysis
+    return analyses[0] if analyses else None
+
+
+def _weighted(columns: dict[str, list[float]], weights: dict[str, float]) -> list[float]:
+    """Weighted sum of feature columns, scaled to a 0-100 score per row."""
+    rows = zip(*(columns[name] for name in weights))
+    total = sum(weights.values())
+    return [
+        round(100 * sum(w * v for w, v in zip(weights.values(), row)) / total, 1) for row in rows
+    ]
+
+
+def score_items(
+    persona_profile: PersonaProfile,
+    project_info: dict,
+    market_analysis_list: MarketAnalysisList,
+    candidates: list[RecommendedItemCandidate],
+) -> list[RecommendedItem]:
+    """
+    Score every candidate and return them as recommended items.
+
+    Features are computed as one column per feature over all candidates:
+
+    - market fit: how much of the target dong's trends, opportunities and
+      foot traffic / demographics the candidate's text addresses
+    - persona fit: overlap with the persona's suitable business types,
+      recommended style and strengths, and how well the candidate's
+      reliance on emerging trends suits the risk tolerance
+    - profitability: how much of the startup cost at the sector's default
+      store size the capital covers, the dong's rent relative to the
+      cheapest candidate's, and the rent's share of monthly fixed costs
+    """
+    if not candidates:
+        return []
+    analyses = market_analysis_list.market_analyses
+    targets = [_target_analysis(candidate, analyses) for candidate in candidates]
+    # Phrase bigrams are shared by every candidate targeting the same dong
+    trend_grams = {a.dong: _phrase_grams(a.emerging_trends) for a in analyses}
+    opportunity_grams = {a.dong: _phrase_grams(a.market_opportunities) for a in analyses}
+    traffic_grams = {a.dong: _phrase_grams([a.foot_traffic, a.demographics]) for a in analyses}
+    texts = [
+        _bigrams(f"{candidate.item} {candidate.concept} {candidate.reason}")
+        for candidate in candidates
+    ]
+    location_texts = [
+        grams | _bigrams(" ".join(candidate.location_strategy.location_criteria))
+        for grams, candidate in zip(texts, candidates)
+    ]
+
+    # Market features
+    trends = [
+        _coverage(trend_grams[target.dong], grams) if target else 0.0
+        for target, grams in zip(targets, texts)
+    ]
+    market_columns = {
+        "trends": trends,
+        "opportunities": [
+            _coverage(opportunity_grams[target.dong], grams) if target else 0.0
+            for target, grams in zip(targets, texts)
+        ],
+        "traffic": [
+            _coverage(traffic_grams[target.dong], grams) if target else 0.0
+            for target, grams in zip(targets, location_texts)
+        ],
+    }
+
+    # Persona features: a Low risk tolerance favours proven concepts, High
+    # favours trend plays and Medium a balance of both
+    risk_fit = {
+        "Low": lambda novelty: 1 - novelty,
+        "Medium": lambda novelty: 1 - abs(novelty - 0.5),
+        "High": lambda novelty: novelty,
+    }[persona_profile.risk_tolerance]
+    business_type_grams = _phrase_grams(
+        persona_profile.suitable_business_types + persona_profile.recommended_style
+    )
+    strength_grams = _phrase_grams(persona_profile.strengths)
+    persona_columns = {
+        "business_types": [_coverage(business_type_grams, grams) for grams in texts],
+        "strengths": [_coverage(strength_grams, grams) for grams in texts],
+        "risk": [risk_fit(novelty) for novelty in trends],
+    }
+
+    # Profitability features, from the same cost model as the financial plan
+    limit = capital_limit(project_info.get("capital", ""), persona_profile.risk_tolerance)
+    rents = area_rents(market_analysis_list)
+    rent_per_pyeong = [item_rent(candidate, rents) for candidate in candidates]
+    profiles = [
+        sector_profile(f"{candidate.item} {candidate.concept}", project_info.get("food_sector", ""))
+        for candidate in candidates
+    ]
+    costs = [
+        startup_costs(profile, rent, profile.area_pyeong)
+        for profile, rent in zip(profiles, rent_per_pyeong)
+    ]
+    cheapest = min(rent_per_pyeong)
+    profitability_columns = {
+        "affordability": [
+            min(limit / investment, 1.0) if limit else 0.5 for investment, _ in costs
+        ],
+        "rent_level": [cheapest / rent if rent else 1.0 for rent in rent_per_pyeong],
+        "rent_share": [
+            1 - profile.area_pyeong * rent / monthly_cost
+            for profile, rent, (_, monthly_cost) in zip(profiles, rent_per_pyeong, costs)
+        ],
+    }
+
+    # Candidates are already validated and the scores are in range by
+    # construction, so the items are built without re-validating
+    return [
+        RecommendedItem.model_construct(
+            **dict(candidate),
+            market_fit_score=market_fit,
+            persona_fit_score=persona_fit,
+            profitability_score=profitability,
+        )
+        for candidate, market_fit, persona_fit, profitability in zip(
+            candidates,
+            _weighted(market_columns, MARKET_FIT_WEIGHTS),
+            _weighted(persona_columns, PERSONA_FIT_WEIGHTS),
+            _weighted(profitability_columns, PROFITABILITY_WEIGHTS),
+        )
+    ]
+
+
+def rank_items(items: list[RecommendedItem], top_k: int = RECOMMEND_TOP_K) -> list[RecommendedItem]:
+    """Keep the ``top_k`` items with the highest total score, dropping repeated names."""
+    ranked = sorted(
+        items,
+        key=lambda item: item.market_fit_score + item.persona_fit_score + item.profitability_score,
+        reverse=True,
+    )
+    seen = set()
+    kept = []
+    for item in ranked:
+        if item.item not in seen:
+            seen.add(item.item)
+            kept.append(item)
+    return kept[:top_k]
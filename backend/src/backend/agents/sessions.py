@@ -0,0 +1,97 @@
+"""Per-invocation agent sessions over a pluggable session store."""
+
+import asyncio
+import logging
+import os
+import time
+import uuid
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from google.adk.sessions import (
+    BaseSessionService,
+    DatabaseSessionService,
+    InMemorySessionService,
+)
+
+
+logger = logging.getLogger(__name__)
+
+SESSION_BACKEND = os.getenv("SESSION_BACKEND", "memory")
+SESSION_DB_PATH = os.getenv("SESSION_DB_PATH", "sessions.sqlite3")
+SESSION_TTL_SECONDS = int(os.getenv("SESSION_TTL_SECONDS", "3600"))
+
+APP_NAME = "codyssey"
+USER_ID = "workflow_user"
+
+
+def create_session_service(backend: str = SESSION_BACKEND) -> BaseSessionService:
+    """
+    Build the session store.
+
+    Args:
+        backend: "memory" or "sqlite"
+    """
+    if backend == "memory":
+        return InMemorySessionService()
+    if backend == "sqlite":
+        return DatabaseSessionService(db_url=f"sqlite:///{SESSION_DB_PATH}")
+    raise ValueError(f"Unknown session backend: {backend}")
+
+
+class SessionManager:
+    """
+    Hands out one fresh session per agent invocation and deletes it afterwards.
+
+    Isolated sessions keep an agent's prompt free of other agents' turns.
+    ``prune`` removes sessions orphaned by crashes (relevant for the SQLite
+    store, which outlives the process).
+    """
+
+    def __init__(self, session_service: BaseSessionService, ttl_seconds: int = SESSION_TTL_SECONDS):
+        self.session_service = session_service
+        self.ttl_seconds = ttl_seconds
+
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator[str]:
+        """Create a session for a single agent call and yield its id."""
+        session_id = uuid.uuid4().hex
+        await self.session_service.create_session(
+            app_name=APP_NAME, user_id=USER_ID, session_id=session_id
+        )
+        try:
+            yield session_id
+        finally:
+            await self.session_service.delete_session(
+                app_name=APP_NAME, user_id=USER_ID, session_id=session_id
+            )
+
+    async def prune(self) -> int:
+        """
+        Delete sessions not updated within the TTL.
+
+        Returns:
+            Number of sessions deleted
+        """
+        cutoff = time.time() - self.ttl_seconds
+        response = await self.session_service.list_sessions(app_name=APP_NAME, user_id=USER_ID)
+        expired = [s for s in response.sessions if s.last_update_time < cutoff]
+        for expired_session in expired:
+            await self.session_service.delete_session(
+                app_name=APP_NAME, user_id=USER_ID, session_id=expired_session.id
+            )
+        if expired:
+            logger.info(f"Pruned {len(expired)} expired sessions")
+        return len(expired)
+
+    async def prune_forever(self) -> None:
+        """Prune expired sessions at least once a minute until cancelled."""
+        while True:
+            try:
+                await self.prune()
+            except Exception as e:
+                logger.error(f"Session pruning failed: {str(e)}")
+            await asyncio.sleep(min(max(self.ttl_seconds, 1), 60))
+
+
+session_manager = SessionManager(create_session_service())
@@ -0,0 +1,86 @@
+"""In-flight request coalescing for identical agent invocations."""
+
+import asyncio
+from typing import Any, Awaitable, Callable
+
+
+class SingleFlight:
+    """
+    Share one execution among concurrent callers with the same key.
+
+    The first caller for a key starts the work as a task; later callers await
+    the same task until it finishes. Waiters are shielded, so a caller that
+    gets cancelled (e.g. a disconnected client) does not cancel the work for
+    everyone else. Once the last waiter is gone the work is cancelled too,
+    so an abandoned model call stops holding its scheduler slot and spending
+    tokens, unless the call was started ``detach``-ed because its result is
+    kept beyond its callers (e.g. written to a cache).
+    """
+
+    def __init__(self):
+        self._in_flight: dict[str, asyncio.Task] = {}
+        self._waiters: dict[asyncio.Task, int] = {}
+        self._detached: set[asyncio.Task] = set()
+        self.calls = 0
+        self.executions = 0
+        self.coalesced = 0
+        self.abandoned = 0
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]], detach: bool = False) -> Any:
+        """
+        Run ``fn()`` for ``key`` unless an identical call is already running.
+
+        With ``detach``, the work runs to completion even if every caller
+        waiting on it is cancelled.
+        """
+        self.calls += 1
+        task = self._in_flight.get(key)
+        if task is None:
+            self.executions += 1
+            task = asyncio.create_task(fn())
+            self._in_flight[key] = task
+            self._waiters[task] = 0
+            task.add_done_callback(lambda done: self._forget(key, done))
+        else:
+            self.coalesced += 1
+        if detach:
+            self._detached.add(task)
+        self._waiters[task] += 1
+        try:
+            return await asyncio.shield(task)
+        finally:
+            self._leave(key, task)
+
+    def _leave(self, key: str, task: asyncio.Task) -> None:
+        waiters = self._waiters.get(task)
+        if waiters is None:
+            return
+        self._waiters[task] = waiters - 1
+        if waiters == 1 and not task.done() and task not in self._detached:
+            self.abandoned += 1
+            # New callers for the key start afresh instead of joining a cancelled call
+            if self._in_flight.get(key) is task:
+                del self._in_flight[key]
+            task.cancel()
+
+    def _forget(self, key: str, task: asyncio.Task) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        self._waiters.pop(task, None)
+        self._detached.discard(task)
+        # Mark the exception as retrieved in case every waiter was cancelled
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> dict:
+        """Return call, execution, coalescing and abandonment counters."""
+        return {
+            "calls": self.calls,
+            "executions": self.executions,
+            "coalesced": self.coalesced,
+            "abandoned": self.abandoned,
+            "in_flight": len(self._in_flight),
+        }
+
+
+agent_calls = SingleFlight()
@@ -0,0 +1,270 @@
+"""
+Offline stand-in model for running the workflow without Bedrock or Gemini keys.
+
+``StubLlm`` answers every agent with a canned, schema-valid payload after a
+sampled latency, and can be told to fail a share of its calls. Set
+``LLM_BACKEND=stub`` to swap it in for every agent at import time, or call
+``install_stub_llm`` from a benchmark to configure it directly.
+
+Latency distributions (``STUB_LATENCY_DISTRIBUTION``), each scaled by
+``STUB_LATENCY_SECONDS`` and shaped by ``STUB_LATENCY_SHAPE``:
+
+- ``fixed``:     always the base latency
+- ``uniform``:   base latency ± ``shape`` as a fraction of it
+- ``lognormal``: median at the base latency, ``shape`` is sigma
+- ``pareto``:    base latency times a Pareto factor, ``shape`` is alpha
+  (lower is heavier-tailed), capped at ``PARETO_CAP`` times the base
+
+With ``STUB_TOKENS_PER_SECOND`` set, every call also takes its output
+tokens at that decoding rate, so longer outputs are slower.
+"""
+
+import asyncio
+import json
+import os
+import random
+from collections import defaultdict
+from functools import lru_cache
+from typing import AsyncGenerator, Iterable
+
+import litellm
+from google.adk.agents import Agent
+from google.adk.models.base_llm import BaseLlm
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+from google.genai import types
+
+from .scoring import RECOMMEND_TOP_K
+
+
+STUB_LATENCY_DISTRIBUTION = os.getenv("STUB_LATENCY_DISTRIBUTION", "lognormal")
+STUB_LATENCY_SECONDS = float(os.getenv("STUB_LATENCY_SECONDS", "1.0"))
+STUB_LATENCY_SHAPE = float(os.getenv("STUB_LATENCY_SHAPE", "0.5"))
+STUB_TOKENS_PER_SECOND = float(os.getenv("STUB_TOKENS_PER_SECOND", "0"))
+# Share of calls cut off mid-JSON, and of calls that raise instead of answering
+STUB_TRUNCATE_RATE = float(os.getenv("STUB_TRUNCATE_RATE", "0"))
+STUB_ERROR_RATE = float(os.getenv("STUB_ERROR_RATE", "0"))
+
+# Longest Pareto sample, in multiples of the base latency
+PARETO_CAP = 50.0
+
+
+PERSONA_PROFILE = {
+    "persona_summary": "마케팅 경험을 갖춘 실행형 창업자",
+    "recommended_style": ["트렌디", "체계적"],
+    "risk_tolerance": "Medium",
+    "strengths": ["시장 이해", "고객 확보"],
+    "weaknesses": ["재무 관리"],
+    "suitable_business_types": ["카페", "디저트"],
+}
+
+MARKET_ANALYSIS = {
+    "dong": "역삼동",
+    "demographics": "20-30대 직장인 중심",
+    "avg_rent": "평당 25만원",
+    "foot_traffic": "평일 점심 집중",
+    "emerging_trends": ["건강식", "테이크아웃"],
+    "market_opportunities": ["점심 특화 메뉴"],
+}
+
+ITEM_CANDIDATE_LIST = {
+    "candidates": [
+        {
+            "item": f"테스트 아이템 {idx}",
+            "concept": concept,
+            "reason": "점심 유동인구가 많음",
+            "location_strategy": {
+                "recommended_areas": ["역삼동"],
+                "location_criteria": ["역세권"],
+                "accessibility_notes": "지하철역 도보 5분",
+            },
+        }
+        for idx, concept in enumerate(
+            [
+                "직장인 대상 테이크아웃 전문점",
+                "건강식 점심 특화 샐러드 카페",
+                "트렌디한 디저트 카페",
+                "테이크아웃 커피 전문점",
+                "점심 특화 메뉴 도시락",
+                "동네 베이커리",
+            ],
+            start=1,
+        )
+    ]
+}
+
+ROADMAP = {
+    "item": "테스트 아이템",
+    "space_planning": {
+        "interior_concept": "미니멀",
+        "signage_ideas": ["네온 간판"],
+        "estimated_space": "15평",
+    },
+    "operation_prep": {
+        "suppliers": ["원두 도매상"],
+        "equipment_list": ["에스프레소 머신"],
+        "packaging_ideas": ["친환경 컵"],
+        "staffing_plan": "점주 1명, 아르바이트 2명",
+    },
+    "financial_plan": {
+        "funding_sources": ["자기자본"],
+        "policy_funds": [],
+    },
+    "administrative_tasks": {
+        "required_licenses": ["영업신고증"],
+        "registration_steps": ["사업자 등록"],
+        "required_education": ["위생교육"],
+        "estimated_timeline": "1개월",
+    },
+    "menu_development": {
+        "signature_menu": [
+            {"name": "시그니처 라떼", "price": 5500, "description": "대표 메뉴"}
+        ],
+        "pricing_strategy": "중가 전략",
+        "menu_diversity": "커피 + 디저트",
+        "seasonal_items": [],
+    },
+}
+
+# Canned response per output schema name
+PAYLOADS = {
+    "PersonaProfile": PERSONA_PROFILE,
+    "MarketAnalysis": MARKET_ANALYSIS,
+    "RecommendedItemCandidateList": ITEM_CANDIDATE_LIST,
+    "RoadmapDraft": ROADMAP,
+    "RoadmapDraftList": {"roadmaps": [ROADMAP] * RECOMMEND_TOP_K},
+    "SpacePlanning": ROADMAP["space_planning"],
+    "OperationPreparation": ROADMAP["operation_prep"],
+    "FinancialPlanDraft": ROADMAP["financial_plan"],
+    "AdministrativeTasks": ROADMAP["administrative_tasks"],
+    "MenuDevelopment": ROADMAP["menu_development"],
+}
+
+
+# Tokens seen per response schema, i.e. per workflow stage: the whole prompt,
+# just the user query (prompt minus system instruction) and the response.
+# Only filled by stubs installed with record_tokens=True, so a server running
+# on the stub does not keep a record of every call
+PROMPT_TOKENS: dict[str, list[int]] = defaultdict(list)
+QUERY_TOKENS: dict[str, list[int]] = defaultdict(list)
+OUTPUT_TOKENS: dict[str, list[int]] = defaultdict(list)
+
+
+class StubLlmError(RuntimeError):
+    """Injected model failure, standing in for a provider error."""
+
+
+@lru_cache(maxsize=1024)
+def _count_tokens(text: str) -> int:
+    """Approximate token count with litellm's default tokenizer."""
+    return litellm.token_counter(text=text)
+
+
+def _contents_text(llm_request: LlmRequest) -> str:
+    parts = []
+    for content in llm_request.contents:
+        parts.extend(part.text or "" for part in content.parts or [])
+    return "\n".join(parts)
+
+
+def _payload(schema_name: str, query: str) -> dict:
+    """The canned payload, echoing the dong or item names the query asks for."""
+    payload = PAYLOADS[schema_name]
+    try:
+        inputs = json.loads(query)
+    except ValueError:
+        return payload
+    if schema_name == "MarketAnalysis":
+        dong = inputs.get("MarketAnalysis", {}).get("dong")
+        return {**payload, "dong": dong} if dong else payload
+    if schema_name == "RoadmapDraft":
+        item = inputs.get("RecommendedItem", {}).get("item")
+        return {**payload, "item": item} if item else payload
+    if schema_name == "RoadmapDraftList":
+        items = inputs.get("RecommendedItemList", {}).get("recommended_items", [])
+        if items:
+            return {"roadmaps": [{**ROADMAP, "item": item.get("item", "")} for item in items]}
+    return payload
+
+
+class StubLlm(BaseLlm):
+    """
+    Returns a canned, schema-valid payload after a sampled latency.
+
+    ``truncate_rate`` of the responses are cut off mid-JSON, like a
+    generation that hit its output limit, and ``error_rate`` of the calls
+    raise ``StubLlmError`` instead of answering. Defaults come from the
+    ``STUB_*`` environment variables. With ``record_tokens``, every answered
+    call's token counts are appended to ``PROMPT_TOKENS``, ``QUERY_TOKENS``
+    and ``OUTPUT_TOKENS`` for benchmarks to read.
+    """
+
+    model: str = "stub"
+    distribution: str = STUB_LATENCY_DISTRIBUTION
+    latency: float = STUB_LATENCY_SECONDS
+    shape: float = STUB_LATENCY_SHAPE
+    tokens_per_second: float = STUB_TOKENS_PER_SECOND
+    truncate_rate: float = STUB_TRUNCATE_RATE
+    error_rate: float = STUB_ERROR_RATE
+    record_tokens: bool = False
+
+    def sample_latency(self, output_tokens: int) -> float:
+        """Seconds to wait before answering a response of ``output_tokens``."""
+        if self.distribution == "fixed":
+            seconds = self.latency
+        elif self.distribution == "uniform":
+            seconds = self.latency * random.uniform(1 - self.shape, 1 + self.shape)
+        elif self.distribution == "lognormal":
+            seconds = self.latency * random.lognormvariate(0, self.shape)
+        elif self.distribution == "pareto":
+            seconds = self.latency * min(random.paretovariate(self.shape), PARETO_CAP)
+        else:
+            raise ValueError(f"Unknown stub latency distribution: {self.distribution}")
+        if self.tokens_per_second:
+            seconds += output_tokens / self.tokens_per_second
+        return max(seconds, 0.0)
+
+    async def generate_content_async(
+        self, llm_request: LlmRequest, stream: bool = False
+    ) -> AsyncGenerator[LlmResponse, None]:
+        schema_name = llm_request.config.response_schema.__name__
+        query = _contents_text(llm_request)
+        text = json.dumps(_payload(schema_name, query), ensure_ascii=False)
+        query_tokens = _count_tokens(query)
+        prompt_tokens = query_tokens + _count_tokens(
+            str(llm_request.config.system_instruction or "")
+        )
+        output_tokens = _count_tokens(text)
+        await asyncio.sleep(self.sample_latency(output_tokens))
+        if random.random() < self.error_rate:
+            raise StubLlmError(f"Injected {self.model} failure for {schema_name}")
+        if self.record_tokens:
+            PROMPT_TOKENS[schema_name].append(prompt_tokens)
+            QUERY_TOKENS[schema_name].append(query_tokens)
+            OUTPUT_TOKENS[schema_name].append(output_tokens)
+        if random.random() < self.truncate_rate:
+            text = text[: len(text) // 2]
+        yield LlmResponse(
+            content=types.Content(role="model", parts=[types.Part(text=text)]),
+            usage_metadata=types.GenerateContentResponseUsageMetadata(
+                prompt_token_count=prompt_tokens,
+                candidates_token_count=output_tokens,
+                total_token_count=prompt_tokens + output_tokens,
+            ),
+        )
+
+
+def install_stub_llm(agents: Iterable[Agent] | None = None, **settings) -> None:
+    """
+    Swap each agent's model for a StubLlm configured with ``settings``.
+
+    The stub keeps the name of the model it replaces, so the scheduler's
+    per-model limits and the router's statistics behave as with the real
+    models. Defaults to every workflow agent and routed variant.
+    """
+    if agents is None:
+        from .agents import AGENT_VARIANTS, WORKFLOW_AGENTS
+
+        agents = WORKFLOW_AGENTS + AGENT_VARIANTS
+    for agent in agents:
+        agent.model = StubLlm(model=agent.canonical_model.model, **settings)
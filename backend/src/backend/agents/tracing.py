@@ -0,0 +1,182 @@
+"""
+Optional per-request workflow traces in the Chrome trace-event format.
+
+A ``Trace`` collects timed spans for the workflow, each stage, each agent
+call and its scheduler wait, model round-trip and output parsing, plus the
+local scoring and finance steps. It is carried in a context variable, so
+every task the workflow starts records into the trace of the request that
+started it, on its own row (one ``tid`` per asyncio task). Without an
+active trace, spans cost a context variable lookup.
+
+Finished traces are kept in memory for ``GET /api/debug/traces/{trace_id}``
+and, with ``TRACE_DIR`` set, written there as ``<trace_id>.json`` from a
+worker thread, off the event loop; both load directly in ``chrome://tracing`` or Perfetto.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+import uuid
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Iterator
+
+
+logger = logging.getLogger(__name__)
+
+# Share of submissions traced without asking; X-Trace: 1 traces one explicitly
+TRACE_SAMPLE_RATE = float(os.getenv("TRACE_SAMPLE_RATE", "0"))
+TRACE_MAX_STORED = int(os.getenv("TRACE_MAX_STORED", "100"))
+# Directory finished traces are written to; empty keeps them in memory only
+TRACE_DIR = os.getenv("TRACE_DIR", "")
+
+
+class Trace:
+    """Spans of one request, as Chrome trace complete events."""
+
+    def __init__(self, name: str):
+        self.id = uuid.uuid4().hex
+        self.name = name
+        self.created_at = time.time()
+        self._origin = time.perf_counter()
+        self._events: list[dict] = []
+        self._lanes: weakref.WeakKeyDictionary[asyncio.Task, int] = weakref.WeakKeyDictionary()
+        self._lane_count = 0
+
+    def _lane(self) -> int:
+        """Row of the current asyncio task, numbered in order of first use; 0 outside tasks."""
+        try:
+            task = asyncio.current_task()
+        except RuntimeError:
+            task = None
+        if task is None:
+            return 0
+        lane = self._lanes.get(task)
+        if lane is None:
+            self._lane_count += 1
+            lane = self._lanes[task] = self._lane_count
+        return lane
+
+    def record(self, name: str, category: str, start: float, end: float, **args) -> None:
+        """Add a span between two ``time.perf_counter()`` readings."""
+        self._events.append(
+            {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": round((start - self._origin) * 1e6),
+                "dur": round((end - start) * 1e6),
+                "pid": 1,
+                "tid": self._lane(),
+                "args": {key: value for key, value in args.items() if value is not None},
+            }
+        )
+
+    def chrome(self) -> dict:
+        """The trace as a Chrome trace-event JSON object."""
+        metadata = [{"name": "process_name", "ph": "M", "pid": 1, "args": {"name": self.name}}]
+        metadata.extend(
+            {"name": "thread_name", "ph": "M", "pid": 1, "tid": lane, "args": {"name": f"task {lane}"}}
+            for lane in sorted({event["tid"] for event in self._events})
+        )
+        return {
+            "traceEvents": metadata + sorted(self._events, key=lambda event: event["ts"]),
+            "displayTimeUnit": "ms",
+            "otherData": {"trace_id": self.id, "created_at": self.created_at},
+        }
+
+
+current_trace: ContextVar[Trace | None] = ContextVar("current_trace", default=None)
+
+
+@contextmanager
+def span(name: str, category: str = "workflow", **args) -> Iterator[None]:
+    """Record the enclosed block as a span of the active trace, if any."""
+    trace = current_trace.get()
+    if trace is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    except BaseException as e:
+        args["error"] = type(e).__name__
+        raise
+    finally:
+        trace.record(name, category, start, time.perf_counter(), **args)
+
+
+def record_span(name: str, category: str, start: float, end: float, **args) -> None:
+    """Record a span measured by the caller, e.g. one that ends inside a context manager."""
+    trace = current_trace.get()
+    if trace is not None:
+        trace.record(name, category, start, end, **args)
+
+
+class TraceStore:
+    """The most recent finished traces, optionally also written to disk."""
+
+    def __init__(self, maxsize: int = TRACE_MAX_STORED, directory: str = TRACE_DIR):
+        self.maxsize = maxsize
+        self.directory = Path(directory) if directory else None
+        self._traces: OrderedDict[str, dict] = OrderedDict()
+        self._pending: set[asyncio.Future] = set()
+        if self.directory is not None:
+            self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="trace-store")
+
+    def add(self, trace: Trace) -> None:
+        chrome = trace.chrome()
+        self._traces[trace.id] = chrome
+        while len(self._traces) > self.maxsize:
+            self._traces.popitem(last=False)
+        if self.directory is None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._write(trace.id, chrome)
+            return
+        future = loop.run_in_executor(self._writer, self._write, trace.id, chrome)
+        self._pending.add(future)
+        future.add_done_callback(self._pending.discard)
+
+    def _write(self, trace_id: str, chrome: dict) -> None:
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            (self.directory / f"{trace_id}.json").write_text(json.dumps(chrome))
+        except OSError as e:
+            logger.warning(f"Could not write trace {trace_id}: {str(e)}")
+
+    def get(self, trace_id: str) -> dict | None:
+        return self._traces.get(trace_id)
+
+    def ids(self) -> list[str]:
+        """Stored trace ids, newest first."""
+        return list(reversed(self._traces))
+
+
+trace_store = TraceStore()
+
+
+@contextmanager
+def traced(trace: Trace | None) -> Iterator[Trace | None]:
+    """
+    Make ``trace`` the active trace for the enclosed block and store it when
+    the block exits. ``None`` traces nothing, so callers can pass the result
+    of a sampling decision straight in.
+    """
+    if trace is None:
+        yield None
+        return
+    token = current_trace.set(trace)
+    try:
+        yield trace
+    finally:
+        current_trace.reset(token)
+        trace_store.add(trace)
@@ -0,0 +1,338 @@
+"""
+Per-request token and cost accounting.
+
+A ``UsageLedger`` sums the prompt and output tokens reported by every agent
+model call of one request, per agent and model, and prices them with
+``LLM_MODEL_PRICES``. Like traces, the ledger is carried in a context
+variable, so calls made by every task the workflow starts are charged to
+the request that started it. Retries and hedge backups are charged like
+any other call; calls cancelled before answering report no usage. Results
+served from a cache cost nothing, and a coalesced agent call is charged to
+the request that started it.
+
+Finished records are logged and, unless ``USAGE_BACKEND=none``, stored in
+SQLite at ``USAGE_DB_PATH`` with one row per agent and model, for
+``GET /api/usage/stats`` and offline analysis. Writes run in a worker
+thread so they never block the event loop. Usage reported after a record
+was finished (a cached call that outlived its request) updates the stored
+record.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Iterator
+
+from pydantic import BaseModel, Field
+
+from .agents import GEMINI_FLASH_MODEL, GEMINI_PRO_MODEL, QWEN_MODEL
+
+
+logger = logging.getLogger(__name__)
+
+USAGE_BACKEND = os.getenv("USAGE_BACKEND", "sqlite")
+USAGE_DB_PATH = os.getenv("USAGE_DB_PATH", "data/usage.sqlite3")
+
+# USD per million tokens; LLM_MODEL_PRICES overrides or adds models, e.g.
+# {"gemini-2.5-pro": {"input": 1.25, "output": 10.0}}
+DEFAULT_MODEL_PRICES = {
+    QWEN_MODEL: {"input": 0.22, "output": 0.88},
+    GEMINI_FLASH_MODEL: {"input": 0.30, "output": 2.50},
+    GEMINI_PRO_MODEL: {"input": 1.25, "output": 10.00},
+}
+LLM_MODEL_PRICES = {**DEFAULT_MODEL_PRICES, **json.loads(os.getenv("LLM_MODEL_PRICES", "{}"))}
+
+
+class AgentUsage(BaseModel):
+    """에이전트·모델별 토큰 사용량과 비용."""
+
+    agent: str = Field(description="에이전트 이름")
+    model: str = Field(description="모델 이름")
+    calls: int = Field(description="모델 호출 수 (재시도, 헤지 백업 포함)")
+    input_tokens: int = Field(description="입력 토큰 수")
+    output_tokens: int = Field(description="출력 토큰 수")
+    cost_usd: float = Field(description="추정 비용 (USD, 단가 미등록 모델은 0)")
+
+
+class RequestUsage(BaseModel):
+    """요청 하나의 토큰 사용량과 비용."""
+
+    usage_id: str = Field(description="사용량 기록 ID")
+    endpoint: str = Field(description="요청 종류 (submit, submit_stream, job, market_dong)")
+    created_at: float = Field(description="요청 시각 (epoch)")
+    calls: int = Field(default=0, description="모델 호출 수")
+    input_tokens: int = Field(default=0, description="입력 토큰 수")
+    output_tokens: int = Field(default=0, description="출력 토큰 수")
+    cost_usd: float = Field(default=0.0, description="추정 비용 (USD)")
+    agents: list[AgentUsage] = Field(
+        default_factory=list, description="에이전트·모델별 내역 (비용 내림차순)"
+    )
+
+
+def model_cost(model: str, input_tokens: int, output_tokens: int) -> float:
+    """Price of one call's tokens in USD; 0 for models without a price."""
+    prices = LLM_MODEL_PRICES.get(model)
+    if prices is None:
+        return 0.0
+    return (input_tokens * prices["input"] + output_tokens * prices["output"]) / 1_000_000
+
+
+class UsageLedger:
+    """Token usage of one request, per agent and model."""
+
+    def __init__(self, endpoint: str):
+        self.id = uuid.uuid4().hex
+        self.endpoint = endpoint
+        self.created_at = time.time()
+        self.closed = False
+        # (agent, model) -> [calls, input tokens, output tokens]
+        self._entries: dict[tuple[str, str], list[int]] = {}
+
+    def record(self, agent: str, model: str, input_tokens: int, output_tokens: int) -> None:
+        entry = self._entries.setdefault((agent, model), [0, 0, 0])
+        entry[0] += 1
+        entry[1] += input_tokens
+        entry[2] += output_tokens
+        if self.closed:
+            logger.info(f"Late usage for {self.id}: {agent} on {model}")
+            usage_store.save(self.report())
+
+    def report(self) -> RequestUsage:
+        agents = sorted(
+            (
+                AgentUsage(
+                    agent=agent,
+                    model=model,
+                    calls=calls,
+                    input_tokens=input_tokens,
+                    output_tokens=output_tokens,
+                    cost_usd=model_cost(model, input_tokens, output_tokens),
+                )
+                for (agent, model), (calls, input_tokens, output_tokens) in self._entries.items()
+            ),
+            key=lambda usage: usage.cost_usd,
+            reverse=True,
+        )
+        return RequestUsage(
+            usage_id=self.id,
+            endpoint=self.endpoint,
+            created_at=self.created_at,
+            calls=sum(usage.calls for usage in agents),
+            input_tokens=sum(usage.input_tokens for usage in agents),
+            output_tokens=sum(usage.output_tokens for usage in agents),
+            cost_usd=sum(usage.cost_usd for usage in agents),
+            agents=agents,
+        )
+
+
+current_usage: ContextVar[UsageLedger | None] = ContextVar("current_usage", default=None)
+
+
+def record_usage(agent: str, model: str, input_tokens: int, output_tokens: int) -> None:
+    """Charge one model call to the active request's ledger, if any."""
+    ledger = current_usage.get()
+    if ledger is not None:
+        ledger.record(agent, model, input_tokens, output_tokens)
+
+
+def usage_header(usage: RequestUsage) -> str:
+    """Compact totals for the ``X-Usage`` response header."""
+    return (
+        f"input_tokens={usage.input_tokens}, output_tokens={usage.output_tokens}, "
+        f"cost_usd={usage.cost_usd:.6f}"
+    )
+
+
+class UsageStore:
+    """
+    SQLite log of request usage, one row per request and per agent and model.
+
+    An empty ``path`` disables storage: nothing is written and lookups find
+    nothing.
+    """
+
+    def __init__(self, path: str):
+        self._lock = threading.Lock()
+        self._conn = None
+        self._pending: set[asyncio.Future] = set()
+        if not path:
+            return
+        # One writer thread, so a late update is never overwritten by the record it updates
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="usage-store")
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS usage_requests ("
+            "usage_id TEXT PRIMARY KEY, endpoint TEXT NOT NULL, created_at REAL NOT NULL, "
+            "calls INTEGER NOT NULL, input_tokens INTEGER NOT NULL, "
+            "output_tokens INTEGER NOT NULL, cost_usd REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS usage_agents ("
+            "usage_id TEXT NOT NULL, agent TEXT NOT NULL, model TEXT NOT NULL, "
+            "calls INTEGER NOT NULL, input_tokens INTEGER NOT NULL, "
+            "output_tokens INTEGER NOT NULL, cost_usd REAL NOT NULL, "
+            "PRIMARY KEY (usage_id, agent, model))"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS usage_requests_created_at ON usage_requests (created_at)"
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self._conn is not None
+
+    def save(self, usage: RequestUsage) -> None:
+        """Store ``usage`` in a worker thread, or inline outside an event loop."""
+        if self._conn is None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.add(usage)
+            return
+        future = loop.run_in_executor(self._writer, self.add, usage)
+        self._pending.add(future)
+        future.add_done_callback(self._pending.discard)
+
+    def add(self, usage: RequestUsage) -> None:
+        """Insert or replace ``usage``; blocking."""
+        if self._conn is None:
+            return
+        try:
+            with self._lock:
+                self._conn.execute("BEGIN")
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO usage_requests VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        usage.usage_id,
+                        usage.endpoint,
+                        usage.created_at,
+                        usage.calls,
+                        usage.input_tokens,
+                        usage.output_tokens,
+                        usage.cost_usd,
+                    ),
+                )
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO usage_agents VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    [
+                        (
+                            usage.usage_id,
+                            agent.agent,
+                            agent.model,
+                            agent.calls,
+                            agent.input_tokens,
+                            agent.output_tokens,
+                            agent.cost_usd,
+                        )
+                        for agent in usage.agents
+                    ],
+                )
+                self._conn.execute("COMMIT")
+        except sqlite3.Error as e:
+            if self._conn.in_transaction:
+                self._conn.execute("ROLLBACK")
+            logger.warning(f"Could not store usage {usage.usage_id}: {str(e)}")
+
+    def get(self, usage_id: str) -> RequestUsage | None:
+        if self._conn is None:
+            return None
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT usage_id, endpoint, created_at, calls, input_tokens, output_tokens, "
+                "cost_usd FROM usage_requests WHERE usage_id = ?",
+                (usage_id,),
+            ).fetchone()
+            if row is None:
+                return None
+            agents = self._conn.execute(
+                "SELECT agent, model, calls, input_tokens, output_tokens, cost_usd "
+                "FROM usage_agents WHERE usage_id = ? ORDER BY cost_usd DESC",
+                (usage_id,),
+            ).fetchall()
+        return RequestUsage(
+            **dict(zip(RequestUsage.model_fields, row)),
+            agents=[AgentUsage(**dict(zip(AgentUsage.model_fields, agent))) for agent in agents],
+        )
+
+    def stats(self, since: float = 0.0) -> dict:
+        """Totals of the requests stored since ``since`` (epoch), per agent and model by cost."""
+        if self._conn is None:
+            return {"enabled": False}
+        with self._lock:
+            requests, calls, input_tokens, output_tokens, cost_usd = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(calls), 0), COALESCE(SUM(input_tokens), 0), "
+                "COALESCE(SUM(output_tokens), 0), COALESCE(SUM(cost_usd), 0) "
+                "FROM usage_requests WHERE created_at >= ?",
+                (since,),
+            ).fetchone()
+            agents = self._conn.execute(
+                "SELECT agent, model, SUM(a.calls), SUM(a.input_tokens), "
+                "SUM(a.output_tokens), SUM(a.cost_usd) AS cost "
+                "FROM usage_agents a JOIN usage_requests r USING (usage_id) "
+                "WHERE r.created_at >= ? GROUP BY agent, model ORDER BY cost DESC",
+                (since,),
+            ).fetchall()
+        return {
+            "enabled": True,
+            "requests": requests,
+            "calls": calls,
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "cost_usd": cost_usd,
+            "mean_cost_usd": cost_usd / requests if requests else 0.0,
+            "agents": [AgentUsage(**dict(zip(AgentUsage.model_fields, agent))) for agent in agents],
+        }
+
+
+def create_usage_store(backend: str = USAGE_BACKEND, path: str = USAGE_DB_PATH) -> UsageStore:
+    """
+    Build the usage store.
+
+    Args:
+        backend: "sqlite" or "none"
+        path: SQLite database file (sqlite backend only)
+    """
+    if backend == "none":
+        return UsageStore("")
+    if backend == "sqlite":
+        return UsageStore(path)
+    raise ValueError(f"Unknown usage backend: {backend}")
+
+
+usage_store = create_usage_store()
+
+
+@contextmanager
+def metered(endpoint: str) -> Iterator[UsageLedger]:
+    """
+    Charge the model calls of the enclosed block to a new ledger, then log
+    its usage record and store it when the block exits, even on failure.
+    """
+    ledger = UsageLedger(endpoint)
+    token = current_usage.set(ledger)
+    try:
+        yield ledger
+    finally:
+        current_usage.reset(token)
+        ledger.closed = True
+        usage = ledger.report()
+        top = usage.agents[0] if usage.agents else None
+        logger.info(
+            f"Usage {usage.usage_id} ({endpoint}): {usage.calls} calls, "
+            f"{usage.input_tokens} input + {usage.output_tokens} output tokens, "
+            f"${usage.cost_usd:.4f}"
+            + (f"; costliest {top.agent} on {top.model} ${top.cost_usd:.4f}" if top else "")
+        )
+        usage_store.save(usage)
@@ -1,44 +1,127 @@
 """Workflow orchestration for the multi-agent system."""
 
 import asyncio
-import json
+import logging
+import os
+import time
+from contextlib import aclosing
+from typing import AsyncIterator
 
 from google.genai import types
-from google.adk.runners import Runner
-from google.adk.sessions import InMemorySessionService
+from pydantic import BaseModel
 
+from .cache import Cache, market_cache, persona_cache, workflow_cache
+from .finance import complete_roadmaps
+from .hedging import HEDGE_USE_ALTERNATES, hedger
+from .market_store import market_store
+from .metrics import (
+    agent_call_seconds,
+    agent_errors,
+    agent_input_tokens,
+    agent_output_tokens,
+    agent_retries,
+    stage_seconds,
+    workflow_seconds,
+    workflows_in_flight,
+)
+from .normalize import (
+    canonical_hash,
+    normalize_personal_info,
+    normalize_project_info,
+    normalize_region,
+)
+from .output import AgentOutputError, ModelT, output_parser
+from .pool import runner_pool
+from .projection import build_query
+from .regions import focus_dongs
+from .router import model_router
+from .scheduler import estimate_tokens, llm_scheduler
+from .scoring import rank_items, score_items
+from .sessions import USER_ID, session_manager
+from .singleflight import agent_calls
+from .tracing import record_span, span
+from .usage import record_usage
 from .agents import (
+    HEDGE_ALTERNATES,
+    ROADMAP_SECTION_AGENTS,
     profiler_agent,
     market_analyst_agent,
     item_recommender_agent,
     roadmap_architect_agent,
+    roadmap_batch_agent,
 )
 from .schemas import (
     PersonalInfo,
     ProjectInfo,
     Roadmap,
+    RoadmapDraft,
     PersonaProfile,
     MarketAnalysis,
+    MarketAnalysisList,
     RecommendedItem,
+    RecommendedItemList,
     FinalReport,
+    StageIssue,
 )
 
 
-APP_NAME = "codyssey"
+logger = logging.getLogger(__name__)
+
+# Per-stage deadlines, each capped by what is left of the workflow deadline
+WORKFLOW_DEADLINE_SECONDS = float(os.getenv("WORKFLOW_DEADLINE_SECONDS", "900"))
+PERSONA_DEADLINE_SECONDS = float(os.getenv("PERSONA_DEADLINE_SECONDS", "180"))
+MARKET_DEADLINE_SECONDS = float(os.getenv("MARKET_DEADLINE_SECONDS", "300"))
+RECOMMEND_DEADLINE_SECONDS = float(os.getenv("RECOMMEND_DEADLINE_SECONDS", "300"))
+ROADMAP_DEADLINE_SECONDS = float(os.getenv("ROADMAP_DEADLINE_SECONDS", "420"))
+# "per_item": one roadmap_architect_agent call per item, run in parallel;
+# "sections": per item, the five section agents run in parallel;
+# "batch": a single roadmap_batch_agent call for all items
+ROADMAP_MODE = os.getenv("ROADMAP_MODE", "per_item")
+# Dongs analysed per submission, and how many of them run at once
+MARKET_DONGS_PER_REQUEST = int(os.getenv("MARKET_DONGS_PER_REQUEST", "3"))
+MARKET_MAX_CONCURRENCY = int(os.getenv("MARKET_MAX_CONCURRENCY", "4"))
+# Re-invocations allowed when output stays invalid after local repair
+AGENT_OUTPUT_RETRIES = int(os.getenv("AGENT_OUTPUT_RETRIES", "1"))
 
 
-def _extract_final_response(events) -> dict:
-    """Extract the final JSON response from agent events."""
+def _extract_final_response(events, schema: type[ModelT]) -> ModelT:
+    """Validate the agent's final response straight into its output schema."""
     for event in events:
         if event.is_final_response() and event.content:
-            final_answer = event.content.parts[0].text.strip()
-            return json.loads(final_answer)
-    raise ValueError("No final response found in events")
+            final_answer = "".join(part.text or "" for part in event.content.parts or [])
+            return output_parser.parse(final_answer, schema)
+    raise AgentOutputError("No final response found in events")
+
+
+def _total_tokens(events) -> int | None:
+    """Sum the reported token usage over agent events, if any was reported."""
+    counts = [
+        event.usage_metadata.total_token_count
+        for event in events
+        if event.usage_metadata and event.usage_metadata.total_token_count
+    ]
+    return sum(counts) if counts else None
+
+
+def _token_usage(events) -> tuple[int, int]:
+    """
+    Prompt and output tokens reported over agent events.
+    
+    Gemini reports thinking tokens apart from the candidates and bills them
+    as output, so they are counted as output tokens here.
+    """
+    prompt_tokens = output_tokens = 0
+    for event in events:
+        usage = event.usage_metadata
+        if usage:
+            prompt_tokens += usage.prompt_token_count or 0
+            output_tokens += (usage.candidates_token_count or 0) + (usage.thoughts_token_count or 0)
+    return prompt_tokens, output_tokens
 
 
 def _generate_executive_summary(
-    persona: PersonaProfile,
-    market: MarketAnalysis,
+    persona: PersonaProfile | None,
+    market: MarketAnalysis | None,
     items: list[RecommendedItem],
     roadmaps: list[Roadmap],
 ) -> str:
@@ -73,34 +156,428 @@ def _generate_executive_summary(
     return summary
 
 
-async def _run_agent_async(
+async def _run_agent_async(agent, query: str, dedup_key: str | None = None) -> BaseModel:
+    """
+    Run a single agent asynchronously and return parsed result.
+    
+    Concurrent calls to the same agent with the same ``dedup_key`` (the query
+    hash by default) share one LLM invocation, which is cancelled once all of
+    them have given up. Agents listed for hedging get a backup call if the
+    first one runs unusually long.
+    """
+    if dedup_key is None:
+        dedup_key = canonical_hash(query)
+    return await agent_calls.do(
+        f"{agent.name}:{dedup_key}",
+        lambda: _invoke_hedged(agent, query),
+    )
+
+
+async def _invoke_hedged(agent, query: str) -> BaseModel:
+    """
+    Invoke the agent on the model the router picks, racing a backup (on the
+    hedge alternate model if any) against stragglers.
+    """
+    routed_agent = model_router.choose(agent)
+    backup_agent = HEDGE_ALTERNATES.get(agent.name, routed_agent) if HEDGE_USE_ALTERNATES else routed_agent
+    return await hedger.run(
+        agent.name,
+        lambda: _invoke_agent(routed_agent, query),
+        lambda: _invoke_agent(backup_agent, query),
+    )
+
+
+async def _invoke_agent(agent, query: str) -> BaseModel:
+    """
+    Invoke the agent and validate its final response into its output schema.
+    
+    Output that is malformed even after local repair is retried up to
+    ``AGENT_OUTPUT_RETRIES`` times; other errors are raised immediately.
+    """
+    for attempt in range(AGENT_OUTPUT_RETRIES + 1):
+        try:
+            return await _invoke_agent_once(agent, query)
+        except AgentOutputError as e:
+            if attempt == AGENT_OUTPUT_RETRIES:
+                raise
+            output_parser.retries += 1
+            agent_retries.inc(agent=agent.name)
+            logger.warning(f"Retrying {agent.name} after unusable output: {str(e)}")
+
+
+async def _invoke_agent_once(agent, query: str) -> BaseModel:
+    """
+    Invoke the agent through a Runner and parse its final response.
+    
+    Each invocation gets its own short-lived session, so an agent's prompt
+    never carries turns from the other agents in the workflow. The outcome
+    feeds the model router's latency and error statistics; cancelled calls
+    (hedge losers, deadlines) are not counted. Latency, token usage and
+    errors are also recorded in the agent metrics, the tokens charged to the
+    active usage ledger, and the call, its scheduler wait, model round-trip
+    and parsing as spans of the active trace.
+    """
+    runner = runner_pool.get(agent)
+    content = types.Content(role="user", parts=[types.Part(text=query)])
+    model = agent.canonical_model.model
+    estimated_tokens = estimate_tokens(str(agent.instruction) + query)
+    start = time.perf_counter()
+    try:
+        # Every model call waits for a slot in the global scheduler, which
+        # enforces per-model concurrency and token quotas across all requests
+        async with llm_scheduler.slot(model, estimated_tokens) as grant:
+            granted = time.perf_counter()
+            record_span("queue wait", "scheduler", start, granted, model=model)
+            async with session_manager.session() as session_id:
+                # Consume the async event stream so the LLM round-trip yields to
+                # the event loop and concurrent agent calls actually overlap
+                events_list = [
+                    event
+                    async for event in runner.run_async(
+                        user_id=USER_ID, session_id=session_id, new_message=content
+                    )
+                ]
+            record_span("model call", "model", granted, time.perf_counter(), model=model)
+            grant.actual_tokens = _total_tokens(events_list)
+        prompt_tokens, output_tokens = _token_usage(events_list)
+        if prompt_tokens or output_tokens:
+            agent_input_tokens.observe(prompt_tokens, agent=agent.name, model=model)
+            agent_output_tokens.observe(output_tokens, agent=agent.name, model=model)
+        record_usage(agent.name, model, prompt_tokens, output_tokens)
+        with span("parse output", "parse", schema=agent.output_schema.__name__):
+            result = _extract_final_response(events_list, agent.output_schema)
+    except Exception as e:
+        end = time.perf_counter()
+        model_router.record(agent, end - start, ok=False)
+        agent_call_seconds.observe(end - start, agent=agent.name, model=model, outcome="error")
+        agent_errors.inc(agent=agent.name, model=model, error=type(e).__name__)
+        record_span(agent.name, "agent", start, end, model=model, error=type(e).__name__)
+        raise
+    end = time.perf_counter()
+    model_router.record(agent, end - start, ok=True)
+    agent_call_seconds.observe(end - start, agent=agent.name, model=model, outcome="ok")
+    record_span(agent.name, "agent", start, end, model=model)
+    return result
+
+
+async def _run_agent_cached(
+    cache: Cache | None,
+    key: str,
     agent,
     query: str,
-    session_service: InMemorySessionService,
-    user_id: str,
-    session_id: str,
-) -> dict:
-    """Run a single agent asynchronously and return parsed result."""
-    runner = Runner(agent=agent, app_name=APP_NAME, session_service=session_service)
-    content = types.Content(role="user", parts=[types.Part(text=query)])
-    events = runner.run(user_id=user_id, session_id=session_id, new_message=content)
-    # Convert iterator to list to ensure all events are collected
-    events_list = list(events)
-    return _extract_final_response(events_list)
+) -> BaseModel:
+    """
+    Run an agent unless a fresh result for ``key`` is already cached.
+    
+    The result is stored from inside the shared call, which is detached so it
+    runs on and is still cached when every waiter gave up on it (e.g. after
+    a stage deadline). Uncached calls are cancelled in that case instead.
+    """
+    if cache is None:
+        return await _run_agent_async(agent, query, dedup_key=key)
+    cached = await cache.aget(key)
+    if cached is not None:
+        return agent.output_schema.model_validate_json(cached)
+    
+    async def invoke_and_store() -> BaseModel:
+        result = await _invoke_hedged(agent, query)
+        await cache.aset(key, result.model_dump_json())
+        return result
+    
+    return await agent_calls.do(f"{agent.name}:{key}", invoke_and_store, detach=True)
 
 
-async def run_workflow_async(
+def _market_analyst_query(region: str, dong: str) -> str:
+    """Build the market analyst query for one dong of a canonical gu."""
+    return build_query(
+        market_analyst_agent.name, ProjectInfo={"region": region}, MarketAnalysis={"dong": dong}
+    )
+
+
+async def run_dong_analysis_async(region: str, dong: str) -> MarketAnalysis:
+    """
+    Return the MarketAnalysis of one dong in a canonical region.
+    
+    Precomputed snapshots are served first, then the stage cache, and only
+    then is market_analyst_agent called. An empty ``dong`` lets the agent
+    pick the region's main commercial dong.
+    """
+    stored = market_store.get_dong(region, dong)
+    if stored is not None:
+        return stored
+    return await _run_agent_cached(
+        market_cache,
+        canonical_hash(region, dong),
+        market_analyst_agent,
+        _market_analyst_query(region, dong),
+    )
+
+
+async def _run_market_analysis_async(
+    region: str, dongs: list[str], semaphore: asyncio.Semaphore | None = None
+) -> MarketAnalysisList:
+    """
+    Analyse ``dongs`` of a canonical region and collect them into one list.
+    
+    Each dong is its own call (map), bounded by ``semaphore``; the results
+    are gathered in ``dongs`` order (reduce). Dongs that fail are left out.
+    
+    Raises:
+        Exception: The first dong's error if every dong failed
+    """
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(MARKET_MAX_CONCURRENCY)
+    
+    async def analyze(dong: str) -> MarketAnalysis:
+        async with semaphore:
+            return await run_dong_analysis_async(region, dong)
+    
+    results = await asyncio.gather(*(analyze(dong) for dong in dongs), return_exceptions=True)
+    analyses = []
+    for dong, result in zip(dongs, results):
+        if isinstance(result, Exception):
+            logger.warning(f"Market analysis for {region} {dong} failed: {str(result)}")
+        else:
+            analyses.append(result)
+    if not analyses and results:
+        raise results[0]
+    return MarketAnalysisList(market_analyses=analyses)
+
+
+def _replay_final_report(final_report: FinalReport) -> list[tuple[str, BaseModel]]:
+    """Rebuild the stream of stage events from a finished report."""
+    events: list[tuple[str, BaseModel]] = [
+        ("persona_profile", final_report.persona_profile),
+        ("market_analysis", final_report.market_analysis),
+        (
+            "recommended_items",
+            RecommendedItemList(recommended_items=final_report.recommended_items),
+        ),
+    ]
+    events.extend(("roadmap", roadmap) for roadmap in final_report.roadmaps)
+    events.append(("final_report", final_report))
+    return events
+
+
+async def _run_stage(label, stage: str, coro, timeout: float, item: str | None = None):
+    """
+    Await a workflow stage under a deadline.
+    
+    Returns ``(label, result, issue)``; on timeout or error the result is
+    ``None`` and ``issue`` records why, so the workflow can carry on with
+    whatever else completed.
+    """
+    start = time.perf_counter()
+    try:
+        result = await asyncio.wait_for(coro, timeout)
+        end = time.perf_counter()
+        stage_seconds.observe(end - start, stage=stage, status="ok")
+        record_span(stage, "stage", start, end, status="ok", item=item)
+        return label, result, None
+    except TimeoutError:
+        logger.warning(f"Stage {stage} timed out after {timeout:.1f}s")
+        issue = StageIssue(
+            stage=stage, status="timeout", item=item, detail=f"{timeout:g}초 안에 완료되지 않았습니다"
+        )
+    except Exception as e:
+        logger.error(f"Stage {stage} failed: {str(e)}", exc_info=True)
+        issue = StageIssue(stage=stage, status="failed", item=item, detail=str(e))
+    end = time.perf_counter()
+    stage_seconds.observe(end - start, stage=stage, status=issue.status)
+    record_span(stage, "stage", start, end, status=issue.status, item=item)
+    return label, None, issue
+
+
+async def _persona_stage(personal_info: dict) -> PersonaProfile:
+    """Profile the founder; memoized per normalized personal info."""
+    return await _run_agent_cached(
+        persona_cache,
+        canonical_hash(normalize_personal_info(personal_info)),
+        profiler_agent,
+        build_query(profiler_agent.name, PersonalInfo=personal_info),
+    )
+
+
+async def _market_stage(region: str) -> MarketAnalysisList:
+    """
+    Fetch the market analyses of a canonical region's focus dongs.
+    
+    Only ``MARKET_DONGS_PER_REQUEST`` dongs are analysed; the rest are served
+    on demand by ``run_dong_analysis_async``. Regions missing from the
+    registry get a single analysis of a dong the agent picks.
+    """
+    dongs = focus_dongs(region, MARKET_DONGS_PER_REQUEST) or [""]
+    market_analysis_list = await _run_market_analysis_async(region, dongs)
+    if not market_analysis_list.market_analyses:
+        raise ValueError("No market analysis data available")
+    return market_analysis_list
+
+
+async def _recommend_stage(
+    persona_profile: PersonaProfile,
+    project_info: dict,
+    market_analysis_list: MarketAnalysisList,
+) -> list[RecommendedItem]:
+    """
+    Recommend business items from the persona, project and market.
+    
+    The agent proposes candidates; their scores are computed locally and
+    only the best ``RECOMMEND_TOP_K`` are kept for roadmaps.
+    """
+    query = build_query(
+        item_recommender_agent.name,
+        PersonaProfile=persona_profile.model_dump(),
+        ProjectInfo=project_info,
+        MarketAnalysisList=market_analysis_list.model_dump(),
+    )
+    result = await _run_agent_async(item_recommender_agent, query)
+    with span("score items", "compute", candidates=len(result.candidates)):
+        scored = score_items(persona_profile, project_info, market_analysis_list, result.candidates)
+        return rank_items(scored)
+
+
+async def _roadmap_stage(
+    persona_profile: PersonaProfile,
+    project_info: dict,
+    market_analysis_list: MarketAnalysisList,
+    item: RecommendedItem,
+) -> Roadmap:
+    """Build the execution roadmap for one recommended item."""
+    query = build_query(
+        roadmap_architect_agent.name,
+        PersonaProfile=persona_profile.model_dump(),
+        ProjectInfo=project_info,
+        RecommendedItem=item.model_dump(),
+    )
+    draft = await _run_agent_async(roadmap_architect_agent, query)
+    # The roadmap is keyed by the recommended item, whatever name the model wrote
+    draft = draft.model_copy(update={"item": item.item})
+    with span("complete roadmap", "compute", item=item.item):
+        return complete_roadmaps(
+            project_info, persona_profile, market_analysis_list, [item], [draft]
+        )[0]
+
+
+async def _roadmap_sections_stage(
+    persona_profile: PersonaProfile,
+    project_info: dict,
+    market_analysis_list: MarketAnalysisList,
+    item: RecommendedItem,
+) -> Roadmap:
+    """
+    Build one item's roadmap from its five sections, generated concurrently.
+    
+    The first failing section fails the roadmap, so the other section calls
+    are cancelled rather than left spending tokens.
+    """
+    section_tasks = [
+        asyncio.create_task(
+            _run_agent_async(
+                agent,
+                build_query(
+                    agent.name,
+                    PersonaProfile=persona_profile.model_dump(),
+                    ProjectInfo=project_info,
+                    RecommendedItem=item.model_dump(),
+                ),
+            )
+        )
+        for agent in ROADMAP_SECTION_AGENTS.values()
+    ]
+    try:
+        sections = await asyncio.gather(*section_tasks)
+    finally:
+        for task in section_tasks:
+            task.cancel()
+    draft = RoadmapDraft(item=item.item, **dict(zip(ROADMAP_SECTION_AGENTS, sections)))
+    with span("complete roadmap", "compute", item=item.item):
+        return complete_roadmaps(
+            project_info, persona_profile, market_analysis_list, [item], [draft]
+        )[0]
+
+
+async def _roadmap_batch_stage(
+    persona_profile: PersonaProfile,
+    project_info: dict,
+    market_analysis_list: MarketAnalysisList,
+    items: list[RecommendedItem],
+) -> dict[int, Roadmap]:
+    """
+    Build the roadmaps for all items in one call.
+    
+    Returns:
+        Roadmaps keyed by item index; items the model left out are missing
+    """
+    if not items:
+        return {}
+    query = build_query(
+        roadmap_batch_agent.name,
+        PersonaProfile=persona_profile.model_dump(),
+        ProjectInfo=project_info,
+        RecommendedItemList={"recommended_items": [item.model_dump() for item in items]},
+    )
+    result = await _run_agent_async(roadmap_batch_agent, query)
+    # Pair by item name, falling back to position when the model renamed
+    # items, but never to a draft another item already claimed by name
+    by_name = {roadmap.item: pos for pos, roadmap in enumerate(result.roadmaps)}
+    claimed = {by_name[item.item] for item in items if item.item in by_name}
+    positional = len(result.roadmaps) == len(items)
+    matched = {}
+    for idx, item in enumerate(items):
+        pos = by_name.get(item.item)
+        if pos is None and positional and idx not in claimed:
+            pos = idx
+        if pos is not None:
+            matched[idx] = result.roadmaps[pos].model_copy(update={"item": item.item})
+    # Financial figures for every returned roadmap in one batch
+    with span("complete roadmaps", "compute", items=len(matched)):
+        roadmaps = complete_roadmaps(
+            project_info,
+            persona_profile,
+            market_analysis_list,
+            [items[idx] for idx in matched],
+            list(matched.values()),
+        )
+    return dict(zip(matched, roadmaps))
+
+
+def _incomplete_stages_note(issues: list[StageIssue]) -> str:
+    """Summary section listing the stages missing from a partial report."""
+    labels = {"timeout": "시간 초과", "failed": "오류", "skipped": "건너뜀"}
+    lines = [
+        f"- {issue.stage}{f' ({issue.item})' if issue.item else ''}: {labels[issue.status]}"
+        for issue in issues
+    ]
+    return "### 미완료 단계\n" + "\n".join(lines)
+
+
+async def stream_workflow_async(
     personal_info: dict | PersonalInfo, project_info: dict | ProjectInfo
-) -> FinalReport:
+) -> AsyncIterator[tuple[str, BaseModel]]:
     """
-    Run the complete multi-agent workflow.
+    Run the multi-agent workflow and yield each result as soon as it is ready.
+    
+    Events are yielded as ``(name, model)`` pairs in this order:
+    ``persona_profile`` and ``market_analysis`` (whichever finishes first),
+    ``recommended_items``, one ``roadmap`` per item in completion order, and
+    finally ``final_report``. Inputs that normalize to an already cached
+    submission are replayed from ``workflow_cache`` without calling any agent.
+    
+    Every stage runs under its own deadline, capped by the overall workflow
+    deadline. A stage that times out or fails is reported as a
+    ``stage_incomplete`` event carrying a ``StageIssue``, stages that depend
+    on it are skipped, and the final report holds everything that did
+    complete. Partial reports are not cached.
     
     Args:
         personal_info: Personal information for persona profiling
         project_info: Project information including food sector, region, and capital
         
-    Returns:
-        FinalReport containing persona profile, market analysis, recommended items, and roadmaps
+    Yields:
+        Tuples of event name and the Pydantic object produced by that stage
+        
+    Raises:
+        RuntimeError: If neither the persona profile nor the market analysis completed
     """
     # Convert to dict if Pydantic models
     if isinstance(personal_info, PersonalInfo):
@@ -108,98 +585,222 @@ async def run_workflow_async(
     if isinstance(project_info, ProjectInfo):
         project_info = project_info.model_dump()
     
-    # Create session
-    session_service = InMemorySessionService()
-    user_id = "workflow_user"
-    session_id = f"session_123"
-    await session_service.create_session(
-        app_name=APP_NAME, user_id=user_id, session_id=session_id
+    workflows_in_flight.inc()
+    start = time.perf_counter()
+    outcome = "failed"
+    try:
+        async with aclosing(_stream_workflow(personal_info, project_info)) as events:
+            async for event, payload in events:
+                if event == "final_report":
+                    outcome = "partial" if payload.incomplete_stages else "complete"
+                yield event, payload
+    except (GeneratorExit, asyncio.CancelledError):
+        outcome = "cancelled"
+        raise
+    finally:
+        end = time.perf_counter()
+        workflows_in_flight.dec()
+        workflow_seconds.observe(end - start, outcome=outcome)
+        record_span("workflow", "workflow", start, end, outcome=outcome)
+
+
+async def _stream_workflow(
+    personal_info: dict, project_info: dict
+) -> AsyncIterator[tuple[str, BaseModel]]:
+    """The stages behind ``stream_workflow_async``, on plain dict inputs."""
+    # Serve near-identical submissions from the result cache
+    cache_key = canonical_hash(
+        normalize_personal_info(personal_info), normalize_project_info(project_info)
     )
+    if workflow_cache is not None:
+        cached = await workflow_cache.aget(cache_key)
+        if cached is not None:
+            for event in _replay_final_report(FinalReport.model_validate_json(cached)):
+                yield event
+            return
     
-    # Step 1: Run profiler_agent and market_analyst_agent in parallel
-    personal_info_query = json.dumps(personal_info, ensure_ascii=False, indent=2)
-    project_info_query = json.dumps(project_info, ensure_ascii=False, indent=2)
+    loop = asyncio.get_running_loop()
+    workflow_deadline = loop.time() + WORKFLOW_DEADLINE_SECONDS
     
-    profiler_task = _run_agent_async(
-        profiler_agent, personal_info_query, session_service, user_id, session_id
-    )
-    market_analyst_task = _run_agent_async(
-        market_analyst_agent, project_info_query, session_service, user_id, session_id
-    )
+    def stage_timeout(stage_seconds: float) -> float:
+        return max(0.0, min(stage_seconds, workflow_deadline - loop.time()))
     
-    persona_profile, market_analysis_list = await asyncio.gather(
-        profiler_task, market_analyst_task
-    )
+    issues: list[StageIssue] = []
+    persona_profile_obj = None
+    market_analysis_list = None
+    market_analysis_obj = None
     
-    # Step 2: Run item_recommender_agent with combined inputs
-    item_recommender_query = (
-        json.dumps(persona_profile, ensure_ascii=False, indent=2)
-        + "\n\n"
-        + json.dumps(project_info, ensure_ascii=False, indent=2)
-        + "\n\n"
-        + json.dumps(market_analysis_list, ensure_ascii=False, indent=2)
-    )
+    # Step 1: Run profiler_agent and market_analyst_agent in parallel.
+    # Both depend on a narrow slice of the input, so their results are
+    # memoized per normalized personal info and per canonical region.
+    step1_tasks = [
+        asyncio.create_task(
+            _run_stage(
+                "persona_profile",
+                "persona_profile",
+                _persona_stage(personal_info),
+                stage_timeout(PERSONA_DEADLINE_SECONDS),
+            )
+        ),
+        asyncio.create_task(
+            _run_stage(
+                "market_analysis",
+                "market_analysis",
+                _market_stage(normalize_region(project_info["region"])),
+                stage_timeout(MARKET_DEADLINE_SECONDS),
+            )
+        ),
+    ]
     
-    recommended_items_result = await _run_agent_async(
-        item_recommender_agent,
-        item_recommender_query,
-        session_service,
-        user_id,
-        session_id,
-    )
+    try:
+        for next_done in asyncio.as_completed(step1_tasks):
+            label, result, issue = await next_done
+            if issue is not None:
+                issues.append(issue)
+                yield "stage_incomplete", issue
+            elif label == "persona_profile":
+                persona_profile_obj = result
+                yield label, persona_profile_obj
+            else:
+                market_analysis_list = result
+                # Select the most relevant market analysis (first one from the list)
+                market_analysis_obj = market_analysis_list.market_analyses[0]
+                yield label, market_analysis_obj
+    finally:
+        for task in step1_tasks:
+            task.cancel()
     
-    # Step 3: Run roadmap_architect_agent for each recommended item
-    recommended_items = recommended_items_result["recommended_items"]
-    roadmap_tasks = []
-    
-    for idx, item in enumerate(recommended_items):
-        roadmap_query = (
-            json.dumps(persona_profile, ensure_ascii=False, indent=2)
-            + "\n\n"
-            + json.dumps(project_info, ensure_ascii=False, indent=2)
-            + "\n\n"
-            + json.dumps(item, ensure_ascii=False, indent=2)
+    if persona_profile_obj is None and market_analysis_obj is None:
+        details = "; ".join(f"{issue.stage}: {issue.detail}" for issue in issues)
+        raise RuntimeError(f"No workflow stage completed ({details})")
+    
+    # Step 2: Run item_recommender_agent with combined inputs
+    recommended_items_objs: list[RecommendedItem] = []
+    if persona_profile_obj is not None and market_analysis_list is not None:
+        _, result, issue = await _run_stage(
+            "recommended_items",
+            "recommended_items",
+            _recommend_stage(persona_profile_obj, project_info, market_analysis_list),
+            stage_timeout(RECOMMEND_DEADLINE_SECONDS),
         )
-        
-        roadmap_tasks.append(
-            _run_agent_async(
-                roadmap_architect_agent,
-                roadmap_query,
-                session_service,
-                user_id,
-                session_id,
-            )
+        if issue is None:
+            recommended_items_objs = result
+            yield "recommended_items", RecommendedItemList(recommended_items=recommended_items_objs)
+    else:
+        issue = StageIssue(
+            stage="recommended_items", status="skipped", detail="선행 단계가 완료되지 않았습니다"
         )
+    if issue is not None:
+        issues.append(issue)
+        yield "stage_incomplete", issue
+        issue = StageIssue(stage="roadmap", status="skipped", detail="추천 아이템이 없습니다")
+        issues.append(issue)
+        yield "stage_incomplete", issue
     
-    roadmaps_data = await asyncio.gather(*roadmap_tasks)
-    
-    # Step 4: Convert to Pydantic objects
-    roadmaps = [Roadmap(**roadmap_data) for roadmap_data in roadmaps_data]
-    persona_profile_obj = PersonaProfile(**persona_profile)
-    recommended_items_objs = [
-        RecommendedItem(**item) for item in recommended_items
-    ]
+    # Step 3: Run roadmap_architect_agent (or the section agents) for each
+    # recommended item, or roadmap_batch_agent once for all of them
+    roadmap_timeout = stage_timeout(ROADMAP_DEADLINE_SECONDS)
+    roadmaps_by_index: dict[int, Roadmap] = {}
+    if ROADMAP_MODE == "batch":
+        _, batch, issue = await _run_stage(
+            "roadmaps",
+            "roadmap",
+            _roadmap_batch_stage(
+                persona_profile_obj, project_info, market_analysis_list, recommended_items_objs
+            ),
+            roadmap_timeout,
+        )
+        if issue is not None:
+            issues.append(issue)
+            yield "stage_incomplete", issue
+        else:
+            for idx, item in enumerate(recommended_items_objs):
+                if idx in batch:
+                    roadmaps_by_index[idx] = batch[idx]
+                    yield "roadmap", batch[idx]
+                else:
+                    issue = StageIssue(
+                        stage="roadmap",
+                        status="failed",
+                        item=item.item,
+                        detail="일괄 생성 결과에 로드맵이 없습니다",
+                    )
+                    issues.append(issue)
+                    yield "stage_incomplete", issue
+    else:
+        roadmap_stage = _roadmap_sections_stage if ROADMAP_MODE == "sections" else _roadmap_stage
+        roadmap_tasks = [
+            asyncio.create_task(
+                _run_stage(
+                    idx,
+                    "roadmap",
+                    roadmap_stage(persona_profile_obj, project_info, market_analysis_list, item),
+                    roadmap_timeout,
+                    item=item.item,
+                )
+            )
+            for idx, item in enumerate(recommended_items_objs)
+        ]
+        
+        # Stream each roadmap as it finishes but keep the report in item order
+        try:
+            for next_done in asyncio.as_completed(roadmap_tasks):
+                idx, roadmap, issue = await next_done
+                if issue is not None:
+                    issues.append(issue)
+                    yield "stage_incomplete", issue
+                else:
+                    roadmaps_by_index[idx] = roadmap
+                    yield "roadmap", roadmap
+        finally:
+            for task in roadmap_tasks:
+                task.cancel()
     
-    # Select the most relevant market analysis (first one from the list)
-    market_analyses = market_analysis_list["market_analyses"]
-    if not market_analyses:
-        raise ValueError("No market analysis data available")
-    market_analysis_obj = MarketAnalysis(**market_analyses[0])
+    roadmaps = [roadmaps_by_index[idx] for idx in sorted(roadmaps_by_index)]
     
-    # Step 5: Generate executive summary
+    # Step 4: Generate executive summary
     executive_summary = _generate_executive_summary(
         persona_profile_obj, market_analysis_obj, recommended_items_objs, roadmaps
     )
+    if issues:
+        executive_summary += "\n\n" + _incomplete_stages_note(issues)
     
-    # Step 6: Create and return FinalReport
+    # Step 5: Create FinalReport
     final_report = FinalReport(
         executive_summary=executive_summary,
         persona_profile=persona_profile_obj,
         market_analysis=market_analysis_obj,
         recommended_items=recommended_items_objs,
         roadmaps=roadmaps,
+        incomplete_stages=issues,
     )
     
+    # Only complete reports are cached so a retry can fill in the gaps
+    if workflow_cache is not None and not issues:
+        await workflow_cache.aset(cache_key, final_report.model_dump_json())
+    
+    yield "final_report", final_report
+
+
+async def run_workflow_async(
+    personal_info: dict | PersonalInfo, project_info: dict | ProjectInfo
+) -> FinalReport:
+    """
+    Run the complete multi-agent workflow.
+    
+    Args:
+        personal_info: Personal information for persona profiling
+        project_info: Project information including food sector, region, and capital
+        
+    Returns:
+        FinalReport containing persona profile, market analysis, recommended items, and roadmaps
+    """
+    final_report = None
+    async for event, payload in stream_workflow_async(personal_info, project_info):
+        if event == "final_report":
+            final_report = payload
+    if final_report is None:
+        raise ValueError("Workflow finished without a final report")
     return final_report
 
 
@@ -0,0 +1,200 @@
+"""Background job queue for workflow runs with a bounded worker pool."""
+
+import asyncio
+import logging
+import os
+import time
+import uuid
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+from .agents.schemas import FinalReport, PersonalInfo, ProjectInfo
+from .agents.scheduler import Priority, call_client_id, call_priority
+from .agents.usage import RequestUsage, metered
+from .agents.workflow import stream_workflow_async
+
+
+logger = logging.getLogger(__name__)
+
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "4"))
+JOB_QUEUE_MAXSIZE = int(os.getenv("JOB_QUEUE_MAXSIZE", "100"))
+JOB_RETENTION_SECONDS = int(os.getenv("JOB_RETENTION_SECONDS", "3600"))
+# Scheduling class of job model calls: "batch" yields to /api/submit and
+# streaming requests, "interactive" competes with them
+JOB_PRIORITY = Priority[os.getenv("JOB_PRIORITY", "batch").upper()]
+
+STAGES = ("persona_profile", "market_analysis", "recommended_items", "roadmaps")
+
+
+class QueueFullError(Exception):
+    """Raised when the job queue cannot accept more work."""
+
+
+class JobProgress(BaseModel):
+    """워크플로우 단계별 진행 상황."""
+
+    stages: dict[str, Literal["pending", "completed", "timeout", "failed", "skipped"]] = Field(
+        default_factory=lambda: {stage: "pending" for stage in STAGES},
+        description="단계별 상태",
+    )
+    roadmaps_completed: int = Field(default=0, description="완료된 로드맵 수")
+    roadmaps_incomplete: int = Field(default=0, description="시간 초과 또는 오류로 완료되지 못한 로드맵 수")
+    roadmaps_total: int | None = Field(default=None, description="생성할 로드맵 수")
+
+
+class Job(BaseModel):
+    """워크플로우 작업 상태."""
+
+    job_id: str = Field(description="작업 ID")
+    status: Literal["queued", "running", "succeeded", "failed"] = Field(
+        default="queued", description="작업 상태"
+    )
+    progress: JobProgress = Field(default_factory=JobProgress, description="진행 상황")
+    result: FinalReport | None = Field(default=None, description="최종 보고서")
+    error: str | None = Field(default=None, description="실패 사유")
+    usage: RequestUsage | None = Field(
+        default=None, description="에이전트·모델별 토큰 사용량과 비용 (종료 후 채워짐)"
+    )
+    created_at: float = Field(default_factory=time.time, description="생성 시각 (epoch)")
+    started_at: float | None = Field(default=None, description="시작 시각 (epoch)")
+    finished_at: float | None = Field(default=None, description="종료 시각 (epoch)")
+
+
+class JobManager:
+    """
+    In-memory job registry drained by a fixed pool of worker tasks.
+
+    The number of workers caps how many workflows run at once; further
+    submissions wait in a bounded queue so the API tier stays responsive.
+    Job model calls run at ``JOB_PRIORITY``, by default behind the calls of
+    requests a client is waiting on.
+    """
+
+    def __init__(
+        self,
+        workers: int = JOB_WORKERS,
+        queue_maxsize: int = JOB_QUEUE_MAXSIZE,
+        retention_seconds: int = JOB_RETENTION_SECONDS,
+    ):
+        self.workers = workers
+        self.retention_seconds = retention_seconds
+        self._queue: asyncio.Queue[tuple[str, PersonalInfo, ProjectInfo, str]] = asyncio.Queue(
+            maxsize=queue_maxsize
+        )
+        self._jobs: dict[str, Job] = {}
+        self._worker_tasks: list[asyncio.Task] = []
+
+    async def start(self) -> None:
+        """Spawn the worker tasks."""
+        self._worker_tasks = [
+            asyncio.create_task(self._worker(idx)) for idx in range(self.workers)
+        ]
+        logger.info(f"Started {self.workers} workflow workers")
+
+    async def stop(self) -> None:
+        """Cancel the worker tasks and wait for them to exit."""
+        for task in self._worker_tasks:
+            task.cancel()
+        await asyncio.gather(*self._worker_tasks, return_exceptions=True)
+        self._worker_tasks = []
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of jobs waiting for a worker."""
+        return self._queue.qsize()
+
+    def submit(
+        self,
+        personal_info: PersonalInfo,
+        project_info: ProjectInfo,
+        client_id: str = "anonymous",
+    ) -> Job:
+        """
+        Enqueue a workflow run.
+
+        Args:
+            personal_info: User's personal information
+            project_info: Project details
+            client_id: Caller identity used for fair sharing of LLM quota
+
+        Raises:
+            QueueFullError: If the queue is at capacity
+        """
+        self._prune()
+        job = Job(job_id=uuid.uuid4().hex)
+        try:
+            self._queue.put_nowait((job.job_id, personal_info, project_info, client_id))
+        except asyncio.QueueFull:
+            raise QueueFullError("Job queue is full")
+        self._jobs[job.job_id] = job
+        return job
+
+    def get(self, job_id: str) -> Job | None:
+        """Return the job with the given id, if it is still retained."""
+        return self._jobs.get(job_id)
+
+    def _prune(self) -> None:
+        """Drop finished jobs older than the retention window."""
+        cutoff = time.time() - self.retention_seconds
+        expired = [
+            job_id
+            for job_id, job in self._jobs.items()
+            if job.finished_at is not None and job.finished_at < cutoff
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
+
+    async def _worker(self, worker_idx: int) -> None:
+        while True:
+            job_id, personal_info, project_info, client_id = await self._queue.get()
+            try:
+                # Workers outlive any single request, so bind the caller per job
+                call_client_id.set(client_id)
+                call_priority.set(JOB_PRIORITY)
+                await self._run(self._jobs[job_id], personal_info, project_info)
+            finally:
+                self._queue.task_done()
+
+    async def _run(
+        self, job: Job, personal_info: PersonalInfo, project_info: ProjectInfo
+    ) -> None:
+        job.status = "running"
+        job.started_at = time.time()
+        logger.info(f"Job {job.job_id} started")
+        try:
+            with metered("job") as ledger:
+                await self._consume(job, personal_info, project_info)
+            job.status = "succeeded"
+            logger.info(f"Job {job.job_id} succeeded")
+        except Exception as e:
+            logger.error(f"Job {job.job_id} failed: {str(e)}", exc_info=True)
+            job.status = "failed"
+            job.error = str(e)
+        finally:
+            job.usage = ledger.report()
+            job.finished_at = time.time()
+
+    async def _consume(
+        self, job: Job, personal_info: PersonalInfo, project_info: ProjectInfo
+    ) -> None:
+        """Stream the workflow into the job's progress and result."""
+        async for event, payload in stream_workflow_async(personal_info, project_info):
+            if event == "recommended_items":
+                job.progress.stages["recommended_items"] = "completed"
+                job.progress.roadmaps_total = len(payload.recommended_items)
+            elif event == "roadmap":
+                job.progress.roadmaps_completed += 1
+            elif event == "stage_incomplete":
+                if payload.item is not None:
+                    job.progress.roadmaps_incomplete += 1
+                elif payload.stage == "roadmap":
+                    job.progress.stages["roadmaps"] = payload.status
+                else:
+                    job.progress.stages[payload.stage] = payload.status
+            elif event == "final_report":
+                if job.progress.stages["roadmaps"] == "pending":
+                    job.progress.stages["roadmaps"] = "completed"
+                job.result = payload
+            else:
+                job.progress.stages[event] = "completed"
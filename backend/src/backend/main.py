@@ -1,21 +1,64 @@
 """FastAPI main application for F&B Startup Navigator."""
 
-from fastapi import FastAPI, HTTPException
+import asyncio
+import random
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse, StreamingResponse
 from pydantic import BaseModel, Field
+import json
 import logging
 
-from .agents.workflow import run_workflow_async
-from .agents.schemas import PersonalInfo, ProjectInfo, FinalReport
+from .agents.agents import AGENT_VARIANTS, WORKFLOW_AGENTS
+from .agents.cache import market_cache, persona_cache, workflow_cache
+from .agents.hedging import hedger
+from .agents.market_store import market_store
+from .agents.metrics import metrics
+from .agents.normalize import normalize_region
+from .agents.pool import runner_pool
+from .agents.regions import SEOUL_DISTRICTS, focus_dongs
+from .agents.router import model_router
+from .agents.scheduler import call_client_id, llm_scheduler
+from .agents.sessions import session_manager
+from .agents.singleflight import agent_calls
+from .agents.tracing import TRACE_SAMPLE_RATE, Trace, trace_store, traced
+from .agents.usage import RequestUsage, metered, usage_header, usage_store
+from .agents.workflow import (
+    MARKET_DONGS_PER_REQUEST,
+    run_dong_analysis_async,
+    run_workflow_async,
+    stream_workflow_async,
+)
+from .agents.schemas import PersonalInfo, ProjectInfo, FinalReport, MarketAnalysis
+from .jobs import Job, JobManager, QueueFullError
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+job_manager = JobManager()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Load precomputed data and start background workers on startup."""
+    market_store.load_latest()
+    runner_pool.warm(WORKFLOW_AGENTS + AGENT_VARIANTS)
+    await job_manager.start()
+    session_pruner = asyncio.create_task(session_manager.prune_forever())
+    yield
+    session_pruner.cancel()
+    await job_manager.stop()
+
+
 app = FastAPI(
     title="F&B Startup Navigator API",
     description="Multi-agent system for food & beverage startup consulting",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 # Configure CORS
@@ -25,6 +68,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Trace-Id", "X-Usage-Id", "X-Usage"],
 )
 
 
@@ -70,13 +114,260 @@ async def health_check():
     return {"status": "healthy"}
 
 
+def _to_workflow_inputs(request: SubmitRequest) -> tuple[PersonalInfo, ProjectInfo]:
+    """Transform frontend data to backend schema format."""
+    personal_info = PersonalInfo(
+        gender=request.personalInfo.gender,
+        age=request.personalInfo.age,
+        mbti=request.personalInfo.mbti,
+        previous_job=request.personalInfo.previous_job,
+        self_employed_experience=request.personalInfo.self_employed_experience
+    )
+    
+    # Convert capital from number to string format
+    capital_str = f"{request.projectInfo.capital:,}원"
+    
+    project_info = ProjectInfo(
+        food_sector=request.projectInfo.foodSector,
+        region=request.projectInfo.region,
+        capital=capital_str
+    )
+    
+    return personal_info, project_info
+
+
+def _client_id(http_request: Request) -> str:
+    """Identify the caller for fair sharing of LLM quota across clients."""
+    forwarded_for = http_request.headers.get("x-forwarded-for")
+    if forwarded_for:
+        return forwarded_for.split(",")[0].strip()
+    if http_request.client:
+        return http_request.client.host
+    return "anonymous"
+
+
+def _request_trace(http_request: Request, name: str) -> Trace | None:
+    """A new trace if the caller asked for one with ``X-Trace: 1`` or it was sampled."""
+    requested = http_request.headers.get("x-trace", "").lower() in ("1", "true")
+    if requested or random.random() < TRACE_SAMPLE_RATE:
+        return Trace(name)
+    return None
+
+
+def _set_usage_headers(response: Response, usage: RequestUsage) -> None:
+    """Attach a request's token and cost totals, and its record id if usage is stored."""
+    if usage_store.enabled:
+        response.headers["X-Usage-Id"] = usage.usage_id
+    response.headers["X-Usage"] = usage_header(usage)
+
+
+def _format_sse(event: str, data: str) -> str:
+    """Format a single Server-Sent Events message."""
+    return f"event: {event}\ndata: {data}\n\n"
+
+
+CACHES = {
+    "workflow": workflow_cache,
+    "market": market_cache,
+    "persona": persona_cache,
+}
+
+
+@app.get("/api/cache/stats")
+async def cache_stats():
+    """Hit/miss counters for the workflow result cache and the stage caches."""
+    return {
+        name: {"enabled": False} if cache is None else {"enabled": True, **cache.stats()}
+        for name, cache in CACHES.items()
+    }
+
+
+@app.get("/api/singleflight/stats")
+async def singleflight_stats():
+    """Counters for agent calls coalesced onto an identical in-flight call."""
+    return agent_calls.stats()
+
+
+@app.get("/api/scheduler/stats")
+async def scheduler_stats():
+    """Queue depth, in-flight calls, quota and wait times of the LLM scheduler."""
+    return llm_scheduler.stats()
+
+
+@app.get("/api/hedging/stats")
+async def hedging_stats():
+    """Hedged call counters and the current hedge delay per agent."""
+    return hedger.stats()
+
+
+@app.get("/api/router/stats")
+async def router_stats():
+    """Rolling latency, error rate and routing decisions per agent and model."""
+    return model_router.stats()
+
+
+@app.get("/api/usage/stats")
+async def usage_stats(since: float = 0.0):
+    """Token and cost totals of stored requests since ``since`` (epoch), per agent and model."""
+    return usage_store.stats(since)
+
+
+@app.get("/api/usage/{usage_id}", response_model=RequestUsage)
+async def get_usage(usage_id: str) -> RequestUsage:
+    """
+    Return the token usage and cost of one request, per agent and model.
+    
+    Raises:
+        HTTPException: If the record is unknown or usage is not stored
+    """
+    usage = usage_store.get(usage_id)
+    if usage is None:
+        raise HTTPException(status_code=404, detail="사용량 기록을 찾을 수 없습니다.")
+    return usage
+
+
+def _cache_samples(field: str):
+    return [
+        ({"cache": name}, cache.stats()[field]) for name, cache in CACHES.items() if cache is not None
+    ]
+
+
+def _scheduler_samples(field: str):
+    return [
+        ({"model": model}, stats[field])
+        for model, stats in llm_scheduler.stats()["models"].items()
+    ]
+
+
+# Queue depths and cache counters are read from their owners on every scrape
+metrics.collector(
+    "llm_scheduler_queue_depth",
+    "gauge",
+    "Agent calls waiting for a model slot",
+    lambda: _scheduler_samples("queue_depth"),
+)
+metrics.collector(
+    "llm_scheduler_in_flight",
+    "gauge",
+    "Agent calls holding a model slot",
+    lambda: _scheduler_samples("in_flight"),
+)
+metrics.collector(
+    "job_queue_depth",
+    "gauge",
+    "Jobs waiting for a workflow worker",
+    lambda: [({}, job_manager.queue_depth)],
+)
+metrics.collector(
+    "cache_hits_total", "counter", "Cache lookups served", lambda: _cache_samples("hits")
+)
+metrics.collector(
+    "cache_misses_total", "counter", "Cache lookups missed", lambda: _cache_samples("misses")
+)
+metrics.collector(
+    "cache_entries", "gauge", "Entries held in each cache", lambda: _cache_samples("size")
+)
+metrics.collector(
+    "agent_calls_coalesced_total",
+    "counter",
+    "Agent calls served by an identical in-flight call",
+    lambda: [({}, agent_calls.stats()["coalesced"])],
+)
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def prometheus_metrics():
+    """Agent, workflow, queue, cache, routing and hedging metrics in the Prometheus text format."""
+    return PlainTextResponse(
+        metrics.render(), media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
+
+
+@app.get("/api/debug/traces")
+async def list_traces():
+    """Ids of the stored workflow traces, newest first."""
+    return {"trace_ids": trace_store.ids()}
+
+
+@app.get("/api/debug/traces/{trace_id}")
+async def get_trace(trace_id: str):
+    """
+    Return a workflow trace as Chrome trace-event JSON.
+    
+    Raises:
+        HTTPException: If the trace is unknown or no longer stored
+    """
+    trace = trace_store.get(trace_id)
+    if trace is None:
+        raise HTTPException(status_code=404, detail="트레이스를 찾을 수 없습니다.")
+    return trace
+
+
+@app.get("/api/markets/{region}")
+async def market_dongs(region: str):
+    """
+    List the dongs of a gu; ``focus_dongs`` are the ones analysed for submissions.
+    
+    Raises:
+        HTTPException: If the gu is not in the registry
+    """
+    gu = normalize_region(region)
+    if gu not in SEOUL_DISTRICTS:
+        raise HTTPException(status_code=404, detail="지역을 찾을 수 없습니다.")
+    return {
+        "region": gu,
+        "focus_dongs": focus_dongs(gu, MARKET_DONGS_PER_REQUEST),
+        "dongs": SEOUL_DISTRICTS[gu],
+    }
+
+
+@app.get("/api/markets/{region}/dongs/{dong}", response_model=MarketAnalysis)
+async def market_dong_analysis(
+    region: str, dong: str, http_request: Request, response: Response
+) -> MarketAnalysis:
+    """
+    Return the market analysis of one dong, generating it on first request.
+    
+    Results are served from the precomputed store or the market cache when
+    available, so each dong is analysed at most once per cache lifetime.
+    The ``X-Usage`` header reports the tokens and cost of this request.
+    
+    Raises:
+        HTTPException: If the dong is not in the gu, or the analysis fails
+    """
+    gu = normalize_region(region)
+    if dong not in SEOUL_DISTRICTS.get(gu, []):
+        raise HTTPException(status_code=404, detail="지역을 찾을 수 없습니다.")
+    call_client_id.set(_client_id(http_request))
+    try:
+        with metered("market_dong") as ledger:
+            analysis = await run_dong_analysis_async(gu, dong)
+        _set_usage_headers(response, ledger.report())
+        return analysis
+    except Exception as e:
+        logger.error(f"Market analysis for {gu} {dong} failed: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=500, detail=f"시장 분석 중 오류가 발생했습니다: {str(e)}"
+        )
+
+
 @app.post("/api/submit", response_model=FinalReport)
-async def submit_startup_plan(request: SubmitRequest) -> FinalReport:
+async def submit_startup_plan(
+    request: SubmitRequest, http_request: Request, response: Response
+) -> FinalReport:
     """
     Process startup plan submission and generate complete analysis.
     
+    Traced submissions (``X-Trace: 1`` or sampled) return the trace id in
+    the ``X-Trace-Id`` header. Token and cost totals are returned in the
+    ``X-Usage`` header. Unless usage storage is disabled, the per-agent
+    breakdown is available from ``GET /api/usage/{usage_id}`` with the id
+    in ``X-Usage-Id``.
+    
     Args:
         request: Contains personal information and project details
+        http_request: Raw request, used to identify the client and tracing
+        response: Outgoing response, for the trace id and usage headers
         
     Returns:
         FinalReport with persona profile, market analysis, recommended items, and roadmaps
@@ -89,31 +380,21 @@ async def submit_startup_plan(request: SubmitRequest) -> FinalReport:
         logger.info(f"Personal Info: age={request.personalInfo.age}, mbti={request.personalInfo.mbti}")
         logger.info(f"Project Info: sector={request.projectInfo.foodSector}, region={request.projectInfo.region}")
         
-        # Transform frontend data to backend schema format
-        personal_info = PersonalInfo(
-            gender=request.personalInfo.gender,
-            age=request.personalInfo.age,
-            mbti=request.personalInfo.mbti,
-            previous_job=request.personalInfo.previous_job,
-            self_employed_experience=request.personalInfo.self_employed_experience
-        )
-        
-        # Convert capital from number to string format
-        capital_str = f"{request.projectInfo.capital:,}원"
-        
-        project_info = ProjectInfo(
-            food_sector=request.projectInfo.foodSector,
-            region=request.projectInfo.region,
-            capital=capital_str
-        )
+        personal_info, project_info = _to_workflow_inputs(request)
+        call_client_id.set(_client_id(http_request))
         
         logger.info("Starting workflow execution...")
         
         # Run the multi-agent workflow
-        final_report = await run_workflow_async(
-            personal_info=personal_info,
-            project_info=project_info
-        )
+        trace = _request_trace(http_request, "submit")
+        if trace is not None:
+            response.headers["X-Trace-Id"] = trace.id
+        with traced(trace), metered("submit") as ledger:
+            final_report = await run_workflow_async(
+                personal_info=personal_info,
+                project_info=project_info
+            )
+        _set_usage_headers(response, ledger.report())
         
         logger.info("Workflow execution completed successfully")
         logger.info(f"Generated {len(final_report.recommended_items)} items and {len(final_report.roadmaps)} roadmaps")
@@ -131,6 +412,117 @@ async def submit_startup_plan(request: SubmitRequest) -> FinalReport:
         )
 
 
+@app.post("/api/submit/stream")
+async def submit_startup_plan_stream(
+    request: SubmitRequest, http_request: Request
+) -> StreamingResponse:
+    """
+    Process startup plan submission and stream results as Server-Sent Events.
+    
+    Emits ``persona_profile``, ``market_analysis``, ``recommended_items`` and one
+    ``roadmap`` event per item as soon as each is ready, then
+    ``executive_summary``, a ``usage`` event with the request's tokens and
+    cost per agent and model, and a closing ``done`` event. Stages that time out
+    or fail are reported as ``stage_incomplete`` events and the stream goes
+    on with a partial report. Fatal failures are reported as an ``error``
+    event since the response status is already sent.
+    
+    Args:
+        request: Contains personal information and project details
+        http_request: Raw request, used to identify the client
+        
+    Returns:
+        StreamingResponse with ``text/event-stream`` content
+        
+    Raises:
+        HTTPException: If the request data is invalid
+    """
+    logger.info("Received streaming submission request")
+    logger.info(f"Project Info: sector={request.projectInfo.foodSector}, region={request.projectInfo.region}")
+    
+    try:
+        personal_info, project_info = _to_workflow_inputs(request)
+    except ValueError as e:
+        logger.error(f"Validation error: {str(e)}")
+        raise HTTPException(status_code=400, detail=f"유효하지 않은 데이터: {str(e)}")
+    client_id = _client_id(http_request)
+    trace = _request_trace(http_request, "submit_stream")
+    
+    async def event_stream() -> AsyncIterator[str]:
+        call_client_id.set(client_id)
+        try:
+            with traced(trace), metered("submit_stream") as ledger:
+                async for event, payload in stream_workflow_async(personal_info, project_info):
+                    if event == "final_report":
+                        summary = {"executive_summary": payload.executive_summary}
+                        yield _format_sse(
+                            "executive_summary", json.dumps(summary, ensure_ascii=False)
+                        )
+                    else:
+                        yield _format_sse(event, payload.model_dump_json())
+            yield _format_sse("usage", ledger.report().model_dump_json())
+            yield _format_sse("done", "{}")
+            logger.info("Streaming workflow execution completed successfully")
+        except Exception as e:
+            logger.error(f"Streaming workflow execution failed: {str(e)}", exc_info=True)
+            error = {"detail": f"워크플로우 실행 중 오류가 발생했습니다: {str(e)}"}
+            yield _format_sse("error", json.dumps(error, ensure_ascii=False))
+    
+    headers = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    if trace is not None:
+        headers["X-Trace-Id"] = trace.id
+    return StreamingResponse(event_stream(), media_type="text/event-stream", headers=headers)
+
+
+@app.post("/api/jobs", response_model=Job, status_code=202)
+async def create_job(request: SubmitRequest, http_request: Request) -> Job:
+    """
+    Enqueue a startup plan workflow and return immediately.
+    
+    Args:
+        request: Contains personal information and project details
+        http_request: Raw request, used to identify the client
+        
+    Returns:
+        The queued Job; poll ``GET /api/jobs/{job_id}`` for progress and result
+        
+    Raises:
+        HTTPException: If the request data is invalid or the queue is full
+    """
+    logger.info("Received job submission request")
+    logger.info(f"Project Info: sector={request.projectInfo.foodSector}, region={request.projectInfo.region}")
+    
+    try:
+        personal_info, project_info = _to_workflow_inputs(request)
+        job = job_manager.submit(personal_info, project_info, _client_id(http_request))
+    except ValueError as e:
+        logger.error(f"Validation error: {str(e)}")
+        raise HTTPException(status_code=400, detail=f"유효하지 않은 데이터: {str(e)}")
+    except QueueFullError:
+        logger.warning(f"Job queue is full (depth={job_manager.queue_depth})")
+        raise HTTPException(
+            status_code=503,
+            detail="요청이 많아 작업을 접수할 수 없습니다. 잠시 후 다시 시도해주세요.",
+        )
+    
+    logger.info(f"Queued job {job.job_id} (depth={job_manager.queue_depth})")
+    return job
+
+
+@app.get("/api/jobs/{job_id}", response_model=Job)
+async def get_job(job_id: str) -> Job:
+    """
+    Return the status, per-stage progress and result of a workflow job.
+    
+    Raises:
+        HTTPException: If the job does not exist or has expired
+    """
+    job = job_manager.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
+    return job
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8080)
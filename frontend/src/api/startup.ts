@@ -121,12 +121,21 @@ export interface Roadmap {
   menu_development: MenuDevelopment;
 }
 
+export interface StageIssue {
+  stage: "persona_profile" | "market_analysis" | "recommended_items" | "roadmap";
+  status: "timeout" | "failed" | "skipped";
+  item: string | null;
+  detail: string;
+}
+
 export interface FinalReport {
   executive_summary: string;
-  persona_profile: PersonaProfile;
-  market_analysis: MarketAnalysis;
+  // null when the stage did not complete; see incomplete_stages
+  persona_profile: PersonaProfile | null;
+  market_analysis: MarketAnalysis | null;
   recommended_items: RecommendedItem[];
   roadmaps: Roadmap[];
+  incomplete_stages: StageIssue[];
 }
 
 // ============================================================================
@@ -4,7 +4,7 @@ import { Card, CardContent } from "@/components/ui/card";
 import { Progress } from "@/components/ui/progress";
 import { Tabs, TabsContent, TabsList, TabsTrigger } from "@/components/ui/tabs";
 import { Checkbox } from "@/components/ui/checkbox";
-import { Flag, Lightbulb, MapPin, Utensils, Package, ExternalLink, TrendingUp, Users, Star, DollarSign } from "lucide-react";
+import { Flag, Lightbulb, MapPin, Utensils, Package, ExternalLink, TrendingUp, Users, Star, DollarSign, AlertTriangle } from "lucide-react";
 import { Badge } from "@/components/ui/badge";
 import { Separator } from "@/components/ui/separator";
 import { useFormContext } from "@/contexts/FormContext";
@@ -12,7 +12,7 @@ import { FundingTools } from "@/components/roadmap/FundingTools";
 import { LocationTools } from "@/components/roadmap/LocationTools";
 import { MenuTools } from "@/components/roadmap/MenuTools";
 import { OperationTools } from "@/components/roadmap/OperationTools";
-import type { Roadmap as RoadmapType } from "@/api/startup";
+import type { Roadmap as RoadmapType, StageIssue } from "@/api/startup";
 
 interface ChecklistItem {
   id: string;
@@ -24,6 +24,49 @@ interface ChecklistItem {
   };
 }
 
+const STAGE_LABELS: Record<StageIssue["stage"], string> = {
+  persona_profile: "창업자 프로필",
+  market_analysis: "시장 분석",
+  recommended_items: "아이템 추천",
+  roadmap: "로드맵",
+};
+
+const STATUS_LABELS: Record<StageIssue["status"], string> = {
+  timeout: "시간 초과",
+  failed: "오류",
+  skipped: "건너뜀",
+};
+
+// Stages the backend could not complete; the rest of the report is still shown
+function IncompleteStagesNotice({ issues }: { issues: StageIssue[] }) {
+  if (!issues || issues.length === 0) {
+    return null;
+  }
+  return (
+    <Card className="bg-amber-50 border-2 border-amber-200">
+      <CardContent className="pt-6 pb-6">
+        <div className="space-y-3">
+          <div className="flex items-center gap-2">
+            <AlertTriangle className="h-6 w-6 text-amber-600" />
+            <h3 className="font-bold text-xl md:text-2xl text-amber-900">일부 분석이 완료되지 않았습니다</h3>
+          </div>
+          <ul className="space-y-1 text-base md:text-lg text-amber-800">
+            {issues.map((issue, idx) => (
+              <li key={idx}>
+                {STAGE_LABELS[issue.stage]}
+                {issue.item ? ` (${issue.item})` : ""}: {STATUS_LABELS[issue.status]}
+              </li>
+            ))}
+          </ul>
+          <p className="text-sm md:text-base text-muted-foreground">
+            완료된 항목만 표시됩니다. 잠시 후 다시 시도하면 나머지 결과를 받을 수 있습니다.
+          </p>
+        </div>
+      </CardContent>
+    </Card>
+  );
+}
+
 export default function Roadmap() {
   const navigate = useNavigate();
   const { formData, reportData } = useFormContext();
@@ -41,16 +84,21 @@ export default function Roadmap() {
   }, [reportData, navigate]);
 
   if (!reportData || !reportData.roadmaps || reportData.roadmaps.length === 0) {
+    const issues = reportData?.incomplete_stages ?? [];
     return (
       <div className="min-h-screen bg-gradient-to-b from-blue-50/30 to-background py-8 px-4 md:px-8">
-        <div className="max-w-7xl mx-auto">
-          <Card>
-            <CardContent className="pt-8 pb-8">
-              <p className="text-center text-muted-foreground">
-                로드맵 데이터를 불러오는 중입니다...
-              </p>
-            </CardContent>
-          </Card>
+        <div className="max-w-7xl mx-auto space-y-8">
+          {issues.length > 0 ? (
+            <IncompleteStagesNotice issues={issues} />
+          ) : (
+            <Card>
+              <CardContent className="pt-8 pb-8">
+                <p className="text-center text-muted-foreground">
+                  로드맵 데이터를 불러오는 중입니다...
+                </p>
+              </CardContent>
+            </Card>
+          )}
         </div>
       </div>
     );
@@ -259,8 +307,10 @@ export default function Roadmap() {
   const currentProgress = calculateMilestoneProgress(activeTab);
   const nextItem = currentMilestone.checklist.find(item => !checklistStates[item.id]);
 
-  // Get recommended item for current roadmap
-  const currentRecommendedItem = reportData.recommended_items[selectedRoadmapIndex];
+  // Get recommended item for current roadmap; partial reports may skip some roadmaps
+  const findRecommendedItem = (item: string) =>
+    reportData.recommended_items.find(recommended => recommended.item === item);
+  const currentRecommendedItem = findRecommendedItem(currentRoadmap.item);
 
   return (
     <div className="min-h-screen bg-gradient-to-b from-blue-50/30 to-background py-8 px-4 md:px-8">
@@ -270,48 +320,52 @@ export default function Roadmap() {
           <h1 className="text-5xl md:text-6xl font-bold">나의 창업 로드맵</h1>
         </div>
 
+        <IncompleteStagesNotice issues={reportData.incomplete_stages} />
+
         {/* 페르소나 프로필 */}
-        <Card className="bg-gradient-to-br from-green-50 to-teal-50 border-2 border-green-200">
-          <CardContent className="pt-6 pb-6">
-            <div className="space-y-4">
-              <div className="flex items-center gap-2">
-                <Users className="h-7 w-7 text-green-600" />
-                <h3 className="font-bold text-2xl md:text-3xl text-green-900">창업자 프로필</h3>
-              </div>
-              <p className="text-lg md:text-xl text-muted-foreground leading-relaxed">
-                {reportData.persona_profile.persona_summary}
-              </p>
-              <div className="grid md:grid-cols-2 gap-4">
-                <div>
-                  <p className="text-base md:text-lg font-semibold text-green-700 mb-2">강점</p>
-                  <div className="flex flex-wrap gap-2">
-                    {reportData.persona_profile.strengths.map((strength, idx) => (
-                      <Badge key={idx} className="bg-green-100 text-green-800 border-green-300 text-sm md:text-base py-1">
-                        {strength}
-                      </Badge>
-                    ))}
+        {reportData.persona_profile && (
+          <Card className="bg-gradient-to-br from-green-50 to-teal-50 border-2 border-green-200">
+            <CardContent className="pt-6 pb-6">
+              <div className="space-y-4">
+                <div className="flex items-center gap-2">
+                  <Users className="h-7 w-7 text-green-600" />
+                  <h3 className="font-bold text-2xl md:text-3xl text-green-900">창업자 프로필</h3>
+                </div>
+                <p className="text-lg md:text-xl text-muted-foreground leading-relaxed">
+                  {reportData.persona_profile.persona_summary}
+                </p>
+                <div className="grid md:grid-cols-2 gap-4">
+                  <div>
+                    <p className="text-base md:text-lg font-semibold text-green-700 mb-2">강점</p>
+                    <div className="flex flex-wrap gap-2">
+                      {reportData.persona_profile.strengths.map((strength, idx) => (
+                        <Badge key={idx} className="bg-green-100 text-green-800 border-green-300 text-sm md:text-base py-1">
+                          {strength}
+                        </Badge>
+                      ))}
+                    </div>
+                  </div>
+                  <div>
+                    <p className="text-base md:text-lg font-semibold text-orange-700 mb-2">개선 포인트</p>
+                    <div className="flex flex-wrap gap-2">
+                      {reportData.persona_profile.weaknesses.map((weakness, idx) => (
+                        <Badge key={idx} className="bg-orange-100 text-orange-800 border-orange-300 text-sm md:text-base py-1">
+                          {weakness}
+                        </Badge>
+                      ))}
+                    </div>
                   </div>
                 </div>
                 <div>
-                  <p className="text-base md:text-lg font-semibold text-orange-700 mb-2">개선 포인트</p>
-                  <div className="flex flex-wrap gap-2">
-                    {reportData.persona_profile.weaknesses.map((weakness, idx) => (
-                      <Badge key={idx} className="bg-orange-100 text-orange-800 border-orange-300 text-sm md:text-base py-1">
-                        {weakness}
-                      </Badge>
-                    ))}
-                  </div>
+                  <p className="text-base md:text-lg font-semibold text-green-700 mb-2">리스크 수용도</p>
+                  <Badge variant="outline" className="text-lg md:text-xl py-1">
+                    {reportData.persona_profile.risk_tolerance}
+                  </Badge>
                 </div>
               </div>
-              <div>
-                <p className="text-base md:text-lg font-semibold text-green-700 mb-2">리스크 수용도</p>
-                <Badge variant="outline" className="text-lg md:text-xl py-1">
-                  {reportData.persona_profile.risk_tolerance}
-                </Badge>
-              </div>
-            </div>
-          </CardContent>
-        </Card>
+            </CardContent>
+          </Card>
+        )}
 
         {/* 추천 아이템 선택 */}
         {reportData.roadmaps.length > 1 && (
@@ -333,10 +387,10 @@ export default function Roadmap() {
                     <div className="flex gap-2 flex-wrap">
                       <Badge variant="secondary" className="text-sm">
                         <Star className="h-3 w-3 mr-1" />
-                        시장 적합도 {reportData.recommended_items[idx]?.market_fit_score || 0}점
+                        시장 적합도 {findRecommendedItem(roadmap.item)?.market_fit_score || 0}점
                       </Badge>
                       <Badge variant="secondary" className="text-sm">
-                        페르소나 {reportData.recommended_items[idx]?.persona_fit_score || 0}점
+                        페르소나 {findRecommendedItem(roadmap.item)?.persona_fit_score || 0}점
                       </Badge>
                     </div>
                   </button>